@@ -19,6 +19,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 from sys import dont_write_bytecode
+import sys
 from flask import Flask, render_template, request, jsonify, send_from_directory, send_file, Response, redirect, url_for, session, flash
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
 # from flask_session import Session
@@ -27,26 +28,36 @@ import asyncio
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit, join_room, leave_room
 import os
+import posixpath
 import json
+import orjson
 from dotenv import load_dotenv
 import time
 from lxml import etree as ET
+from lxml import html as lxml_html
 import threading
+import queue
 import re
-import difflib
+from rapidfuzz import fuzz, process
 import shutil
 import subprocess
 import requests
 import httpx
 import multiprocessing
-from bs4 import BeautifulSoup
+import mmap
+import bisect
+import heapq
 from concurrent.futures import ThreadPoolExecutor
 import hashlib
 import secrets
 from datetime import datetime
 import uuid
 import subprocess as sp
-from collections import Counter
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 
 # FFmpeg cropping functions for auto-cropping black borders
 def cropdetect(video_file_path, start_time, duration):
@@ -409,6 +420,14 @@ def load_config():
 # Load configuration
 config = load_config()
 
+# Incremented whenever the in-memory config is modified, so that memoized config loaders rebuild
+_config_version = 0
+
+def bump_config_version():
+    """Invalidate the memoized config loaders (call after modifying the global config)"""
+    global _config_version
+    _config_version += 1
+
 # yt-dlp management functions
 def ensure_yt_dlp_binary():
     """Ensure we have the latest yt-dlp binary in tools/ directory"""
@@ -510,6 +529,26 @@ def load_user(user_id):
 CORS(app, supports_credentials=True)
 socketio = SocketIO(app, cors_allowed_origins="*", async_mode='threading')
 
+def fast_json_response(obj, status=200):
+    """Serialize a (potentially large) payload with orjson instead of jsonify"""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
+
+def fast_json_request():
+    """Parse the request body with orjson; returns None for an empty or invalid body"""
+    try:
+        return orjson.loads(request.get_data())
+    except orjson.JSONDecodeError:
+        return None
+
+def sse_frame(obj):
+    """Build a Server-Sent Events data frame for obj as bytes (orjson, no str round trip)"""
+    return b"data: " + orjson.dumps(obj) + b"\n\n"
+
+# SSE comment line (ignored by EventSource); writing it on an idle stream is what makes a
+# disconnected client surface as GeneratorExit instead of the stream lingering
+SSE_HEARTBEAT = b": heartbeat\n\n"
+SSE_HEARTBEAT_INTERVAL = 15
+
 @app.before_request
 def log_request_info():
     # Skip logging for frequent API calls to reduce console spam
@@ -521,9 +560,16 @@ import logging
 log = logging.getLogger('werkzeug')
 log.setLevel(logging.ERROR)
 
+# App log level from config.json (logging.level, INFO by default): debug messages are
+# skipped unless it is set to DEBUG
+if not app.debug:
+    app.logger.setLevel(getattr(logging, str(config.get('logging', {}).get('level', 'INFO')).upper(), logging.INFO))
+
 # Configuration
 ROMS_FOLDER = config['roms_root_directory']
 GAMELISTS_FOLDER = 'var/gamelists'
+# Downloaded LaunchBox images keyed by their LaunchBox filename, copied into media folders
+LAUNCHBOX_IMAGE_CACHE = 'var/cache/launchbox_images'
 
 app.config['ROMS_FOLDER'] = ROMS_FOLDER
 app.config['GAMELISTS_FOLDER'] = GAMELISTS_FOLDER
@@ -536,6 +582,7 @@ os.makedirs('var/db', exist_ok=True)
 os.makedirs('var/db/launchbox', exist_ok=True)
 os.makedirs('var/db/igdb', exist_ok=True)
 os.makedirs('var/sessions', exist_ok=True)
+os.makedirs(LAUNCHBOX_IMAGE_CACHE, exist_ok=True)
 
 def get_gamelist_path(system_name):
     """Get the gamelist path for a system, ensuring the directory exists"""
@@ -656,6 +703,46 @@ scraping_stats = {
     'matched_games': 0,
     'updated_games': 0
 }
+# Notified whenever scraping_progress or the counters change, or scraping stops, so SSE
+# streams wake up at once
+scraping_progress_cond = threading.Condition()
+
+# Immutable (total, processed, matched, updated) snapshot of scraping_stats. Writers publish
+# a new tuple with a single assignment, so readers always see a consistent set of counters
+scraping_stats_ref = (0, 0, 0, 0)
+
+def publish_scraping_stats(total_games, processed_games, matched_games, updated_games):
+    """Publish new scraping counters and wake up the progress streams"""
+    global scraping_stats, scraping_stats_ref
+    with scraping_progress_cond:
+        scraping_stats_ref = (total_games, processed_games, matched_games, updated_games)
+        scraping_stats = {
+            'total_games': total_games,
+            'processed_games': processed_games,
+            'matched_games': matched_games,
+            'updated_games': updated_games
+        }
+        scraping_progress_cond.notify_all()
+
+# SSE progress frame for each scraping_progress line, serialized once when the line is
+# appended and shared by every stream
+scraping_progress_frames = []
+
+def append_scraping_progress(message):
+    """Append a line to scraping_progress and wake up the progress streams"""
+    total, current, matched, updated = scraping_stats_ref
+    frame = sse_frame({
+        'type': 'progress',
+        'message': message,
+        'total': total,
+        'current': current,
+        'matched': matched,
+        'updated': updated
+    })
+    with scraping_progress_cond:
+        scraping_progress.append(message)
+        scraping_progress_frames.append(frame)
+        scraping_progress_cond.notify_all()
 
 # Global stop event for tasks
 task_stop_event = threading.Event()
@@ -812,10 +899,7 @@ def _run_scraping_task_worker_in_subprocess(task, result_q, cancel_map):
         metadata_games = []
         
         # Get the fields to load from mapping configuration
-        fields_to_load = set(['Name', 'Platform', 'DatabaseID'])  # Always load these core fields
-        if mapping_config:
-            # Add all LaunchBox fields from the mapping configuration
-            fields_to_load.update(mapping_config.keys())
+        fields_to_load = get_fields_to_load(mapping_config)
         print(f"🔧 DEBUG: Fields to load: {fields_to_load}")
         
         for db_id, game_elem in games_cache.items():
@@ -852,8 +936,7 @@ def _run_scraping_task_worker_in_subprocess(task, result_q, cancel_map):
             try:
                 result_q.put({'type': 'progress', 'task_id': task.get('task_id'), 'message': 'Saving partial gamelist.xml before stopping...'})
                 try:
-                    backup_path = f"{gamelist_path}.backup.{int(time.time())}"
-                    shutil.copy2(gamelist_path, backup_path)
+                    backup_gamelist(gamelist_path)
                 except Exception:
                     pass
                 write_gamelist_xml(original_games, gamelist_path)
@@ -958,8 +1041,7 @@ def _run_scraping_task_worker_in_subprocess(task, result_q, cancel_map):
         pass
 
     try:
-        backup_path = f"{gamelist_path}.backup.{int(time.time())}"
-        shutil.copy2(gamelist_path, backup_path)
+        backup_gamelist(gamelist_path)
     except Exception:
         pass
     try:
@@ -993,6 +1075,11 @@ def _scraping_result_listener(result_q):
                 total = res.get('total_steps')
                 pct = res.get('progress_percentage')
                 stats_update = res.get('stats') or {}
+                if stats_update:
+                    # Feed the worker's counters to the scraping progress streams
+                    publish_scraping_stats(
+                        stats_update.get('total_games', 0), stats_update.get('processed_games', 0),
+                        stats_update.get('matched_games', 0), stats_update.get('updated_games', 0))
                 if msg_task_id and msg_task_id in tasks:
                     try:
                         t = tasks[msg_task_id]
@@ -1025,6 +1112,10 @@ def _scraping_result_listener(result_q):
             if task_id and task_id in tasks:
                 if ok:
                     stats = data.get('stats', {})
+                    if stats:
+                        publish_scraping_stats(
+                            stats.get('total_games', 0), stats.get('processed_games', 0),
+                            stats.get('matched_games', 0), stats.get('updated_games', 0))
                     tasks[task_id].update_stats(stats)
                     tasks[task_id].complete(True)
                     gl = data.get('gamelist_path')
@@ -1128,8 +1219,7 @@ def process_single_game_worker(args):
             # If the original gamelist name (sans parentheses) exactly matches one of the
             # LaunchBox AlternateNames, treat as alternate-name match ONLY if not a DBID-based match
             try:
-                import re as _re
-                original_clean = _re.sub(r'\s*\([^)]*\)', '', original_game_name).strip()
+                original_clean = _SIMPLE_PARENS_RE.sub('', original_game_name).strip()
                 alt_list = best_match.get('AlternateNames', []) or []
                 exact_alt = next((a for a in alt_list if a and a.lower() == original_clean.lower()), None)
                 # Do not override when the source is launchboxid
@@ -1174,16 +1264,15 @@ def process_single_game_worker(args):
                     # Special handling for name field: use alternate name directly when matching via alternate name
                     if launchbox_field == 'Name' and gamelist_field == 'name':
                         # Extract parentheses text from both original game name and ROM filename
-                        import re
                         rom_path = game_data.get('path', '')
                         rom_filename = os.path.splitext(os.path.basename(rom_path))[0] if rom_path else ''
                         
                         # Find parentheses text at the end of the original game name
-                        original_parentheses_match = re.search(r'\s*\([^)]*\)\s*$', original_game_name)
+                        original_parentheses_match = _TRAILING_PARENS_RE.search(original_game_name)
                         original_parentheses_text = original_parentheses_match.group(0).strip() if original_parentheses_match else ''
                         
                         # Find parentheses text at the end of the ROM filename
-                        rom_parentheses_match = re.search(r'\s*\([^)]*\)\s*$', rom_filename)
+                        rom_parentheses_match = _TRAILING_PARENS_RE.search(rom_filename)
                         rom_parentheses_text = rom_parentheses_match.group(0).strip() if rom_parentheses_match else ''
                         
                         # Combine parentheses text, prioritizing original name, then adding ROM filename if not already present
@@ -1379,6 +1468,8 @@ def fix_over_escaped_xml_entities(text):
 tasks = {}  # task_id -> task_info
 task_queue = []
 current_task_id = None
+# Guards check-then-act sequences on tasks / current_task_id (stop, cleanup, acknowledge)
+_tasks_lock = threading.RLock()
 
 def load_existing_tasks_from_logs():
     """Load existing tasks from log files on server startup"""
@@ -1539,6 +1630,28 @@ TASK_STATUS_QUEUED = 'queued'
 LOGS_DIR = 'var/task_logs'
 os.makedirs(LOGS_DIR, exist_ok=True)
 
+# Task log watchers: task_id -> [Condition, version]. The version is bumped every time the
+# task log is appended to, so log streams can block until there is something new to send
+_task_log_watchers = {}
+_task_log_watchers_lock = threading.Lock()
+
+def get_task_log_watcher(task_id):
+    """Get (creating it if needed) the [Condition, version] watcher of a task log"""
+    watcher = _task_log_watchers.get(task_id)
+    if watcher is None:
+        with _task_log_watchers_lock:
+            watcher = _task_log_watchers.setdefault(task_id, [threading.Condition(), 0])
+    return watcher
+
+def notify_task_log_updated(task_id):
+    """Wake up the log streams of a task after its log file was appended to"""
+    watcher = _task_log_watchers.get(task_id)
+    if watcher is None:
+        return  # Nobody is streaming this log
+    with watcher[0]:
+        watcher[1] += 1
+        watcher[0].notify_all()
+
 class Task:
     def __init__(self, task_type, task_data=None, username=None):
         self.id = str(uuid.uuid4())
@@ -1590,6 +1703,7 @@ class Task:
         try:
             with open(self.log_file, 'a', encoding='utf-8') as f:
                 f.write(log_entry + '\n')
+            notify_task_log_updated(self.id)
                     
         except Exception as e:
             print(f"Error writing to log file {self.log_file}: {e}")
@@ -1609,6 +1723,7 @@ class Task:
         try:
             with open(self.log_file, 'a', encoding='utf-8') as f:
                 f.write(log_entry + '\n')
+            notify_task_log_updated(self.id)
                     
         except Exception as e:
             print(f"Error writing to log file {self.log_file}: {e}")
@@ -1628,6 +1743,7 @@ class Task:
         task_stop_event.clear()
         self.status = TASK_STATUS_RUNNING
         self.start_time = time.time()
+        _ensure_task_sweeper_started()
         # Prune old tasks (keep last 30)
         try:
             cleanup_old_tasks(max_tasks=30)
@@ -1648,8 +1764,10 @@ class Task:
                 f.write(f"\nTask stopped: {datetime.now().isoformat()}\n")
                 f.write(f"Status: {self.status}\n")
                 f.write(f"Duration: {self.end_time - self.start_time:.2f} seconds\n")
+            notify_task_log_updated(self.id)
         except Exception as e:
             print(f"Error writing final status to log file {self.log_file}: {e}")
+        record_task_summary(self)
 
     
     def complete(self, success=True, error_message=None):
@@ -1679,9 +1797,11 @@ class Task:
                 f.write(f"System: {self.data.get('system_name') if self.data else 'N/A'}\n")
                 f.write(f"User: {self.username}\n")
                 f.write(f"Stats: {json.dumps(self.stats)}\n")
+            notify_task_log_updated(self.id)
                 
         except Exception as e:
             print(f"Error writing final status to log file {self.log_file}: {e}")
+        record_task_summary(self)
         
         # Mark that grid refresh is needed for this task type
         if self.type in ['scraping', 'screenscraper_scraping', 'media_scan', 'image_download', 'youtube_download', 'rom_scan', '2d_box_generation']:
@@ -1755,6 +1875,11 @@ def cleanup_old_tasks(max_tasks=100):
     if len(tasks) <= max_tasks:
         return
     
+    with _tasks_lock:
+        _cleanup_old_tasks_locked(max_tasks)
+
+def _cleanup_old_tasks_locked(max_tasks):
+    """Remove the oldest finished tasks beyond max_tasks (caller holds _tasks_lock)"""
     # Sort tasks by start time (oldest first)
     sorted_tasks = sorted(tasks.items(), key=lambda x: x[1].start_time or 0)
     
@@ -1765,11 +1890,13 @@ def cleanup_old_tasks(max_tasks=100):
             try:
                 if os.path.exists(task.log_file):
                     os.remove(task.log_file)
+                _unlink_if_exists(get_task_summary_path(task.log_file))
             except Exception as e:
                 print(f"Error removing log file {task.log_file}: {e}")
             
             # Remove from tasks dict
             del tasks[task_id]
+            _task_log_watchers.pop(task_id, None)
 
 def is_task_running():
     """Check if any task is currently running"""
@@ -1825,6 +1952,30 @@ def update_task_progress(message, progress_percentage=None, current_step=None, t
             # Add console logging for debugging
             print(f"DEBUG: {message}")
 
+# Progress messages from hot download paths, applied in order by one long-lived logger thread
+_progress_log_queue = queue.Queue()
+_progress_log_thread = None
+_progress_log_lock = threading.Lock()
+
+def _progress_log_consumer():
+    """Apply queued progress messages until a None sentinel is received"""
+    for message in iter(_progress_log_queue.get, None):
+        try:
+            update_task_progress(message)
+        except Exception as e:
+            print(f"Error applying queued task progress: {e}")
+
+def queue_task_progress(message):
+    """Queue a task progress update without blocking the caller"""
+    global _progress_log_thread
+    # Started lazily (and restarted after a fork) so every process gets its own consumer
+    if _progress_log_thread is None or not _progress_log_thread.is_alive():
+        with _progress_log_lock:
+            if _progress_log_thread is None or not _progress_log_thread.is_alive():
+                _progress_log_thread = threading.Thread(target=_progress_log_consumer, daemon=True)
+                _progress_log_thread.start()
+    _progress_log_queue.put(message)
+
 def update_task_stats():
     """Update the current task stats to keep them synchronized"""
     global current_task_id, scraping_stats
@@ -1842,21 +1993,44 @@ def cleanup_stuck_tasks():
     current_time = time.time()
     stuck_tasks = []
     
-    for task_id, task in list(tasks.items()):
-        # If task has been idle for more than 5 minutes, mark it as completed
-        if (task.status == TASK_STATUS_IDLE and 
-            task.start_time and 
-            current_time - task.start_time > 300):  # 5 minutes
-            
-            print(f"Cleaning up stuck idle task: {task_id} (type: {task.type})")
-            task.complete(success=False, error_message="Task stuck in idle state - cleaned up")
-            stuck_tasks.append(task_id)
+    with _tasks_lock:
+        for task_id, task in list(tasks.items()):
+            # If task has been idle for more than 5 minutes, mark it as completed
+            if (task.status == TASK_STATUS_IDLE and 
+                task.start_time and 
+                current_time - task.start_time > 300):  # 5 minutes
+                
+                print(f"Cleaning up stuck idle task: {task_id} (type: {task.type})")
+                task.complete(success=False, error_message="Task stuck in idle state - cleaned up")
+                stuck_tasks.append(task_id)
     
     if stuck_tasks:
         print(f"Cleaned up {len(stuck_tasks)} stuck tasks")
     
     return stuck_tasks
 
+# Stuck tasks are swept by a background thread instead of on every stop / queue step
+_TASK_SWEEP_INTERVAL = 60
+_task_sweeper_thread = None
+
+def _task_sweeper():
+    """Periodically clean up stuck tasks"""
+    while True:
+        time.sleep(_TASK_SWEEP_INTERVAL)
+        try:
+            cleanup_stuck_tasks()
+        except Exception as e:
+            print(f"Task sweeper error: {e}")
+
+def _ensure_task_sweeper_started():
+    """Start the stuck task sweeper thread (lazily, and again after a fork)"""
+    global _task_sweeper_thread
+    if _task_sweeper_thread is None or not _task_sweeper_thread.is_alive():
+        with _tasks_lock:
+            if _task_sweeper_thread is None or not _task_sweeper_thread.is_alive():
+                _task_sweeper_thread = threading.Thread(target=_task_sweeper, name='task-sweeper', daemon=True)
+                _task_sweeper_thread.start()
+
 def add_task_to_queue(task_type, task_data, username=None):
     """Add a task to the queue for later processing"""
     global task_queue
@@ -1888,9 +2062,7 @@ def process_next_queued_task():
     """Process the next task in the queue"""
     global current_task_id, task_queue
     
-    # Clean up any stuck tasks first
-    cleanup_stuck_tasks()
-    
+    # (Stuck tasks are cleaned up by the background task sweeper)
     if not task_queue:
         return
     
@@ -2325,50 +2497,25 @@ def run_image_download_task(system_name, data):
                         if not f.done():
                             f.cancel()
                     
-                    # Stop the download manager to cancel active downloads
-                    try:
-                        from download_manager import get_download_manager
-                        download_manager = get_download_manager()
-                        if download_manager:
-                            task.update_progress(f"🛑 Stopping download manager to cancel active downloads")
-                            download_manager.stop()
-                    except Exception as e:
-                        task.update_progress(f"⚠️  Warning: Could not stop download manager: {e}")
-                    
+                    # Active downloads see the stop request and cancel themselves
                     break
                 
                 result = future.result()
                 if result:
                     results.append(result)
         
-        # CRITICAL: Wait for ALL downloads to complete before scanning media files
-        # The download manager is shared across all parallel tasks, so we need to ensure
-        # all downloads are truly finished before scanning the file system
-        task.update_progress(f"⏳ Waiting for all downloads to complete...", progress_percentage=85, current_step=len(games_to_process))
+        # Every game's downloads are awaited inside its own call, so all files are on disk
+        # once the executor is done and the media scan can run right away
+        # After all downloads complete, scan media files and update gamelist.xml
+        print(f"DEBUG: Download counters - downloaded: {counters['downloaded']}, failed: {counters['failed']}, early_skipped: {counters['early_skipped']}")
         
+        # Keep the shared image cache bounded (images of deleted media age out of it)
         try:
-            from download_manager import get_download_manager
-            download_manager = get_download_manager()
-            if download_manager and download_manager.is_running:
-                # Wait for all pending downloads to complete
-                task.update_progress(f"⏳ Ensuring all downloads are finished...", progress_percentage=87, current_step=len(games_to_process))
-                
-                # Give a small delay to ensure all async operations complete
-                time.sleep(2)
-                
-                # Check if download manager is still processing
-                if hasattr(download_manager, 'active_tasks') and download_manager.active_tasks:
-                    task.update_progress(f"⏳ Waiting for {len(download_manager.active_tasks)} active downloads...", progress_percentage=88, current_step=len(games_to_process))
-                    # Wait a bit more for active tasks to complete
-                    time.sleep(3)
-                
-                print(f"DEBUG: Download manager status - running: {download_manager.is_running}, active_tasks: {len(getattr(download_manager, 'active_tasks', []))}")
+            removed = prune_launchbox_image_cache()
+            if removed:
+                print(f"DEBUG: Evicted {removed} images from the LaunchBox image cache")
         except Exception as e:
-            print(f"DEBUG: Error checking download manager status: {e}")
-            task.update_progress(f"⚠️  Warning: Could not verify download completion: {e}")
-        
-        # After all downloads complete, scan media files and update gamelist.xml
-        print(f"DEBUG: Download counters - downloaded: {counters['downloaded']}, failed: {counters['failed']}, early_skipped: {counters['early_skipped']}")
+            print(f"Error pruning LaunchBox image cache: {e}")
         
         # Always run media scan to ensure gamelist is up to date with actual files
         try:
@@ -2495,15 +2642,39 @@ current_system_platform = None
 # Global metadata cache for faster lookups (consolidated per DatabaseID)
 # global_metadata_cache[DatabaseID] = {
 #   'game': <Game element>,
-#   'images': [<GameImage elements>],
+#   'images': [(type, filename, region) tuples from the GameImage elements],
 #   'alternate_names': [<GameAlternateName elements>]
 # }
 global_metadata_cache = {}
 global_metadata_cache_loaded = False
+# Bumped every time global_metadata_cache is (re)built, so derived caches can tell it changed
+global_metadata_cache_version = 0
+# Platform name -> DatabaseIDs of its games, built alongside global_metadata_cache
+global_metadata_platform_index = {}
+# Held while Metadata.xml is parsed, so concurrent callers wait for one load instead of
+# each starting their own
+_metadata_cache_load_lock = threading.Lock()
 
 def load_metadata_cache():
     """Load and cache all metadata from Metadata.xml for faster lookups"""
-    global global_metadata_cache, global_metadata_cache_loaded
+    if global_metadata_cache_loaded:
+        return _load_metadata_cache()
+    with _metadata_cache_load_lock:
+        # If another thread loaded the cache while we waited, this only builds the view
+        return _load_metadata_cache()
+
+def reset_metadata_cache():
+    """Drop the loaded metadata so the next load_metadata_cache() parses Metadata.xml again"""
+    global global_metadata_cache, global_metadata_cache_loaded, global_metadata_platform_index
+    with _metadata_cache_load_lock:
+        global_metadata_cache_loaded = False
+        global_metadata_platform_index = {}
+        global_metadata_cache = {}
+        _clear_platform_metadata_caches()
+
+def _load_metadata_cache():
+    """load_metadata_cache() body, called with _metadata_cache_load_lock held unless already loaded"""
+    global global_metadata_cache, global_metadata_cache_loaded, global_metadata_cache_version, global_metadata_platform_index
     
     if global_metadata_cache_loaded:
         # Return a derived view for any legacy callers
@@ -2524,7 +2695,10 @@ def load_metadata_cache():
         if not os.path.exists(metadata_path):
             print(f"DEBUG: Metadata.xml not found at {metadata_path}")
             global_metadata_cache = {}
+            global_metadata_platform_index = {}
             global_metadata_cache_loaded = True
+            global_metadata_cache_version += 1
+            _clear_platform_metadata_caches()
             return {
                 'gameimage_cache': {},
                 'games_cache': {},
@@ -2540,12 +2714,22 @@ def load_metadata_cache():
         all_game_images = root.findall('.//GameImage')
         print(f"DEBUG: Found {len(all_game_images)} GameImage entries in Metadata.xml")
         
+        intern = sys.intern
         for game_image in all_game_images:
-            db_id = game_image.find('DatabaseID')
-            if db_id is not None and db_id.text:
-                db_id_text = db_id.text
+            # Read the children once and keep a plain (type, filename, region) tuple, so image
+            # lookups never walk the XML again; types and regions repeat, so they are interned
+            image_fields = {child.tag: child.text for child in game_image}
+            db_id_text = image_fields.get('DatabaseID')
+            if db_id_text:
+                image_type = image_fields.get('Type')
+                filename = image_fields.get('FileName')
+                region = image_fields.get('Region')
                 entry = consolidated.setdefault(db_id_text, {'game': None, 'images': [], 'alternate_names': []})
-                entry['images'].append(game_image)
+                entry['images'].append((
+                    intern(image_type.strip()) if image_type else '',
+                    filename.strip() if filename else '',
+                    intern(region.strip()) if region else 'Unknown'
+                ))
         
         all_games = root.findall('.//Game')
         print(f"DEBUG: Found {len(all_games)} Game entries in Metadata.xml")
@@ -2557,6 +2741,15 @@ def load_metadata_cache():
                 entry = consolidated.setdefault(db_id_text, {'game': None, 'images': [], 'alternate_names': []})
                 entry['game'] = game
         
+        # Index games by platform once, so per-platform lookups skip the full scan
+        platform_index = {}
+        for db_id_text, entry in consolidated.items():
+            game = entry['game']
+            if game is not None:
+                platform_elem = game.find('Platform')
+                if platform_elem is not None and platform_elem.text:
+                    platform_index.setdefault(platform_elem.text.strip(), []).append(db_id_text)
+        
         all_alternate_names = root.findall('.//GameAlternateName')
         print(f"DEBUG: Found {len(all_alternate_names)} GameAlternateName entries in Metadata.xml")
         
@@ -2569,17 +2762,14 @@ def load_metadata_cache():
         
         # Update global consolidated cache
         global_metadata_cache = consolidated
+        global_metadata_platform_index = platform_index
         global_metadata_cache_loaded = True
+        global_metadata_cache_version += 1
+        _clear_platform_metadata_caches()
         
-        # Generate LaunchBox platforms cache from Game elements
+        # Generate LaunchBox platforms cache from the platform index
         global _launchbox_platforms_cache
-        platforms = set()
-        for game in all_games:
-            platform_elem = game.find('Platform')
-            if platform_elem is not None and platform_elem.text:
-                platforms.add(platform_elem.text.strip())
-        
-        _launchbox_platforms_cache = sorted(list(platforms))
+        _launchbox_platforms_cache = sorted(platform_index)
         print(f"DEBUG: Cached {len(_launchbox_platforms_cache)} unique LaunchBox platforms")
         
         load_time = time.time() - start_time
@@ -2603,7 +2793,10 @@ def load_metadata_cache():
         import traceback
         traceback.print_exc()
         global_metadata_cache = {}
+        global_metadata_platform_index = {}
         global_metadata_cache_loaded = True
+        global_metadata_cache_version += 1
+        _clear_platform_metadata_caches()
         return {
             'gameimage_cache': {},
             'games_cache': {},
@@ -2629,16 +2822,86 @@ def get_cached_games_by_platform(platform):
     if not global_metadata_cache_loaded:
         load_metadata_cache()
     
-    platform_games = []
-    for db_id, entry in global_metadata_cache.items():
-        game = entry.get('game')
-        if game is None:
-            continue
-        game_platform = game.find('Platform')
-        if game_platform is not None and game_platform.text == platform:
-            platform_games.append(game)
-    
-    return platform_games
+    # The cache and its index are swapped one after the other on reload, so skip IDs the
+    # cache does not have (yet)
+    cache = global_metadata_cache
+    return [cache[db_id]['game'] for db_id in global_metadata_platform_index.get(platform, ()) if db_id in cache]
+
+@lru_cache(maxsize=32)
+def _parse_platform_metadata_games(platform, cache_version):
+    """Parse a platform's Game elements into (DatabaseID, fields, alternate names) records
+
+    Every child field is kept, so one parse serves any mapping configuration. cache_version
+    is global_metadata_cache_version and only keys the cache.
+    """
+    records = []
+    cache = global_metadata_cache
+    for db_id in global_metadata_platform_index.get(platform, ()):
+        entry = cache.get(db_id)
+        if entry is None:
+            continue  # Cache reset or reloaded meanwhile
+        fields = {}
+        for child in entry['game']:
+            tag = child.tag
+            # Comments and processing instructions have no string tag
+            if isinstance(tag, str):
+                fields[sys.intern(tag)] = child.text.strip() if child.text else ''
+        
+        alt_names = []
+        for alt_elem in entry.get('alternate_names', []):
+            alt_name = alt_elem.find('AlternateName')
+            if alt_name is not None and alt_name.text:
+                alt_names.append(alt_name.text.strip())
+        
+        records.append((db_id, fields, alt_names))
+    return records
+
+@lru_cache(maxsize=32)
+def _build_platform_metadata_games(platform, fields_to_load, cache_version):
+    """Filter the global metadata cache down to one platform and convert its games to dicts
+
+    cache_version is global_metadata_cache_version; it only keys the cache, so a reloaded
+    Metadata.xml gets fresh entries. Returns (metadata_games, platform_cache).
+    """
+    platform_games = {}
+    platform_alternate_names = {}
+    
+    cache = global_metadata_cache
+    for db_id in global_metadata_platform_index.get(platform, ()):
+        entry = cache.get(db_id)
+        if entry is None:
+            continue  # Cache reset or reloaded meanwhile
+        platform_games[db_id] = entry['game']
+        platform_alternate_names[db_id] = entry.get('alternate_names', [])
+    
+    # Convert the pre-parsed records to metadata_games format for compatibility
+    metadata_games = []
+    for db_id, fields, alt_names in _parse_platform_metadata_games(platform, cache_version):
+        game_data = {tag: text for tag, text in fields.items() if tag in fields_to_load}
+        game_data['AlternateNames'] = list(alt_names)
+        metadata_games.append(game_data)
+    
+    # Create platform_cache object for compatibility with find_best_match
+    platform_cache = {
+        'games_cache': platform_games,
+        'alternate_names_cache': platform_alternate_names
+    }
+    return metadata_games, platform_cache
+
+def _clear_platform_metadata_caches():
+    """Drop the per-platform records of the previous Metadata.xml (they hold its Game elements)"""
+    _parse_platform_metadata_games.cache_clear()
+    _build_platform_metadata_games.cache_clear()
+
+def get_platform_metadata_games(platform, mapping_config=None):
+    """Get (metadata_games, platform_cache) for a platform from the global metadata cache
+
+    The result is cached until the global cache is reloaded, and the same metadata_games
+    list is returned each time so per-list caches such as get_match_columns stay warm.
+    """
+    if not global_metadata_cache_loaded:
+        load_metadata_cache()
+    return _build_platform_metadata_games(platform, get_fields_to_load(mapping_config), global_metadata_cache_version)
 
 def load_platform_metadata_cache(platform, use_global_cache=False, mapping_config=None):
     """Load only games and alternate names cache for a specific platform (no images)"""
@@ -2651,19 +2914,16 @@ def load_platform_metadata_cache(platform, use_global_cache=False, mapping_confi
             print(f"DEBUG: Using global cache to build platform-specific cache for {platform}...")
             platform_cache = {}
             
-            # Filter global cache for this platform
-            for db_id, entry in global_metadata_cache.items():
-                game_elem = entry.get('game')
-                if game_elem is None:
-                    continue
-                
-                # Check if this game is for the target platform
-                game_platform = game_elem.find('Platform')
-                if game_platform is not None and game_platform.text == platform:
-                    platform_cache[db_id] = {
-                        'game': game_elem,
-                        'alternate_names': entry.get('alternate_names', [])
-                    }
+            # Filter global cache for this platform using the platform index
+            cache = global_metadata_cache
+            for db_id in global_metadata_platform_index.get(platform, ()):
+                entry = cache.get(db_id)
+                if entry is None:
+                    continue  # Cache reset or reloaded meanwhile
+                platform_cache[db_id] = {
+                    'game': entry['game'],
+                    'alternate_names': entry.get('alternate_names', [])
+                }
             
             platform_games_count = len(platform_cache)
             platform_alt_names_count = sum(len(entry.get('alternate_names', [])) for entry in platform_cache.values())
@@ -2773,100 +3033,148 @@ def get_cache_statistics():
         'total_database_ids': len(global_metadata_cache)
     }
 
+# Gamelist tags whose values are stored as integers (all other tags are kept as text)
+_GAMELIST_INT_TAGS = frozenset(sys.intern(t) for t in (
+    'id', 'launchboxid', 'igdbid', 'screenscraperid', 'steamid', 'steamgridid'
+))
+
+def read_xml_root(file_path):
+    """Parse an XML file and return its root element (libxml2 reads the file itself, no copy in Python)"""
+    return ET.parse(file_path).getroot()
+
+# Parsed gamelists: file path -> (st_mtime_ns, st_size, games, games by path), least recently used first
+_gamelist_parse_cache = OrderedDict()
+_gamelist_parse_cache_lock = threading.Lock()
+_GAMELIST_PARSE_CACHE_SIZE = 64
+
+def invalidate_gamelist_cache(file_path):
+    """Forget the parsed copy of a gamelist (call after writing it)"""
+    with _gamelist_parse_cache_lock:
+        _gamelist_parse_cache.pop(file_path, None)
+
+@contextmanager
+def replace_gamelist_file(file_path):
+    """Open a temporary file next to a gamelist for writing; it replaces the gamelist on success
+
+    The new content is swapped in with os.replace (keeping the gamelist's permissions), so a
+    failed or interrupted write never leaves a truncated gamelist behind.
+    """
+    tmp_path = f"{file_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            yield f
+        try:
+            shutil.copymode(file_path, tmp_path)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        _unlink_if_exists(tmp_path)
+        raise
+    invalidate_gamelist_cache(file_path)
+
 def parse_gamelist_xml(file_path):
     """Parse gamelist.xml file and return list of games"""
     try:
-        tree = ET.parse(file_path)
-        root = tree.getroot()
-        games = []
-        
-        for game in root.findall('game'):
-            game_data = {}
-            
-            # Parse each field
-            for field in game:
-                tag = field.tag
-                raw_text = field.text.strip() if field.text else ''
-                # Fix over-escaped entities and decode to get original text for storage
-                text = fix_over_escaped_xml_entities(raw_text) if raw_text else ''
-                
-                if tag == 'id':
-                    game_data['id'] = int(text) if text.isdigit() else None
-                elif tag == 'path':
-                    game_data['path'] = text
-                elif tag == 'name':
-                    game_data['name'] = text
-                elif tag == 'desc':
-                    game_data['desc'] = text
-                elif tag == 'genre':
-                    game_data['genre'] = text
-                elif tag == 'developer':
-                    game_data['developer'] = text
-                elif tag == 'publisher':
-                    game_data['publisher'] = text
-                elif tag == 'rating':
-                    game_data['rating'] = text
-                elif tag == 'players':
-                    game_data['players'] = text
-                elif tag == 'image':
-                    game_data['image'] = text
-                elif tag == 'video':
-                    game_data['video'] = text
-                elif tag == 'marquee':
-                    game_data['marquee'] = text
-                elif tag == 'wheel':
-                    game_data['wheel'] = text
-                elif tag == 'boxart':
-                    game_data['boxart'] = text
-                elif tag == 'thumbnail':
-                    game_data['thumbnail'] = text
-                elif tag == 'screenshot':
-                    game_data['screenshot'] = text
-                elif tag == 'cartridge':
-                    game_data['cartridge'] = text
-                elif tag == 'fanart':
-                    game_data['fanart'] = text
-                elif tag == 'titleshot':
-                    game_data['titleshot'] = text
-                elif tag == 'manual':
-                    game_data['manual'] = text
-                elif tag == 'boxback':
-                    game_data['boxback'] = text
-                elif tag == 'extra1':
-                    game_data['extra1'] = text
-                elif tag == 'launchboxid':
-                    game_data['launchboxid'] = int(text) if text.isdigit() else None
-                elif tag == 'igdbid':
-                    game_data['igdbid'] = int(text) if text.isdigit() else None
-                elif tag == 'screenscraperid':
-                    game_data['screenscraperid'] = int(text) if text.isdigit() else None
-                elif tag == 'steamid':
-                    game_data['steamid'] = int(text) if text.isdigit() else None
-                elif tag == 'steamgridid':
-                    game_data['steamgridid'] = int(text) if text.isdigit() else None
-                elif tag == 'youtubeurl':
-                    game_data['youtubeurl'] = text
-                else:
-                    # Handle unknown tags by storing them as text
-                    game_data[tag] = text
-            
-            # Ensure required fields exist
-            if 'id' not in game_data:
-                game_data['id'] = len(games) + 1
-            if 'name' not in game_data:
-                game_data['name'] = 'Unknown Game'
-            if 'path' not in game_data:
-                game_data['path'] = './unknown.zip'
-            if 'desc' not in game_data:
-                game_data['desc'] = ''
-            
-            games.append(game_data)
-        
-        return games
+        # Re-parse only when the file changed since the last parse
+        st = os.stat(file_path)
+        with _gamelist_parse_cache_lock:
+            cached = _gamelist_parse_cache.get(file_path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                _gamelist_parse_cache.move_to_end(file_path)  # Most recently used
+            else:
+                cached = None
+        if cached is not None:
+            games = cached[2]
+        else:
+            # Parsed outside the lock, so other gamelists stay available meanwhile
+            games = _parse_gamelist_games(file_path)
+            # Index once so single-game lookups don't scan the list (first game with a path wins)
+            games_by_path = {}
+            for game in games:
+                games_by_path.setdefault(game['path'], game)
+            # Insert as most recently used and drop the least recently used gamelists
+            with _gamelist_parse_cache_lock:
+                _gamelist_parse_cache[file_path] = (st.st_mtime_ns, st.st_size, games, games_by_path)
+                _gamelist_parse_cache.move_to_end(file_path)
+                while len(_gamelist_parse_cache) > _GAMELIST_PARSE_CACHE_SIZE:
+                    _gamelist_parse_cache.popitem(last=False)
+        
+        # Callers modify the game dicts, so hand out copies and keep the cached ones pristine
+        # (values are str/int/None, so a shallow copy per game is enough)
+        return [game.copy() for game in games]
     except Exception as e:
         print(f"Error parsing gamelist.xml: {e}")
         return []
 
+def _parse_gamelist_game(game, index):
+    """Convert a <game> element (the index-th, from 0) into a game dict"""
+    game_data = {}
+    
+    # Parse each field
+    for field in game:
+        if not isinstance(field.tag, str):
+            continue  # Skip comments and processing instructions
+        tag = sys.intern(field.tag)
+        raw_text = field.text.strip() if field.text else ''
+        # Fix over-escaped entities and decode to get original text for storage
+        text = fix_over_escaped_xml_entities(raw_text) if raw_text else ''
+        
+        if tag in _GAMELIST_INT_TAGS:
+            game_data[tag] = int(text) if text.isdigit() else None
+        else:
+            # Known text fields and unknown tags are both stored as text
+            game_data[tag] = text
+    
+    # Ensure required fields exist
+    if 'id' not in game_data:
+        game_data['id'] = index + 1
+    if 'name' not in game_data:
+        game_data['name'] = 'Unknown Game'
+    if 'path' not in game_data:
+        game_data['path'] = './unknown.zip'
+    if 'desc' not in game_data:
+        game_data['desc'] = ''
+    
+    return game_data
+
+def _parse_gamelist_games(file_path):
+    """Parse gamelist.xml file into a list of game dicts (raises on error)"""
+    root = read_xml_root(file_path)
+    return [_parse_gamelist_game(game, index) for index, game in enumerate(root.iterfind('game'))]
+
+def find_gamelist_game(file_path, rom_path):
+    """Stream gamelist.xml looking for the game with the given path
+
+    Returns (game dict or None, number of games). Elements are freed as soon as they
+    have been checked, so memory use does not grow with the gamelist. A parse cached by
+    parse_gamelist_xml is used instead when the file has not changed since.
+    """
+    st = os.stat(file_path)
+    with _gamelist_parse_cache_lock:
+        cached = _gamelist_parse_cache.get(file_path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        game = cached[3].get(rom_path)
+        return (game.copy() if game is not None else None), len(cached[2])
+    
+    found = None
+    games_count = 0
+    for _, game in ET.iterparse(file_path, events=('end',), tag='game'):
+        parent = game.getparent()
+        # Only direct children of the root are games (same as root.findall('game'))
+        if parent is None or parent.getparent() is not None:
+            continue
+        if found is None:
+            path_text = (game.findtext('path') or '').strip()
+            if path_text == rom_path or fix_over_escaped_xml_entities(path_text) == rom_path:
+                found = _parse_gamelist_game(game, games_count)
+        games_count += 1
+        # Free this element and the already processed ones before it
+        game.clear()
+        while game.getprevious() is not None:
+            del game.getparent()[0]
+    return found, games_count
+
 @app.route('/test-session')
 def test_session():
     """Test route to check session persistence"""
@@ -2919,17 +3227,17 @@ def list_rom_systems():
     except Exception as e:
         print(f"Error listing ROM systems: {e}")
     
-    return jsonify(systems)
+    return fast_json_response(systems)
 
 @app.route('/api/config', methods=['GET', 'PUT'])
 @login_required
 def get_config():
     """Get or update application configuration"""
     if request.method == 'GET':
-        return jsonify(config)
+        return fast_json_response(config)
     elif request.method == 'PUT':
         try:
-            new_config = request.get_json()
+            new_config = fast_json_request()
             if not new_config:
                 return jsonify({'error': 'No configuration data provided'}), 400
             
@@ -2944,12 +3252,13 @@ def get_config():
             # Save updated config to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             # Update global variables
             global ROMS_FOLDER
             ROMS_FOLDER = config['roms_root_directory']
             
-            return jsonify({'success': True, 'message': 'Configuration updated', 'config': config})
+            return fast_json_response({'success': True, 'message': 'Configuration updated', 'config': config})
         except Exception as e:
             return jsonify({'error': f'Failed to update configuration: {str(e)}'}), 500
 
@@ -3214,6 +3523,7 @@ def manage_systems():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'System added successfully'})
         
@@ -3244,6 +3554,7 @@ def manage_systems():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'System updated successfully'})
         
@@ -3263,6 +3574,7 @@ def manage_systems():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'System deleted successfully'})
     
@@ -3311,6 +3623,7 @@ def manage_media_fields():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'Media field added successfully'})
         
@@ -3338,6 +3651,7 @@ def manage_media_fields():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'Media field updated successfully'})
         
@@ -3358,6 +3672,7 @@ def manage_media_fields():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'Media field deleted successfully'})
     
@@ -3403,6 +3718,7 @@ def manage_launchbox_mappings():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'Mapping updated successfully'})
         
@@ -3438,6 +3754,7 @@ def manage_launchbox_mappings():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'Mapping reset to default'})
     
@@ -3483,6 +3800,7 @@ def manage_igdb_mappings():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'IGDB mapping updated successfully'})
         
@@ -3513,6 +3831,7 @@ def manage_igdb_mappings():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'IGDB mapping reset to default'})
     
@@ -3558,6 +3877,7 @@ def manage_screenscraper_mappings():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'ScreenScraper mapping updated successfully'})
         
@@ -3593,6 +3913,7 @@ def manage_screenscraper_mappings():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'ScreenScraper mapping reset to default'})
     
@@ -3638,6 +3959,7 @@ def manage_steamgriddb_mappings():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'SteamGridDB mapping updated successfully'})
         
@@ -3668,6 +3990,7 @@ def manage_steamgriddb_mappings():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'SteamGridDB mapping reset to default'})
     
@@ -3751,6 +4074,7 @@ def manage_steam_mappings():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'Steam mapping updated successfully'})
         
@@ -3781,6 +4105,7 @@ def manage_steam_mappings():
             # Save to file
             with open('var/config/config.json', 'w') as f:
                 json.dump(config, f, indent=4)
+            bump_config_version()
             
             return jsonify({'success': True, 'message': 'Steam mapping reset to default'})
     
@@ -3846,10 +4171,12 @@ def rom_system_gamelist(system_name):
             
 
             
-            # Sort games by name for consistent ordering
-            games.sort(key=lambda x: x.get('name', '').lower())
+            # Sort games by name for consistent ordering; keys are built in one pass
+            # ('name' is always set by parse_gamelist_xml) and extracted in C
+            name_keys = [game['name'].lower() for game in games]
+            games = [game for _, game in sorted(zip(name_keys, games), key=itemgetter(0))]
             
-            return jsonify({
+            return fast_json_response({
                 'success': True,
                 'system': system_name,
                 'games': games,
@@ -3857,12 +4184,13 @@ def rom_system_gamelist(system_name):
             })
         elif request.method == 'PUT':
             # Update the gamelist.xml file
-            data = request.get_json()
+            data = fast_json_request()
             if not data or 'games' not in data:
                 return jsonify({'error': 'Invalid request data'}), 400
             
-            print(f"🔔 PUT request received for system: {system_name}")
-            print(f"🔔 Request data: {data}")
+            debug_enabled = app.logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                app.logger.debug(f'PUT request received for system: {system_name}')
             
             games = data['games']
             delete_rom_paths = data.get('delete_rom_paths', [])
@@ -3870,14 +4198,30 @@ def rom_system_gamelist(system_name):
             # Log the deletion operation
             if delete_rom_paths:
                 app.logger.info(f'Deleting {len(delete_rom_paths)} games from {system_name} gamelist using ROM file paths')
-                app.logger.info(f'Received delete_rom_paths: {delete_rom_paths}')
+                if debug_enabled:
+                    app.logger.debug(f'Received delete_rom_paths: {delete_rom_paths}')
                 
                 # Delete associated files for each deleted game
                 deleted_files = []
                 failed_deletions = []
                 
+                # Resolve which media subdirectories exist once for the whole batch
+                media_dir = os.path.join(system_path, 'media')
+                media_fields = ['boxart', 'screenshot', 'marquee', 'wheel', 'video', 'thumbnail', 'cartridge', 'fanart', 'title', 'manual', 'boxback', 'box2d']
+                existing_media_fields = [f for f in media_fields if os.path.isdir(os.path.join(media_dir, f))]
+                
+                # Index each media subdirectory once as a sorted name list so every ROM
+                # can find its files by prefix with a binary search
+                media_index = {}
+                for field in existing_media_fields:
+                    with os.scandir(os.path.join(media_dir, field)) as entries:
+                        field_entries = sorted((entry.name, entry.path) for entry in entries)
+                    media_index[field] = ([name for name, _ in field_entries], [path for _, path in field_entries])
+                removed_media_paths = set()
+                
                 for rom_path in delete_rom_paths:
-                    app.logger.info(f'Processing ROM path: "{rom_path}"')
+                    if debug_enabled:
+                        app.logger.debug(f'Processing ROM path: "{rom_path}"')
                     try:
                         # Convert relative path to absolute path relative to ROMS_FOLDER
                         if not os.path.isabs(rom_path):
@@ -3903,38 +4247,35 @@ def rom_system_gamelist(system_name):
                             continue
                         
                         # Delete ROM file
-                        app.logger.info(f'Checking if ROM file exists: {rom_abs_path}')
                         if os.path.exists(rom_abs_path):
                             os.remove(rom_abs_path)
                             deleted_files.append(f"ROM: {rom_path}")
-                            app.logger.info(f'Deleted ROM file: {rom_abs_path}')
+                            if debug_enabled:
+                                app.logger.debug(f'Deleted ROM file: {rom_abs_path}')
                         else:
                             app.logger.warning(f'ROM file not found: {rom_abs_path}')
                             failed_deletions.append({'path': rom_path, 'error': 'ROM file not found'})
                         
                         # Find and delete associated media files
                         rom_filename = os.path.splitext(os.path.basename(rom_path))[0]
-                        app.logger.info(f'Looking for media files with ROM filename: {rom_filename}')
-                        media_dir = os.path.join(system_path, 'media')
                         
-                        if os.path.exists(media_dir):
-                            # Check all media subdirectories for files with matching name
-                            media_fields = ['boxart', 'screenshot', 'marquee', 'wheel', 'video', 'thumbnail', 'cartridge', 'fanart', 'title', 'manual', 'boxback', 'box2d']
-                            
-                            for field in media_fields:
-                                field_dir = os.path.join(media_dir, field)
-                                if os.path.exists(field_dir):
-                                    # Look for files that start with the ROM filename
-                                    for file in os.listdir(field_dir):
-                                        if file.startswith(rom_filename):
-                                            file_path = os.path.join(field_dir, file)
-                                            try:
-                                                os.remove(file_path)
-                                                deleted_files.append(f"{field}: {file}")
-                                                app.logger.info(f'Deleted media file: {file_path}')
-                                            except Exception as e:
-                                                failed_deletions.append({'path': file_path, 'error': str(e)})
-                                                app.logger.error(f'Failed to delete media file {file_path}: {e}')
+                        # Check existing media subdirectories for files that start with the ROM filename
+                        for field, (names, paths) in media_index.items():
+                            i = bisect.bisect_left(names, rom_filename)
+                            while i < len(names) and names[i].startswith(rom_filename):
+                                file_name, file_path = names[i], paths[i]
+                                i += 1
+                                if file_path in removed_media_paths:
+                                    continue
+                                try:
+                                    os.remove(file_path)
+                                    removed_media_paths.add(file_path)
+                                    deleted_files.append(f"{field}: {file_name}")
+                                    if debug_enabled:
+                                        app.logger.debug(f'Deleted media file: {file_path}')
+                                except Exception as e:
+                                    failed_deletions.append({'path': file_path, 'error': str(e)})
+                                    app.logger.error(f'Failed to delete media file {file_path}: {e}')
                         
                     except Exception as e:
                         failed_deletions.append({'path': rom_path, 'error': str(e)})
@@ -3947,25 +4288,20 @@ def rom_system_gamelist(system_name):
             
             # Get changed games data before notifications
             changed_games = data.get('changed_games', [])
-            print(f"🔔 Changed games data: {changed_games}")
             
             # Notify all connected clients about the gamelist update
             if delete_rom_paths:
-                print(f"🔔 Notifying about gamelist update with deletions")
                 notify_gamelist_updated(system_name, len(games), len(delete_rom_paths), len(changed_games))
                 notify_game_deleted(system_name, deleted_files)
             else:
-                print(f"🔔 Notifying about gamelist update without deletions")
                 notify_gamelist_updated(system_name, len(games), 0, len(changed_games))
                 
             # Notify about individual game changes if provided
-            print(f"🔔 Processing {len(changed_games)} changed games for individual notifications")
             for changed_game in changed_games:
                 if changed_game.get('changed_fields'):
-                    print(f"🔔 Notifying about game update: {changed_game['game_name']} with fields: {changed_game['changed_fields']}")
                     notify_game_updated(system_name, changed_game['game_name'], changed_game['changed_fields'])
-                else:
-                    print(f"⚠️  Changed game missing changed_fields: {changed_game}")
+                elif debug_enabled:
+                    app.logger.debug(f'Changed game missing changed_fields: {changed_game}')
             
             return jsonify({
                 'success': True,
@@ -4005,16 +4341,38 @@ def save_gamelist_endpoint(system_name):
     except Exception as e:
         return jsonify({'error': f'Failed to save gamelist: {str(e)}'}), 500
 
-def load_launchbox_config():
-    """Load Launchbox configuration from consolidated config.json"""
-    global platform_metadata_cache, current_system_platform
-    
-    # Load from consolidated config
+@lru_cache(maxsize=1)
+def _load_launchbox_config(version):
     mapping_config = config.get('launchbox', {}).get('mapping', {})
     system_platform_mapping = config.get('systems', {})
     
     return mapping_config, system_platform_mapping
 
+def load_launchbox_config():
+    """Load Launchbox configuration from consolidated config.json"""
+    return _load_launchbox_config(_config_version)
+
+# LaunchBox core fields that are always loaded regardless of the mapping configuration
+_CORE_LAUNCHBOX_FIELDS = ('Name', 'Platform', 'DatabaseID')
+_CORE_FIELDS_TO_LOAD = frozenset(sys.intern(f) for f in _CORE_LAUNCHBOX_FIELDS)
+
+def _build_fields_to_load(mapping_config):
+    return frozenset(sys.intern(f) for f in (*_CORE_LAUNCHBOX_FIELDS, *mapping_config))
+
+@lru_cache(maxsize=8)
+def _configured_fields_to_load(version):
+    mapping_config, _ = _load_launchbox_config(version)
+    return _build_fields_to_load(mapping_config)
+
+def get_fields_to_load(mapping_config):
+    """Return the (interned) set of LaunchBox fields to load for a mapping configuration"""
+    if not mapping_config:
+        return _CORE_FIELDS_TO_LOAD
+    # The configured mapping (what callers pass nearly always) is memoized per config version
+    if mapping_config is load_launchbox_config()[0]:
+        return _configured_fields_to_load(_config_version)
+    return _build_fields_to_load(mapping_config)
+
 
 def parse_launchbox_metadata(metadata_path, target_platform, skip_global_cache=False):
     """Parse Launchbox Metadata.xml file using cached data"""
@@ -4034,6 +4392,9 @@ def parse_launchbox_metadata(metadata_path, target_platform, skip_global_cache=F
         
         games = []
         
+        # Get the fields to load from mapping configuration
+        fields_to_load = get_fields_to_load(config.get('launchbox', {}).get('mapping', {}))
+        
         # Build games list from consolidated cache for the target platform
         for db_id, entry in global_metadata_cache.items():
             game_elem = entry.get('game')
@@ -4042,15 +4403,10 @@ def parse_launchbox_metadata(metadata_path, target_platform, skip_global_cache=F
             game_data = {}
             
             # Parse basic game fields from cached element
-            # Get the fields to load from mapping configuration
-            fields_to_load = set(['Name', 'Platform', 'DatabaseID'])  # Always load these core fields
-            mapping_config = config.get('launchbox', {}).get('mapping', {})
-            if mapping_config:
-                # Add all LaunchBox fields from the mapping configuration
-                fields_to_load.update(mapping_config.keys())
-            
             for child in game_elem:
-                tag = child.tag
+                if not isinstance(child.tag, str):
+                    continue
+                tag = sys.intern(child.tag)
                 text = child.text.strip() if child.text else ''
                 
                 if tag in fields_to_load:
@@ -4087,6 +4443,13 @@ def parse_launchbox_metadata(metadata_path, target_platform, skip_global_cache=F
 
 from game_utils import normalize_game_name
 
+# Strips parenthesized/bracketed tags (one nesting level), e.g. "Game (USA) [!]" -> "Game"
+_PARENS_RE = re.compile(r'\s*[\(\[][^()\[\]]*(?:[\(\[][^()\[\]]*[\)\]][^()\[\]]*)*[\)\]]')
+# Strips parenthesized tags only, e.g. "Game (USA) [!]" -> "Game [!]"
+_SIMPLE_PARENS_RE = re.compile(r'\s*\([^)]*\)')
+# Matches a parenthesized tag at the end of a name, e.g. " (USA)"
+_TRAILING_PARENS_RE = re.compile(r'\s*\([^)]*\)\s*$')
+
 def find_best_match(game_name, metadata_games, target_platform, existing_launchboxid=None, platform_cache=None, mapping_config=None):
     """Find the best matching game in Launchbox metadata"""
     if not metadata_games:
@@ -4108,10 +4471,7 @@ def find_best_match(game_name, metadata_games, target_platform, existing_launchb
                 game_data = {}
                 
                 # Get the fields to load from mapping configuration
-                fields_to_load = set(['Name', 'Platform', 'DatabaseID'])  # Always load these core fields
-                if mapping_config:
-                    # Add all LaunchBox fields from the mapping configuration
-                    fields_to_load.update(mapping_config.keys())
+                fields_to_load = get_fields_to_load(mapping_config)
                 
                 for child in game_elem:
                     tag = child.tag
@@ -4139,7 +4499,7 @@ def find_best_match(game_name, metadata_games, target_platform, existing_launchb
     normalized_search = normalize_game_name(game_name)
     
     # Fallback version removes parentheses and brackets after normalization (including nested)
-    normalized_search_no_parens = re.sub(r'\s*[\(\[][^()\[\]]*(?:[\(\[][^()\[\]]*[\)\]][^()\[\]]*)*[\)\]]', '', game_name)
+    normalized_search_no_parens = _PARENS_RE.sub('', game_name)
     normalized_search_no_parens = normalize_game_name(normalized_search_no_parens)
     
     # Build unified index on first call or when metadata_games changes (cached for subsequent calls)
@@ -4157,7 +4517,7 @@ def find_best_match(game_name, metadata_games, target_platform, existing_launchb
             if name:
                 if name not in find_best_match._unified_index:
                     find_best_match._unified_index[name] = []
-                find_best_match._unified_index[name].append(('main', i))
+                find_best_match._unified_index[name].append(('main', i, game.get('Name', '')))
                 main_name_count += 1
             
             # Index alternate names with consistent normalization
@@ -4166,44 +4526,27 @@ def find_best_match(game_name, metadata_games, target_platform, existing_launchb
                 alt_name_normalized = normalize_game_name(alt_name)
                 if alt_name_normalized not in find_best_match._unified_index:
                     find_best_match._unified_index[alt_name_normalized] = []
-                find_best_match._unified_index[alt_name_normalized].append(('alternate', i))
+                find_best_match._unified_index[alt_name_normalized].append(('alternate', i, alt_name))
                 alt_name_count += 1
         
         print(f"DEBUG: Indexed {main_name_count} main names and {alt_name_count} alternate names")
     
-    # Try exact match using unified index (O(1) lookup)
-    # First try with normalized search (with parentheses removed)
-    if normalized_search in find_best_match._unified_index:
-        for match_type, game_idx in find_best_match._unified_index[normalized_search]:
-            game = metadata_games[game_idx]
-            if match_type == 'main':
-                game['_match_type'] = 'main'
-                game['_matched_name'] = game.get('Name', '')
-                return game, 1.0
-            elif match_type == 'alternate':
-                # Find the exact alternate name that matched
-                for alt_name in game.get('AlternateNames', []):
-                    if normalize_game_name(alt_name) == normalized_search:
-                        game['_match_type'] = 'alternate'
-                        game['_matched_name'] = alt_name
-                        print(f"DEBUG: Found alternate name match for '{game_name}' → '{alt_name}' (via unified index)")
-                        return game, 1.0
-    # If no match found with normalized search, try with no_parens version
-    if normalized_search != normalized_search_no_parens and normalized_search_no_parens in find_best_match._unified_index:
-        for match_type, game_idx in find_best_match._unified_index[normalized_search_no_parens]:
-            game = metadata_games[game_idx]
-            if match_type == 'main':
-                game['_match_type'] = 'main'
-                game['_matched_name'] = game.get('Name', '')
-                return game, 1.0
-            elif match_type == 'alternate':
-                # Find the exact alternate name that matched
-                for alt_name in game.get('AlternateNames', []):
-                    if normalize_game_name(alt_name) == normalized_search_no_parens:
-                        game['_match_type'] = 'alternate'
-                        game['_matched_name'] = alt_name
-                        print(f"DEBUG: Found alternate name match for '{game_name}' → '{alt_name}' (via unified index, no parens)")
-                        return game, 1.0
+    # Try exact match using unified index (O(1) lookup): first with the normalized search,
+    # then with the no_parens version; index entries carry the exact name that matched
+    search_variations = [(normalized_search, '')]
+    if normalized_search != normalized_search_no_parens:
+        search_variations.append((normalized_search_no_parens, ', no parens'))
+    for search_key, variation_label in search_variations:
+        entries = find_best_match._unified_index.get(search_key)
+        if not entries:
+            continue
+        match_type, game_idx, matched_name = entries[0]
+        game = metadata_games[game_idx]
+        game['_match_type'] = match_type
+        game['_matched_name'] = matched_name
+        if match_type == 'alternate':
+            print(f"DEBUG: Found alternate name match for '{game_name}' → '{matched_name}' (via unified index{variation_label})")
+        return game, 1.0
     
     # No similarity matching - only exact matches are accepted
     best_match = None
@@ -4214,91 +4557,252 @@ def find_best_match(game_name, metadata_games, target_platform, existing_launchb
     return best_match, best_score
 
 
-def get_top_matches(game_name, metadata_games, target_platform, top_n=20, mapping_config=None):
-    """Get top N matches for a game name, sorted by similarity score"""
-    if not metadata_games:
-        return []
-    
-    # Clean the game name for better matching
-    cleaned_name = re.sub(r'\s*\([^)]*\)', '', game_name)  # Remove text in parentheses
-    cleaned_name = normalize_game_name(cleaned_name)
-    
-    # Also try matching with parentheses removed from both sides
-    game_name_no_parens = re.sub(r'\s*\([^)]*\)', '', game_name).strip()
-    
-    matches = []
+# Word tokens used by the get_top_matches candidate index
+_NAME_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+def get_match_columns(metadata_games):
+    """Get lowercased name/publisher/developer columns for metadata_games (cached per list)"""
+    cached = getattr(get_match_columns, '_cached', None)
+    if cached is not None and cached[0] is metadata_games:
+        return cached[1]
+    
+    # Column (structure-of-arrays) layout: one list per attribute, indexed like metadata_games.
+    # Strings are casefolded once here and interned, so repeated names, publishers and
+    # developers share one object (and one cached hash) across the catalog
+    intern = sys.intern
+    columns = {
+        'names_lower': [intern(game.get('Name', '').casefold()) for game in metadata_games],
+        'alts_lower': [[intern(alt.casefold()) for alt in game.get('AlternateNames', [])] for game in metadata_games],
+        'platforms': [game.get('Platform') for game in metadata_games],
+        'publishers_lower': [intern(game.get('Publisher', '').casefold().strip()) for game in metadata_games],
+        'developers_lower': [intern(game.get('Developer', '').casefold().strip()) for game in metadata_games],
+    }
     
-    for game in metadata_games:
-        metadata_name = game.get('Name', '')
-        if not metadata_name:
+    # Inverted index: word token of any main/alternate name -> indices of the games using it.
+    # Main and alternate names are also flattened into one list (with the owning game index)
+    # so a whole catalog can be scored in a single rapidfuzz call
+    token_index = {}
+    flat_names = []
+    flat_game_idx = []
+    for game_idx, (name_lower, alts_lower) in enumerate(zip(columns['names_lower'], columns['alts_lower'])):
+        for name in (name_lower, *alts_lower):
+            flat_names.append(name)
+            flat_game_idx.append(game_idx)
+            for token in _NAME_TOKEN_RE.findall(name):
+                token_index.setdefault(intern(token), set()).add(game_idx)
+    columns['token_index'] = token_index
+    columns['flat_names'] = flat_names
+    columns['flat_game_idx'] = flat_game_idx
+    
+    # Store games and columns together so concurrent callers never see a mismatched pair
+    get_match_columns._cached = (metadata_games, columns)
+    return columns
+
+def _ratio_upper_bound(cleaned_len, no_parens_len, name_len):
+    """Upper bound of fuzz.ratio (0..1) between either search variation and a name of name_len"""
+    return max(
+        2.0 * min(cleaned_len, name_len) / (cleaned_len + name_len) if cleaned_len + name_len else 1.0,
+        2.0 * min(no_parens_len, name_len) / (no_parens_len + name_len) if no_parens_len + name_len else 1.0,
+    )
+
+def _name_field_bonus(cleaned_lower, no_parens_lower, value, exact_bonus, partial_bonus):
+    """Bonus for a publisher/developer value matching a search variation exactly or partially"""
+    # Checked in order: the cleaned name first, then the name without parentheses
+    for search in (cleaned_lower, no_parens_lower):
+        if search == value:
+            return exact_bonus
+        if search in value or value in search:
+            return partial_bonus
+    return 0.0
+
+# Largest bonus get_top_matches can add to a name similarity (platform + publisher + developer)
+_MAX_MATCH_BONUS = 0.1 + 0.15 + 0.12
+
+def _score_match_candidates(columns, candidate_indices, cleaned_lower, no_parens_lower, target_platform, top_n, top_scores=None):
+    """Score candidate games against a search; returns the best top_n (score, -game_idx, alt_idx) entries
+
+    Pass the result of a previous call as top_scores to keep filling the same heap.
+    """
+    names_lower = columns['names_lower']
+    alts_lower = columns['alts_lower']
+    platforms = columns['platforms']
+    publishers_lower = columns['publishers_lower']
+    developers_lower = columns['developers_lower']
+    
+    # Min-heap of the best top_n (score, -game_idx, alt_idx) entries seen so far; once full,
+    # its smallest entry is what a candidate must beat to make the result (earlier games win
+    # ties, as with a stable sort), which lets us prune the rest cheaply
+    if top_scores is None:
+        top_scores = []
+    cleaned_len = len(cleaned_lower)
+    no_parens_len = len(no_parens_lower)
+    # Each name is scored against both search variations in one rapidfuzz call, which
+    # preprocesses the name once and reuses it for both comparisons
+    search_variations = (cleaned_lower, no_parens_lower)
+    publisher_bonuses = {}
+    developer_bonuses = {}
+    
+    for game_idx in candidate_indices:
+        metadata_name_lower = names_lower[game_idx]
+        alt_names_lower = alts_lower[game_idx]
+        platform = platforms[game_idx]
+        metadata_publisher = publishers_lower[game_idx]
+        metadata_developer = developers_lower[game_idx]
+        if not metadata_name_lower:
             continue
         
-        # Calculate similarity score for main name (with and without parentheses)
-        main_similarity = difflib.SequenceMatcher(None, cleaned_name.lower(), metadata_name.lower()).ratio()
-        main_similarity_no_parens = difflib.SequenceMatcher(None, game_name_no_parens.lower(), metadata_name.lower()).ratio()
-        main_similarity = max(main_similarity, main_similarity_no_parens)
+        # Bonuses do not depend on the name similarity, so compute them first
+        bonus = 0.0
+        
+        # Bonus for platform match
+        if platform == target_platform:
+            bonus += 0.1
+        
+        # Bonus for publisher match (if we have publisher info); the same few publishers
+        # and developers repeat across a catalog, so each one is only checked once per search
+        if metadata_publisher:
+            publisher_bonus = publisher_bonuses.get(metadata_publisher)
+            if publisher_bonus is None:
+                publisher_bonus = publisher_bonuses[metadata_publisher] = _name_field_bonus(
+                    cleaned_lower, no_parens_lower, metadata_publisher, 0.15, 0.08)
+            bonus += publisher_bonus
+        
+        # Bonus for developer match (if we have developer info)
+        if metadata_developer:
+            developer_bonus = developer_bonuses.get(metadata_developer)
+            if developer_bonus is None:
+                developer_bonus = developer_bonuses[metadata_developer] = _name_field_bonus(
+                    cleaned_lower, no_parens_lower, metadata_developer, 0.12, 0.06)
+            bonus += developer_bonus
+        
+        # Name similarity this candidate needs to beat the current top_n cut
+        if len(top_scores) >= top_n:
+            min_similarity = top_scores[0][0] - bonus
+            # 2*min(la, lb)/(la + lb) bounds the ratio from above: skip the full comparison
+            # when no name of this game can reach min_similarity on length alone
+            best_possible = max(
+                _ratio_upper_bound(cleaned_len, no_parens_len, len(name))
+                for name in (metadata_name_lower, *alt_names_lower)
+            )
+            if best_possible < min_similarity - 1e-9:
+                continue
+            score_cutoff = max(0.0, min_similarity * 100.0 - 1e-9)
+        else:
+            score_cutoff = 0.0
         
-        # Check alternate names for better matches
-        alternate_names = game.get('AlternateNames', [])
+        # Calculate similarity score for main name (with and without parentheses);
+        # identical strings skip the scorer entirely
+        if metadata_name_lower == cleaned_lower or metadata_name_lower == no_parens_lower:
+            main_similarity = 1.0
+        else:
+            best = process.extractOne(metadata_name_lower, search_variations, scorer=fuzz.ratio, score_cutoff=score_cutoff)
+            main_similarity = best[1] / 100.0 if best else 0.0
+        
+        # Check alternate names for better matches. An alternate only wins when it strictly
+        # beats the best similarity so far, so that best is the cutoff for the next one, and
+        # nothing can beat a perfect match
         best_alt_similarity = 0
-        best_alt_name = None
+        best_alt_idx = -1
+        best_similarity = main_similarity
         
-        for alt_name in alternate_names:
+        for alt_idx, alt_name_lower in enumerate(alt_names_lower):
+            if best_similarity >= 1.0:
+                break
+            if _ratio_upper_bound(cleaned_len, no_parens_len, len(alt_name_lower)) <= best_similarity:
+                continue
             # Check both cleaned and no-parentheses versions
-            alt_similarity = difflib.SequenceMatcher(None, cleaned_name.lower(), alt_name.lower()).ratio()
-            alt_similarity_no_parens = difflib.SequenceMatcher(None, game_name_no_parens.lower(), alt_name.lower()).ratio()
-            alt_similarity = max(alt_similarity, alt_similarity_no_parens)
+            if alt_name_lower == cleaned_lower or alt_name_lower == no_parens_lower:
+                alt_similarity = 1.0
+            else:
+                best = process.extractOne(alt_name_lower, search_variations, scorer=fuzz.ratio,
+                                          score_cutoff=max(score_cutoff, best_similarity * 100.0))
+                alt_similarity = best[1] / 100.0 if best else 0.0
             
             if alt_similarity > best_alt_similarity:
                 best_alt_similarity = alt_similarity
-                best_alt_name = alt_name
+                best_alt_idx = alt_idx
+                best_similarity = max(best_similarity, alt_similarity)
         
-        # Use the best similarity score (main name or alternate name)
+        # Use the best similarity score (main name or alternate name; alt_idx -1 means main)
         if best_alt_similarity > main_similarity:
-            similarity = best_alt_similarity
-            match_type = 'alternate'
-            matched_name = best_alt_name
+            entry = (best_alt_similarity + bonus, -game_idx, best_alt_idx)
         else:
-            similarity = main_similarity
-            match_type = 'main'
-            matched_name = metadata_name
+            entry = (main_similarity + bonus, -game_idx, -1)
         
-        # Bonus for platform match
-        if game.get('Platform') == target_platform:
-            similarity += 0.1
-        
-        # Bonus for publisher match (if we have publisher info)
-        metadata_publisher = game.get('Publisher', '').lower().strip()
-        if metadata_publisher:
-            # Check if any search variation matches publisher
-            if cleaned_name.lower().strip() == metadata_publisher:
-                similarity += 0.15  # Significant bonus for publisher match
-            elif cleaned_name.lower().strip() in metadata_publisher or metadata_publisher in cleaned_name.lower().strip():
-                similarity += 0.08  # Partial publisher match bonus
-            elif game_name_no_parens.lower().strip() == metadata_publisher:
-                similarity += 0.15  # Significant bonus for publisher match
-            elif game_name_no_parens.lower().strip() in metadata_publisher or metadata_publisher in game_name_no_parens.lower().strip():
-                similarity += 0.08  # Partial publisher match bonus
-        
-        # Bonus for developer match (if we have developer info)
-        metadata_developer = game.get('Developer', '').lower().strip()
-        if metadata_developer:
-            # Check if any search variation matches developer
-            if cleaned_name.lower().strip() == metadata_developer:
-                similarity += 0.12  # Bonus for developer match
-            elif cleaned_name.lower().strip() in metadata_developer or metadata_developer in cleaned_name.lower().strip():
-                similarity += 0.06  # Partial developer match bonus
-            elif game_name_no_parens.lower().strip() == metadata_developer:
-                similarity += 0.12  # Bonus for developer match
-            elif game_name_no_parens.lower().strip() in metadata_developer or metadata_developer in game_name_no_parens.lower().strip():
-                similarity += 0.06  # Partial developer match bonus
+        # Scores below the cutoff came back as 0 and cannot make the top N
+        if len(top_scores) >= top_n:
+            if entry <= top_scores[0]:
+                continue
+            heapq.heapreplace(top_scores, entry)
+        else:
+            heapq.heappush(top_scores, entry)
+    
+    return top_scores
+
+def get_top_matches(game_name, metadata_games, target_platform, top_n=20, mapping_config=None):
+    """Get top N matches for a game name, sorted by similarity score"""
+    if not metadata_games or top_n <= 0:
+        return []
+    
+    # Clean the game name for better matching
+    name_without_parens = _SIMPLE_PARENS_RE.sub('', game_name)  # Remove text in parentheses
+    cleaned_name = normalize_game_name(name_without_parens)
+    
+    # Also try matching with parentheses removed from both sides
+    game_name_no_parens = name_without_parens.strip()
+    
+    # Casefold both search variations once (as get_match_columns does for the catalog)
+    # instead of on every comparison
+    cleaned_lower = sys.intern(cleaned_name.casefold().strip())
+    no_parens_lower = sys.intern(game_name_no_parens.casefold().strip())
+    
+    columns = get_match_columns(metadata_games)
+    
+    # Shortlist the games sharing a word with the search (ignoring words used by more than
+    # 10% of the games) and score them first: they are the likely best matches, so the
+    # top_n cut rises early and prunes most of the remaining games cheaply
+    max_postings = max(1, len(metadata_games) // 10)
+    shortlist = set()
+    for token in set(_NAME_TOKEN_RE.findall(no_parens_lower)) | set(_NAME_TOKEN_RE.findall(cleaned_lower)):
+        postings = columns['token_index'].get(token)
+        if postings and len(postings) <= max_postings:
+            shortlist.update(postings)
+    shortlist_order = sorted(shortlist)
+    
+    top_scores = _score_match_candidates(
+        columns, shortlist_order, cleaned_lower, no_parens_lower, target_platform, top_n)
+    if len(shortlist) == len(metadata_games):
+        remaining = []
+    elif len(top_scores) >= top_n:
+        # With the shortlist scored, a remaining game needs a name similarity of at least
+        # (current cut - largest possible bonus). One batched rapidfuzz call per search
+        # variation over the flattened main + alternate names finds the games that can
+        # still get there; everything else is skipped without any per-game Python work
+        score_cutoff = max(0.0, (top_scores[0][0] - _MAX_MATCH_BONUS) * 100.0 - 1e-6)
+        flat_game_idx = columns['flat_game_idx']
+        reachable = set()
+        for search in (cleaned_lower, no_parens_lower):
+            for _, _, flat_idx in process.extract(search, columns['flat_names'], scorer=fuzz.ratio,
+                                                  score_cutoff=score_cutoff, limit=None):
+                reachable.add(flat_game_idx[flat_idx])
+        # Only the reachable games are listed; the rest of the catalog is never materialized
+        remaining = sorted(reachable.difference(shortlist))
+    else:
+        remaining = [i for i in range(len(metadata_games)) if i not in shortlist]
+    top_entries = heapq.nlargest(top_n, _score_match_candidates(
+        columns, remaining, cleaned_lower, no_parens_lower, target_platform, top_n, top_scores))
+    
+    # Build match info for the selected games only (highest score first, original order on ties)
+    matches = []
+    for similarity, neg_game_idx, alt_idx in top_entries:
+        game = metadata_games[-neg_game_idx]
         
         # Create match info
         match_info = {
             'game': game,
             'score': similarity,
-            'match_type': match_type,
-            'matched_name': matched_name,
+            'match_type': 'alternate' if alt_idx >= 0 else 'main',
+            'matched_name': game['AlternateNames'][alt_idx] if alt_idx >= 0 else game['Name'],
             'database_id': game.get('DatabaseID', ''),
             'name': game.get('Name', ''),
             'overview': game.get('Overview', ''),
@@ -4313,53 +4817,126 @@ def get_top_matches(game_name, metadata_games, target_platform, top_n=20, mappin
         
         matches.append(match_info)
     
-    # Sort by score (highest first) and return top N
-    matches.sort(key=lambda x: x['score'], reverse=True)
-    return matches[:top_n]
+    return matches
+
+# Rolling gamelist backups: keep this many, and take at most one per interval (seconds)
+_GAMELIST_BACKUPS_TO_KEEP = 10
+_GAMELIST_BACKUP_MIN_INTERVAL = 60
+
+def backup_gamelist(file_path):
+    """Copy file_path to file_path.backup.<timestamp>, keeping only the newest backups
+
+    Returns the backup path, or None if there was nothing to back up or a backup was
+    taken less than _GAMELIST_BACKUP_MIN_INTERVAL seconds ago.
+    """
+    if not os.path.exists(file_path):
+        return None
+    
+    now = int(time.time())
+    prefix = os.path.basename(file_path) + '.backup.'
+    stamps = []
+    with os.scandir(os.path.dirname(file_path) or '.') as entries:
+        for entry in entries:
+            suffix = entry.name[len(prefix):]
+            if entry.name.startswith(prefix) and suffix.isdigit():
+                stamps.append(int(suffix))
+    stamps.sort()
+    
+    if stamps and now - stamps[-1] < _GAMELIST_BACKUP_MIN_INTERVAL:
+        return None
+    
+    # Make room for the new backup
+    for stamp in stamps[:max(0, len(stamps) - _GAMELIST_BACKUPS_TO_KEEP + 1)]:
+        try:
+            os.unlink(f"{file_path}.backup.{stamp}")
+        except FileNotFoundError:
+            pass
+    
+    backup_path = f"{file_path}.backup.{now}"
+    shutil.copy2(file_path, backup_path)
+    return backup_path
 
 def _dedupe_games_by_path(games):
-    """Return a new list with duplicates removed by 'path' (first occurrence wins)."""
-    seen_paths = set()
-    deduped = []
+    """Return games with duplicates removed by 'path' (first occurrence wins).
+
+    The input list itself is returned when it has no duplicates (the common case).
+    """
+    # One pass keyed by path; dicts keep insertion order, so the first occurrence stays in place
+    by_key = {}
     for game in games:
-        raw_path = (game.get('path') or '').strip()
-        key = raw_path if raw_path else f"__no_path__::{(game.get('name') or '').strip().lower()}"
-        if key in seen_paths:
-            continue
-        seen_paths.add(key)
-        deduped.append(game)
-    removed_count = max(0, len(games) - len(deduped))
-    if removed_count:
-        print(f"🧹 Deduped games by path: removed {removed_count} duplicate entries (kept first occurrence)")
+        path = game.get('path')
+        key = path.strip() if path and path.strip() else f"__no_path__::{(game.get('name') or '').strip().lower()}"
+        by_key.setdefault(key, game)
+    if len(by_key) == len(games):
+        return games
+    
+    deduped = list(by_key.values())
+    print(f"🧹 Deduped games by path: removed {len(games) - len(deduped)} duplicate entries (kept first occurrence)")
     return deduped
 
+# Gamelist media fields used by the scraper (every game gets them, possibly empty)
+_SCRAPER_MEDIA_FIELDS = (
+    'image', 'video', 'marquee', 'wheel', 'boxart', 'thumbnail', 'screenshot', 'cartridge',
+    'fanart', 'titleshot', 'manual', 'boxback', 'extra1', 'mix'
+)
+
+# Media fields written by write_gamelist_xml even when empty
+_WRITE_GAMELIST_MEDIA_FIELDS = frozenset(_SCRAPER_MEDIA_FIELDS)
+
+def is_media_field(field):
+    """Check that a gamelist field holds a media path (built-in or configured media field)"""
+    return field in _WRITE_GAMELIST_MEDIA_FIELDS or field in config.get('media_fields', {})
+
 def write_gamelist_xml(games, file_path):
     """Write games list to gamelist.xml file (deduped by path)."""
     try:
         games_to_write = _dedupe_games_by_path(games)
         root = ET.Element('gameList')
+        SubElement = ET.SubElement
         
         for game in games_to_write:
-            game_elem = ET.SubElement(root, 'game')
+            game_elem = SubElement(root, 'game')
             
             # Add all game fields
             for field, value in game.items():
                 # Always include media-related fields, even if empty
-                if field in ['image', 'video', 'marquee', 'wheel', 'boxart', 'thumbnail', 'screenshot', 'cartridge', 'fanart', 'titleshot', 'manual', 'boxback', 'extra1', 'mix']:
-                    field_elem = ET.SubElement(game_elem, field)
-                    field_elem.text = str(value) if value else ''
+                if field in _WRITE_GAMELIST_MEDIA_FIELDS:
+                    # Empty media fields serialize as <field/>, as the old re-parse round trip did
+                    SubElement(game_elem, field).text = (value if value.__class__ is str else str(value)) if value else None
                 elif value is not None and value != '':
-                    field_elem = ET.SubElement(game_elem, field)
                     # Write raw text as-is; XML writer will handle escaping (& -> &amp;)
-                    field_elem.text = str(value)
+                    SubElement(game_elem, field).text = value if value.__class__ is str else str(value)
         
-        # Write to file with formatting
-        tree = ET.ElementTree(root)
-        save_formatted_gamelist_xml(tree, file_path)
+        # The tree is built without whitespace, so lxml's C serializer can pretty-print it
+        # directly; no need to serialize, re-parse and re-serialize it for formatting
+        with replace_gamelist_file(file_path) as f:
+            ET.ElementTree(root).write(f, encoding='utf-8', xml_declaration=True, pretty_print=True)
         
     except Exception as e:
         print(f"Error writing gamelist.xml: {e}")
 
+def update_gamelist_game_field(file_path, rom_path, field, value):
+    """Set one field of the game with the given path directly in gamelist.xml
+
+    Only that element is changed (the rest of the file is re-serialized by lxml as it was
+    parsed), instead of rebuilding the whole gamelist from parsed game dicts.
+    A value of None leaves an empty <field/> element. Returns False if no game has that path;
+    raises ET.XMLSyntaxError if gamelist.xml cannot be parsed.
+    """
+    tree = ET.parse(file_path, ET.XMLParser(remove_blank_text=True))
+    for game_elem in tree.getroot().iterfind('game'):
+        path_text = (game_elem.findtext('path') or '').strip()
+        if path_text != rom_path and fix_over_escaped_xml_entities(path_text) != rom_path:
+            continue
+        field_elem = game_elem.find(field)
+        if field_elem is None:
+            field_elem = ET.SubElement(game_elem, field)
+        field_elem.text = value
+        with replace_gamelist_file(file_path) as f:
+            tree.write(f, encoding='utf-8', xml_declaration=True, pretty_print=True)
+        return True
+    return False
+
 @app.route('/api/scrap-launchbox', methods=['POST'])
 @login_required
 def scrap_launchbox():
@@ -4442,6 +5019,9 @@ def scrap_launchbox_simple(system_name):
         if not system_name:
             return jsonify({'error': 'System name required'}), 400
         
+        # Counters of the previous run must not show on this run's progress lines
+        publish_scraping_stats(0, 0, 0, 0)
+        
         # Get selected games and partial match modal setting from POST body if available
         selected_games = None
         enable_partial_match_modal = False
@@ -4455,43 +5035,43 @@ def scrap_launchbox_simple(system_name):
                 if data:
                     if 'selected_games' in data:
                         selected_games = data['selected_games']
-                        scraping_progress.append(f"Processing {len(selected_games)} selected games")
+                        append_scraping_progress(f"Processing {len(selected_games)} selected games")
                     else:
-                        scraping_progress.append("Processing all games")
+                        append_scraping_progress("Processing all games")
                     
                     if 'enable_partial_match_modal' in data:
                         enable_partial_match_modal = data['enable_partial_match_modal']
                         print(f"DEBUG: Received enable_partial_match_modal: {enable_partial_match_modal} (type: {type(enable_partial_match_modal)})")
                         if enable_partial_match_modal:
-                            scraping_progress.append("Partial match modal enabled - will show modal for non-perfect matches")
+                            append_scraping_progress("Partial match modal enabled - will show modal for non-perfect matches")
                         else:
-                            scraping_progress.append("Partial match modal disabled - only perfect matches will be applied")
+                            append_scraping_progress("Partial match modal disabled - only perfect matches will be applied")
                     
                     if 'force_download' in data:
                         force_download = data['force_download']
                         if force_download:
-                            scraping_progress.append("Force download enabled - will overwrite existing media fields")
+                            append_scraping_progress("Force download enabled - will overwrite existing media fields")
                         else:
-                            scraping_progress.append("Force download disabled - will only update empty media fields")
+                            append_scraping_progress("Force download disabled - will only update empty media fields")
                     
                     if 'selected_fields' in data:
                         selected_fields = data['selected_fields']
                         if selected_fields:
-                            scraping_progress.append(f"Field selection enabled - will only scrape: {', '.join(selected_fields)}")
+                            append_scraping_progress(f"Field selection enabled - will only scrape: {', '.join(selected_fields)}")
                         else:
-                            scraping_progress.append("No fields selected - will scrape all fields")
+                            append_scraping_progress("No fields selected - will scrape all fields")
                     
                     if 'overwrite_text_fields' in data:
                         overwrite_text_fields = data['overwrite_text_fields']
                         print(f"🔧 DEBUG: Received overwrite_text_fields: {overwrite_text_fields} (type: {type(overwrite_text_fields)})")
                         if overwrite_text_fields:
-                            scraping_progress.append("Overwrite text fields enabled - will overwrite existing text fields")
+                            append_scraping_progress("Overwrite text fields enabled - will overwrite existing text fields")
                         else:
-                            scraping_progress.append("Overwrite text fields disabled - will only update empty text fields")
+                            append_scraping_progress("Overwrite text fields disabled - will only update empty text fields")
                     else:
                         print(f"🔧 DEBUG: overwrite_text_fields not found in request data. Available keys: {list(data.keys())}")
             except Exception as e:
-                scraping_progress.append(f"Error parsing POST data: {e}")
+                append_scraping_progress(f"Error parsing POST data: {e}")
                 pass  # Ignore JSON parsing errors
         
         # Create and start new task (after parsing POST data)
@@ -4582,61 +5162,12 @@ def find_best_matches_endpoint():
         if not os.path.exists(metadata_path):
             return jsonify({'error': 'Metadata.xml not found'}), 404
         
-        # Load global metadata cache and filter by platform
-        global_cache = load_metadata_cache()
-        all_games_cache = global_cache['games_cache']
-        all_alternate_names_cache = global_cache['alternate_names_cache']
+        # Platform games from the global metadata cache (filtered and converted once per reload)
+        metadata_games, platform_cache = get_platform_metadata_games(current_system_platform, mapping_config)
         
-        # Filter games by platform from global cache
-        platform_games = {}
-        platform_alternate_names = {}
-        
-        for db_id, game_elem in all_games_cache.items():
-            if game_elem is not None:
-                # Check if this game belongs to the target platform
-                platform_elem = game_elem.find('Platform')
-                if platform_elem is not None and platform_elem.text:
-                    game_platform = platform_elem.text.strip()
-                    if game_platform == current_system_platform:
-                        platform_games[db_id] = game_elem
-                        platform_alternate_names[db_id] = all_alternate_names_cache.get(db_id, [])
-        
-        if not platform_games:
+        if not metadata_games:
             return jsonify({'error': f'No metadata for platform {current_system_platform}'}), 404
         
-        # Convert filtered platform cache to metadata_games format for compatibility
-        metadata_games = []
-        for db_id, game_elem in platform_games.items():
-            if game_elem is not None:
-                game_data = {}
-                # Get the fields to load from mapping configuration
-                fields_to_load = set(['Name', 'Platform', 'DatabaseID'])  # Always load these core fields
-                if mapping_config:
-                    # Add all LaunchBox fields from the mapping configuration
-                    fields_to_load.update(mapping_config.keys())
-                
-                for child in game_elem:
-                    tag = child.tag
-                    text = child.text.strip() if child.text else ''
-                    if tag in fields_to_load:
-                        game_data[tag] = text
-                
-                # Add alternate names
-                alt_names = []
-                for alt_elem in platform_alternate_names.get(db_id, []):
-                    alt_name = alt_elem.find('AlternateName')
-                    if alt_name is not None and alt_name.text:
-                        alt_names.append(alt_name.text.strip())
-                game_data['AlternateNames'] = alt_names
-                
-                metadata_games.append(game_data)
-        
-        # Create platform_cache object for compatibility with find_best_match
-        platform_cache = {
-            'games_cache': platform_games,
-            'alternate_names_cache': platform_alternate_names
-        }
-        
         # Load gamelist to get game details
         gamelist_path = get_gamelist_path(system_name)
         if not os.path.exists(gamelist_path):
@@ -4773,7 +5304,9 @@ def stop_scraping():
     if not scraping_in_progress:
         return jsonify({'error': 'No scraping in progress'}), 400
     
-    scraping_in_progress = False
+    with scraping_progress_cond:
+        scraping_in_progress = False
+        scraping_progress_cond.notify_all()
     return jsonify({'success': True, 'message': 'Scraping stopped'})
 
 @app.route('/api/scrap-launchbox-stream')
@@ -4781,84 +5314,80 @@ def stop_scraping():
 def stream_scraping_progress():
     """Stream scraping progress using Server-Sent Events (SSE)"""
     def generate():
-        global scraping_progress, scraping_stats, scraping_in_progress
+        global scraping_progress, scraping_in_progress
         
         # Send initial connection message
-        yield f"data: {json.dumps({'type': 'connected', 'message': 'SSE connection established'})}\n\n"
+        yield sse_frame({'type': 'connected', 'message': 'SSE connection established'})
         
         last_progress_length = 0
+        last_stats = None
         
         while scraping_in_progress:
             try:
-                current_progress_length = len(scraping_progress)
+                # Sleep until new progress or counters are published, or scraping stops (no polling)
+                with scraping_progress_cond:
+                    woken = scraping_progress_cond.wait_for(
+                        lambda: (len(scraping_progress_frames) != last_progress_length
+                                 or scraping_stats_ref != last_stats or not scraping_in_progress),
+                        timeout=30
+                    )
+                    current_progress_length = len(scraping_progress_frames)
                 
-                # Send new progress entries
-                if current_progress_length > last_progress_length:
-                    print(f"SSE: Sending {current_progress_length - last_progress_length} new progress entries")
-                    for i in range(last_progress_length, current_progress_length):
-                        progress_data = {
-                            'type': 'progress',
-                            'message': scraping_progress[i],
-                            'total': scraping_stats['total_games'],
-                            'current': scraping_stats['processed_games'],
-                            'matched': scraping_stats['matched_games'],
-                            'updated': scraping_stats['updated_games']
-                        }
-                        print(f"SSE: Sending progress: {scraping_progress[i][:100]}...")
-                        yield f"data: {json.dumps(progress_data)}\n\n"
+                if not woken:
+                    # Nothing happened for a while: SSE comment so proxies keep the stream open
+                    yield b":keepalive\n\n"
+                    continue
+                
+                # Send new progress entries (prebuilt frames that already carry the counters)
+                new_progress_count = current_progress_length - last_progress_length
+                current_stats = scraping_stats_ref
+                if new_progress_count > 0:
+                    if app.logger.isEnabledFor(logging.DEBUG):
+                        app.logger.debug(f"SSE: Sending {new_progress_count} new progress entries")
+                    yield from scraping_progress_frames[last_progress_length:current_progress_length]
                     
                     last_progress_length = current_progress_length
                 
-                # Send stats update
-                stats_data = {
-                    'type': 'stats',
-                    'total': scraping_stats['total_games'],
-                    'current': scraping_stats['processed_games'],
-                    'matched': scraping_stats['matched_games'],
-                    'updated': scraping_stats['updated_games']
-                }
-                yield f"data: {json.dumps(stats_data)}\n\n"
-                
-                # Wait a bit before next update
-                time.sleep(0.5)
+                # Send a separate stats frame only when the counters changed without any
+                # progress entry to carry them
+                if new_progress_count == 0 and current_stats != last_stats:
+                    stats_data = {
+                        'type': 'stats',
+                        'total': current_stats[0],
+                        'current': current_stats[1],
+                        'matched': current_stats[2],
+                        'updated': current_stats[3]
+                    }
+                    yield sse_frame(stats_data)
+                last_stats = current_stats
                 
             except Exception as e:
                 error_data = {
                     'type': 'error',
                     'message': f'SSE Error: {str(e)}'
                 }
-                yield f"data: {json.dumps(error_data)}\n\n"
+                yield sse_frame(error_data)
                 break
         
         # Send completion message
         if not scraping_in_progress:
-            print(f"SSE: Scraping completed, checking for remaining progress entries...")
-            # Send any remaining progress entries that might have been added
-            current_progress_length = len(scraping_progress)
-            if current_progress_length > last_progress_length:
-                print(f"SSE: Found {current_progress_length - last_progress_length} remaining progress entries")
-                for i in range(last_progress_length, current_progress_length):
-                    progress_data = {
-                        'type': 'progress',
-                        'message': scraping_progress[i],
-                        'total': scraping_stats['total_games'],
-                        'current': scraping_stats['processed_games'],
-                        'matched': scraping_stats['matched_games'],
-                        'updated': scraping_stats['updated_games']
-                    }
-                    print(f"SSE: Sending remaining progress: {scraping_progress[i][:100]}...")
-                    yield f"data: {json.dumps(progress_data)}\n\n"
+            # Snapshot the frame count and counters together; the drain is skipped entirely
+            # when the main loop already sent everything (the usual case)
+            with scraping_progress_cond:
+                current_progress_length = len(scraping_progress_frames)
+                total, current, matched, updated = scraping_stats_ref
+            if current_progress_length != last_progress_length:
+                yield from scraping_progress_frames[last_progress_length:current_progress_length]
             
             completion_data = {
                 'type': 'completed',
                 'message': 'Scraping completed',
-                'total': scraping_stats['total_games'],
-                'current': scraping_stats['processed_games'],
-                'matched': scraping_stats['matched_games'],
-                'updated': scraping_stats['updated_games']
+                'total': total,
+                'current': current,
+                'matched': matched,
+                'updated': updated
             }
-            print(f"SSE: Sending completion message")
-            yield f"data: {json.dumps(completion_data)}\n\n"
+            yield sse_frame(completion_data)
     
     # Set SSE headers
     response = Response(generate(), mimetype='text/event-stream')
@@ -4875,8 +5404,17 @@ def export_scraping_log():
     """Export the complete scraping log"""
     global scraping_progress
     
-    log_content = '\n'.join(scraping_progress)
-    return Response(log_content, mimetype='text/plain', headers={
+    # Stream the log in blocks of lines (snapshotted so a running scrape cannot extend the
+    # export) rather than joining the whole log into one string first
+    lines = scraping_progress
+    line_count = len(lines)
+    
+    def generate():
+        for start in range(0, line_count, 1000):
+            block = '\n'.join(lines[start:min(start + 1000, line_count)])
+            yield '\n' + block if start else block
+    
+    return Response(generate(), mimetype='text/plain', headers={
         'Content-Disposition': 'attachment; filename=scraping_log.txt'
     })
 
@@ -4921,14 +5459,18 @@ def get_top_matches_endpoint():
         print(f"Error in get_top_matches endpoint: {e}")
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
 
-def load_media_config():
-    """Load media configuration from consolidated config.json"""
+@lru_cache(maxsize=1)
+def _load_media_config(version):
     return {
         'media_fields': config.get('media_fields', {}),
         'scan_settings': config.get('media', {}).get('scan_settings', {}),
         '2dboxgenerator': config.get('2dboxgenerator', {})
     }
 
+def load_media_config():
+    """Load media configuration from consolidated config.json"""
+    return _load_media_config(_config_version)
+
 def get_media_directory_and_extensions(gamelist_field):
     """Get media directory and extensions for a gamelist field using new structure"""
     media_fields = config.get('media_fields', {})
@@ -4942,40 +5484,157 @@ def get_media_directory(gamelist_field):
     directory, _ = get_media_directory_and_extensions(gamelist_field)
     return directory
 
-def load_image_mappings():
-    """Load image type mappings from consolidated config.json"""
+@lru_cache(maxsize=1)
+def _load_image_mappings(version):
+    image_type_mappings = config.get('launchbox', {}).get('image_type_mappings', {})
+    
+    # Reverse lookups, built once here instead of for every game
+    field_to_launchbox_type = {}
+    launchbox_types_by_field = {}
+    for launchbox_type, gamelist_field in image_type_mappings.items():
+        field_to_launchbox_type[gamelist_field] = launchbox_type
+        launchbox_types_by_field.setdefault(gamelist_field, []).append(launchbox_type)
+    
     return {
-        'image_type_mappings': config.get('launchbox', {}).get('image_type_mappings', {}),
+        'image_type_mappings': image_type_mappings,
+        'field_to_launchbox_type': field_to_launchbox_type,
+        'launchbox_types_by_field': launchbox_types_by_field,
+        'launchbox_types': frozenset(field_to_launchbox_type.values()),
         'launchbox_image_base_url': config.get('launchbox', {}).get('image_base_url', 'https://images.launchbox-app.com/'),
         'download_settings': config.get('download', {})
     }
 
+def load_image_mappings():
+    """Load image type mappings from consolidated config.json"""
+    return _load_image_mappings(_config_version)
+
+@lru_cache(maxsize=1)
+def _load_region_config(version):
+    return config.get('launchbox', {}).get('region', {})
+
 def load_region_config():
     """Load region priority configuration from consolidated config.json"""
-    return config.get('launchbox', {}).get('region', {})
+    return _load_region_config(_config_version)
+
+
+# Request headers for LaunchBox image downloads (constant, shared by every request)
+_LAUNCHBOX_IMAGE_HEADERS = {
+    'accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
+    'accept-language': 'fr,en;q=0.9',
+    'cache-control': 'no-cache',
+    'dnt': '1',
+    'pragma': 'no-cache',
+    'priority': 'i',
+    'referer': 'https://gamesdb.launchbox-app.com/',
+    'sec-ch-ua': '"Not;A=Brand";v="99", "Google Chrome";v="139", "Chromium";v="139"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"Linux"',
+    'sec-fetch-dest': 'image',
+    'sec-fetch-mode': 'no-cors',
+    'sec-fetch-site': 'same-site',
+    'user-agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36'
+}
 
+def _write_file_bytes(path, data):
+    """Write data to path in one call (run through asyncio.to_thread by async downloaders)"""
+    with open(path, 'wb') as f:
+        f.write(data)
+
+def _unlink_if_exists(path):
+    """Remove path if it exists"""
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+def _copy_file_atomic(src_path, dst_path):
+    """Copy src_path to a new file and move it over dst_path, so readers never see a partial file"""
+    tmp_path = f"{dst_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        shutil.copyfile(src_path, tmp_path)
+        os.replace(tmp_path, dst_path)
+    except BaseException:
+        _unlink_if_exists(tmp_path)
+        raise
+
+def _add_to_image_cache(local_path, cache_path):
+    """Copy a freshly downloaded image into the LaunchBox image cache (best effort)"""
+    try:
+        _copy_file_atomic(local_path, cache_path)
+    except OSError as e:
+        print(f"Error caching image {cache_path}: {e}")
+
+def _copy_cached_image(cache_path, local_path):
+    """Place a copy of a cached LaunchBox image at local_path, return False if it is not cached"""
+    try:
+        if os.stat(cache_path).st_size == 0:
+            return False
+        # Media files are rewritten in place elsewhere, so they get their own copy, never a link
+        _copy_file_atomic(cache_path, local_path)
+    except FileNotFoundError:
+        return False
+    # Mark the entry as recently used for prune_launchbox_image_cache
+    try:
+        os.utime(cache_path)
+    except OSError:
+        pass
+    return True
+
+def prune_launchbox_image_cache(max_bytes=None):
+    """Evict the least recently used LaunchBox cache images until the cache fits in max_bytes"""
+    if max_bytes is None:
+        max_bytes = int(config.get('launchbox', {}).get('image_cache_max_mb', 2048)) * 1024 * 1024
+    entries = []
+    total = 0
+    with os.scandir(LAUNCHBOX_IMAGE_CACHE) as it:
+        for entry in it:
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, entry.path))
+            total += st.st_size
+    if total <= max_bytes:
+        return 0
+    removed = 0
+    for _, size, path in sorted(entries):
+        _unlink_if_exists(path)
+        total -= size
+        removed += 1
+        if total <= max_bytes:
+            break
+    return removed
+
+def _convert_downloaded_image(local_path, target_field, media_type, log_prefix):
+    """Convert a downloaded image if its field has a target_extension configured, return its final path"""
+    # Use target_field parameter if available, otherwise fall back to media_type
+    field_to_check = target_field if target_field else media_type
+    from game_utils import should_convert_field, convert_image_replace, needs_conversion
+    should_convert, target_extension = should_convert_field(field_to_check, config)
+    
+    if should_convert and needs_conversion(local_path, target_extension):
+        new_path, status = convert_image_replace(local_path, target_extension)
+        if status == "converted":
+            # Conversion successful, update path
+            local_path = new_path
+            app.logger.debug(f"{log_prefix} ✅ Converted to {target_extension}: {os.path.basename(local_path)}")
+        elif status == "already_target":
+            # File was already in target format, no conversion needed
+            app.logger.debug(f"{log_prefix} ✅ Already {target_extension} format: {os.path.basename(local_path)}")
+        else:
+            # Conversion failed
+            app.logger.warning(f"{log_prefix} ⚠️ Failed to convert to {target_extension}, keeping original: {os.path.basename(local_path)}")
+    elif should_convert:
+        # Field should be converted but file is already in target format
+        app.logger.debug(f"{log_prefix} ✅ Already {target_extension} format: {os.path.basename(local_path)}")
+    else:
+        # No conversion needed for this field
+        app.logger.debug(f"{log_prefix} ✅ No conversion needed for field: {field_to_check}")
+    return local_path
 
-async def download_launchbox_image_httpx(image_url, local_path, media_type=None, target_field=None, timeout=30, retry_attempts=10, client=None, game_name=None):
-    """Download a single image from LaunchBox using HTTPX with HTTP/2 support"""
+async def download_launchbox_image_httpx(image_url, local_path, media_type=None, target_field=None, timeout=30, retry_attempts=10, client=None, game_name=None, cache_path=None):
+    """Download a single image from LaunchBox using HTTPX with HTTP/2 support (target directory must exist)"""
     import time
-    import aiofiles
-    
-    headers = {
-        'accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-        'accept-language': 'fr,en;q=0.9',
-        'cache-control': 'no-cache',
-        'dnt': '1',
-        'pragma': 'no-cache',
-        'priority': 'i',
-        'referer': 'https://gamesdb.launchbox-app.com/',
-        'sec-ch-ua': '"Not;A=Brand";v="99", "Google Chrome";v="139", "Chromium";v="139"',
-        'sec-ch-ua-mobile': '?0',
-        'sec-ch-ua-platform': '"Linux"',
-        'sec-fetch-dest': 'image',
-        'sec-fetch-mode': 'no-cors',
-        'sec-fetch-site': 'same-site',
-        'user-agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36'
-    }
     
     filename = os.path.basename(local_path)
     media_info = f" [{media_type}]" if media_type else ""
@@ -4989,104 +5648,139 @@ async def download_launchbox_image_httpx(image_url, local_path, media_type=None,
     
     log_prefix = f"[{' | '.join(prefix_parts)}]" if prefix_parts else ""
     
-    print(f"DEBUG: {log_prefix} Starting download: {image_url} -> {local_path}")
+    app.logger.debug(f"{log_prefix} Starting download: {image_url} -> {local_path}")
     
     for attempt in range(retry_attempts):
         try:
             if attempt > 0:
-                import threading
-                threading.Thread(target=update_task_progress, args=(f"{log_prefix} 🔄 Retry {attempt + 1}/{retry_attempts}",), daemon=True).start()
-            
-            # Ensure directory exists
-            print(f"DEBUG: {log_prefix} Creating directory: {os.path.dirname(local_path)}")
-            os.makedirs(os.path.dirname(local_path), exist_ok=True)
+                queue_task_progress(f"{log_prefix} 🔄 Retry {attempt + 1}/{retry_attempts}")
             
             # Start timing for HTTP request with detailed metrics
             http_start_time = time.time()
-            import threading
-            threading.Thread(target=update_task_progress, args=(f"{log_prefix} ⏱️  Starting HTTPX HTTP/2 request to: {os.path.basename(image_url)} (attempt {attempt + 1}/{retry_attempts})",), daemon=True).start()
+            queue_task_progress(f"{log_prefix} ⏱️  Starting HTTPX HTTP/2 request to: {os.path.basename(image_url)} (attempt {attempt + 1}/{retry_attempts})")
             
-            print(f"DEBUG: {log_prefix} Making HTTP request to: {image_url}")
+            app.logger.debug(f"{log_prefix} Making HTTP request to: {image_url}")
             # Use HTTPX client for async download with HTTP/2
-            response = await client.get(image_url, headers=headers)
-            print(f"DEBUG: {log_prefix} HTTP response status: {response.status_code}")
+            response = await client.get(image_url, headers=_LAUNCHBOX_IMAGE_HEADERS)
+            app.logger.debug(f"{log_prefix} HTTP response status: {response.status_code}")
             response.raise_for_status()
             
             # Get file size from response headers if available
             content_length = response.headers.get('content-length')
             if content_length:
-                print(f"DEBUG: {log_prefix} Content-Length: {content_length} bytes")
-            
-            print(f"DEBUG: {log_prefix} Starting file write to: {local_path}")
-            # Download the file
-            bytes_written = 0
-            async with aiofiles.open(local_path, 'wb') as f:
-                async for chunk in response.aiter_bytes(chunk_size=8192):
-                    await f.write(chunk)
-                    bytes_written += len(chunk)
-            
-            print(f"DEBUG: {log_prefix} File write completed. Bytes written: {bytes_written}")
-            
-            # Verify file was created and has content
-            if os.path.exists(local_path):
-                file_size = os.path.getsize(local_path)
-                print(f"DEBUG: {log_prefix} File verification: exists={True}, size={file_size} bytes")
-                if file_size > 0:
-                    # Convert image if field has target_extension configured
-                    # Use target_field parameter if available, otherwise fall back to media_type
-                    field_to_check = target_field if target_field else media_type
-                    from game_utils import should_convert_field, convert_image_replace, needs_conversion
-                    should_convert, target_extension = should_convert_field(field_to_check, config)
-                    
-                    if should_convert and needs_conversion(local_path, target_extension):
-                        new_path, status = convert_image_replace(local_path, target_extension)
-                        if status == "converted":
-                            # Conversion successful, update path and filename
-                            local_path = new_path
-                            filename = os.path.basename(local_path)
-                            print(f"DEBUG: {log_prefix} ✅ Converted to {target_extension}: {filename}")
-                        elif status == "already_target":
-                            # File was already in target format, no conversion needed
-                            print(f"DEBUG: {log_prefix} ✅ Already {target_extension} format: {filename}")
-                        else:
-                            # Conversion failed
-                            print(f"DEBUG: {log_prefix} ⚠️ Failed to convert to {target_extension}, keeping original: {filename}")
-                    elif should_convert:
-                        # Field should be converted but file is already in target format
-                        print(f"DEBUG: {log_prefix} ✅ Already {target_extension} format: {filename}")
-                    else:
-                        # No conversion needed for this field
-                        print(f"DEBUG: {log_prefix} ✅ No conversion needed for field: {field_to_check}")
-                    
-                    print(f"DEBUG: {log_prefix} ✅ Download successful: {filename} ({file_size} bytes)")
-                    return True, f"Downloaded {filename} ({file_size} bytes)"
-                else:
-                    print(f"DEBUG: {log_prefix} ❌ File created but empty: {local_path}")
-                    return False, f"File created but empty: {filename}"
-            else:
-                print(f"DEBUG: {log_prefix} ❌ File not created: {local_path}")
+                app.logger.debug(f"{log_prefix} Content-Length: {content_length} bytes")
+            
+            app.logger.debug(f"{log_prefix} Starting file write to: {local_path}")
+            # client.get() has already read the whole body, so write it in one call on a worker
+            # thread instead of re-chunking it through aiofiles
+            data = response.content
+            await asyncio.to_thread(_write_file_bytes, local_path, data)
+            bytes_written = len(data)
+            
+            app.logger.debug(f"{log_prefix} File write completed. Bytes written: {bytes_written}")
+            
+            # Verify file was created and has content (one stat call)
+            try:
+                file_size = os.stat(local_path).st_size
+            except FileNotFoundError:
+                app.logger.warning(f"{log_prefix} ❌ File not created: {local_path}")
                 return False, f"File not created: {filename}"
+            app.logger.debug(f"{log_prefix} File verification: exists={True}, size={file_size} bytes")
+            if file_size == 0:
+                app.logger.warning(f"{log_prefix} ❌ File created but empty: {local_path}")
+                return False, f"File created but empty: {filename}"
+            
+            # Caching and conversion (ImageMagick) block, so they run on worker threads to keep
+            # the shared download loop free for the other games' transfers
+            if cache_path:
+                await asyncio.to_thread(_add_to_image_cache, local_path, cache_path)
+            
+            # Convert image if field has target_extension configured
+            local_path = await asyncio.to_thread(_convert_downloaded_image, local_path, target_field, media_type, log_prefix)
+            filename = os.path.basename(local_path)
+            
+            app.logger.debug(f"{log_prefix} ✅ Download successful: {filename} ({file_size} bytes)")
+            return True, f"Downloaded {filename} ({file_size} bytes)"
             
         except httpx.RequestError as e:
-            print(f"DEBUG: {log_prefix} HTTP request error: {e}")
+            app.logger.debug(f"{log_prefix} HTTP request error: {e}")
             if attempt < retry_attempts - 1:
                 # Exponential backoff: 1s, 2s, 4s, 8s, etc. (capped at 10s)
                 retry_delay = min(2 ** attempt, 10)
-                import threading
-                threading.Thread(target=update_task_progress, args=(f"{log_prefix} ⏳ Waiting {retry_delay}s before retry {attempt + 1}/{retry_attempts}",), daemon=True).start()
+                queue_task_progress(f"{log_prefix} ⏳ Waiting {retry_delay}s before retry {attempt + 1}/{retry_attempts}")
                 await asyncio.sleep(retry_delay)
             else:
-                print(f"DEBUG: {log_prefix} ❌ Connection failed after {retry_attempts} attempts: {e}")
+                app.logger.warning(f"{log_prefix} ❌ Connection failed after {retry_attempts} attempts: {e}")
                 return False, f"Connection failed after {retry_attempts} attempts: {e}"
         except Exception as e:
-            print(f"DEBUG: {log_prefix} ❌ Unexpected error: {e}")
+            app.logger.warning(f"{log_prefix} ❌ Unexpected error: {e}")
             import traceback
             traceback.print_exc()
             return False, f"Error: {e}"
     
-    print(f"DEBUG: {log_prefix} ❌ Failed after {retry_attempts} attempts")
+    app.logger.warning(f"{log_prefix} ❌ Failed after {retry_attempts} attempts")
     return False, f"Failed after {retry_attempts} attempts"
 
+# Common region mappings (earlier keys win when several appear in a game name)
+_REGION_MAPPINGS = {
+    # North America variations
+    'usa': 'North America',
+    'us': 'North America', 
+    'america': 'North America',
+    'north america': 'North America',
+    'na': 'North America',
+    'canada': 'North America',
+    'canadian': 'North America',
+    
+    # Europe variations
+    'europe': 'Europe',
+    'eu': 'Europe',
+    'european': 'Europe',
+    'uk': 'Europe',
+    'england': 'Europe',
+    'france': 'Europe',
+    'french': 'Europe',
+    'germany': 'Europe',
+    'german': 'Europe',
+    'italy': 'Europe',
+    'italian': 'Europe',
+    'spain': 'Europe',
+    'spanish': 'Europe',
+    'netherlands': 'Europe',
+    'dutch': 'Europe',
+    'sweden': 'Europe',
+    'swedish': 'Europe',
+    'norway': 'Europe',
+    'norwegian': 'Europe',
+    'denmark': 'Europe',
+    'danish': 'Europe',
+    'finland': 'Europe',
+    'finnish': 'Europe',
+    'poland': 'Europe',
+    'polish': 'Europe',
+    'russia': 'Europe',
+    'russian': 'Europe',
+    
+    # Japan variations
+    'japan': 'Japan',
+    'japanese': 'Japan',
+    'jp': 'Japan',
+    'jpn': 'Japan',
+    
+    # World variations
+    'world': 'World',
+    'international': 'World',
+    'intl': 'World',
+    'global': 'World'
+}
+
+_REGION_KEY_RANK = {key: rank for rank, key in enumerate(_REGION_MAPPINGS)}
+# Any region key as a whole word; longer keys first so 'north america' is not read as 'america'
+_REGION_KEY_RE = re.compile(
+    r'\b(' + '|'.join(map(re.escape, sorted(_REGION_MAPPINGS, key=len, reverse=True))) + r')\b'
+)
+_FIRST_PARENS_RE = re.compile(r'\(([^)]+)\)')
+
 def get_region_priority_from_game_name(game_name, default_priority):
     """
     Extract region information from game name (in parentheses) and adjust priority.
@@ -5097,93 +5791,33 @@ def get_region_priority_from_game_name(game_name, default_priority):
         default_priority: Default region priority list from config
     
     Returns:
-        List of regions in priority order, with detected region moved to front
+        Tuple of regions in priority order, with detected region moved to front
     """
+    return _region_priority_for_name(game_name, tuple(default_priority))
+
+@lru_cache(maxsize=4096)
+def _region_priority_for_name(game_name, default_priority):
+    """Cached body of get_region_priority_from_game_name (default_priority is a tuple)"""
     if not game_name:
         return default_priority
     
-    import re
-    
-    # Common region mappings
-    region_mappings = {
-        # North America variations
-        'usa': 'North America',
-        'us': 'North America', 
-        'america': 'North America',
-        'north america': 'North America',
-        'na': 'North America',
-        'canada': 'North America',
-        'canadian': 'North America',
-        
-        # Europe variations
-        'europe': 'Europe',
-        'eu': 'Europe',
-        'european': 'Europe',
-        'uk': 'Europe',
-        'england': 'Europe',
-        'france': 'Europe',
-        'french': 'Europe',
-        'germany': 'Europe',
-        'german': 'Europe',
-        'italy': 'Europe',
-        'italian': 'Europe',
-        'spain': 'Europe',
-        'spanish': 'Europe',
-        'netherlands': 'Europe',
-        'dutch': 'Europe',
-        'sweden': 'Europe',
-        'swedish': 'Europe',
-        'norway': 'Europe',
-        'norwegian': 'Europe',
-        'denmark': 'Europe',
-        'danish': 'Europe',
-        'finland': 'Europe',
-        'finnish': 'Europe',
-        'poland': 'Europe',
-        'polish': 'Europe',
-        'russia': 'Europe',
-        'russian': 'Europe',
-        
-        # Japan variations
-        'japan': 'Japan',
-        'japanese': 'Japan',
-        'jp': 'Japan',
-        'jpn': 'Japan',
-        
-        # World variations
-        'world': 'World',
-        'international': 'World',
-        'intl': 'World',
-        'global': 'World'
-    }
-    
     # Look for text in parentheses
-    parentheses_match = re.search(r'\(([^)]+)\)', game_name)
+    parentheses_match = _FIRST_PARENS_RE.search(game_name)
     if not parentheses_match:
         return default_priority
     
     region_text = parentheses_match.group(1).lower().strip()
     
-    # Try to find a matching region
-    detected_region = None
-    for key, region in region_mappings.items():
-        if key in region_text:
-            detected_region = region
-            break
+    # Try to find a matching region: one regex scan, then the highest-ranked key found
+    detected_keys = _REGION_KEY_RE.findall(region_text)
+    detected_region = _REGION_MAPPINGS[min(detected_keys, key=_REGION_KEY_RANK.__getitem__)] if detected_keys else None
     
     # If no region detected, return default priority
     if not detected_region:
         return default_priority
     
-    # Create new priority list with detected region moved to front
-    new_priority = [detected_region]
-    
-    # Add other regions in their original order, excluding the detected one
-    for region in default_priority:
-        if region != detected_region:
-            new_priority.append(region)
-    
-    return new_priority
+    # Detected region first, then the other regions in their original order
+    return (detected_region,) + tuple(region for region in default_priority if region != detected_region)
 
 async def get_game_images_from_launchbox_async(game_launchbox_id, image_config, system_path, rom_filename, game_name=None, current_game_data=None, force_download=False, media_config=None, region_config=None, selected_fields=None):
     """Get available images for a game from LaunchBox metadata and download them using aiohttp"""
@@ -5213,13 +5847,12 @@ async def get_game_images_from_launchbox_async(game_launchbox_id, image_config,
         fields_to_download = list(image_config.get('image_type_mappings', {}).values())
     
     # Filter fields based on selected_fields
-        # Create reverse mapping from gamelist field to LaunchBox image type
-        field_to_launchbox_type = {}
-        for launchbox_type, gamelist_field in image_config.get('image_type_mappings', {}).items():
-            field_to_launchbox_type[gamelist_field] = launchbox_type
+    if selected_fields:
+        # Reverse mapping from gamelist field to LaunchBox image type (built by load_image_mappings)
+        field_to_launchbox_type = image_config['field_to_launchbox_type']
         
         # Filter fields_to_download to only include selected media fields
-        selected_media_fields = [field for field in selected_fields if field in field_to_launchbox_type.values()]
+        selected_media_fields = set(selected_fields) & image_config['launchbox_types']
         fields_to_download = [field for field in fields_to_download if field_to_launchbox_type.get(field) in selected_media_fields]
     
     try:
@@ -5239,7 +5872,7 @@ async def get_game_images_from_launchbox_async(game_launchbox_id, image_config,
         all_game_images = (game_metadata or {}).get('images', [])
         
         # Use region configuration (already loaded at task start)
-        default_region_priority = region_config.get('priority', ['World', 'North America', 'Europe', 'Japan'])
+        default_region_priority = tuple(region_config.get('priority', ['World', 'North America', 'Europe', 'Japan']))
         
         # Try to extract region from game name and adjust priority
         region_priority = get_region_priority_from_game_name(game_name, default_region_priority)
@@ -5252,69 +5885,48 @@ async def get_game_images_from_launchbox_async(game_launchbox_id, image_config,
         
         # Filter GameImage entries to only include types that map to fields we need
         image_type_mappings = image_config.get('image_type_mappings', {})
+        launchbox_types_by_field = image_config['launchbox_types_by_field']
         needed_image_types = set()
-        
-        # Create reverse mapping from gamelist field to LaunchBox image type
-        field_to_launchbox_type = {}
-        for launchbox_type, gamelist_field in image_type_mappings.items():
-            if gamelist_field in fields_to_download:
-                needed_image_types.add(launchbox_type)
-                field_to_launchbox_type[gamelist_field] = launchbox_type
+        for gamelist_field in fields_to_download:
+            needed_image_types.update(launchbox_types_by_field.get(gamelist_field, ()))
         
         
         # Filter and group only the needed images by type
         images_by_type = {}
         filtered_count = 0
         
-        for game_image in all_game_images:
-            image_type = game_image.find('Type')
-            if image_type is None or not image_type.text:
-                continue
-                
-            image_type_text = image_type.text.strip()
-            
+        for image_type_text, filename_text, region_text in all_game_images:
             # Only process image types that map to fields we need
-            if image_type_text not in needed_image_types:
+            if image_type_text not in needed_image_types or not filename_text:
                 continue
-                
-            filename = game_image.find('FileName')
-            region = game_image.find('Region')
             
-            if filename is not None and filename.text:
-                filename_text = filename.text.strip()
-                region_text = region.text.strip() if region is not None and region.text else 'Unknown'
-                
-                if image_type_text not in images_by_type:
-                    images_by_type[image_type_text] = []
-                
-                images_by_type[image_type_text].append({
-                    'filename': filename_text,
-                    'region': region_text,
-                    'element': game_image
-                })
-                filtered_count += 1
+            if image_type_text not in images_by_type:
+                images_by_type[image_type_text] = []
+            
+            images_by_type[image_type_text].append({
+                'filename': filename_text,
+                'region': region_text
+            })
+            filtered_count += 1
         
         
         # Prepare download tasks for parallel execution
         download_tasks = []
         
+        # Region -> priority index, built once per game; unknown regions go last
+        region_rank = {region: index for index, region in enumerate(region_priority)}
+        unknown_rank = len(region_priority)
+        
         for i, (image_type_text, type_images) in enumerate(images_by_type.items()):
             # Map image type to gamelist field (we already know this mapping exists)
             gamelist_field = image_type_mappings.get(image_type_text)
             
-            # Sort images by region priority
-            sorted_images = []
-            for img in type_images:
-                try:
-                    region_index = region_priority.index(img['region'])
-                except ValueError:
-                    region_index = len(region_priority)  # Unknown regions go last
-                sorted_images.append((region_index, img))
-            
-            sorted_images.sort(key=lambda x: x[0])  # Sort by region priority index
-            
-            # Select the best image (first in priority order)
-            best_image = sorted_images[0][1]
+            # Select the best image by region priority (min keeps the first one on ties);
+            # most types only have one candidate, which needs no ranking at all
+            if len(type_images) == 1:
+                best_image = type_images[0]
+            else:
+                best_image = min(type_images, key=lambda img: region_rank.get(img['region'], unknown_rank))
             
             # Map gamelist field to media directory using new structure
             media_directory = get_media_directory(gamelist_field)
@@ -5329,10 +5941,6 @@ async def get_game_images_from_launchbox_async(game_launchbox_id, image_config,
             local_filename = f"{rom_filename}{file_extension}"
             local_path = os.path.join(system_path, 'media', media_directory, local_filename)
             
-            # Create media directory if it doesn't exist
-            media_dir = os.path.join(system_path, 'media', media_directory)
-            os.makedirs(media_dir, exist_ok=True)
-            
             # Add download task to the list
             download_tasks.append({
                 'gamelist_field': gamelist_field,
@@ -5348,82 +5956,69 @@ async def get_game_images_from_launchbox_async(game_launchbox_id, image_config,
             })
         
         
-        import threading
-        import queue
-        
-        # Create thread-safe queues for producer-consumer pattern
-        download_queue = queue.Queue()  # Producer fills this with download tasks
-        result_queue = queue.Queue()    # Consumer puts results here
-        shutdown_event = threading.Event()  # Signal to shutdown consumer thread
-        
-        # Create HTTPX client configuration with HTTP/2 support
-        limits = httpx.Limits(
-            max_connections=20,  # Total connection pool size
-            max_keepalive_connections=20,  # Max keepalive connections
-            keepalive_expiry=30.0  # Keepalive expiry in seconds
-        )
-        
-        timeout = httpx.Timeout(
-            timeout=60.0,  # Total timeout
-            connect=10.0,  # Connect timeout
-            read=30.0      # Read timeout
-        )
-        
-        # Create HTTPX headers for image downloads
-        headers = {
-            'accept': 'image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-            'accept-language': 'fr,en;q=0.9',
-            'cache-control': 'no-cache',
-            'dnt': '1',
-            'pragma': 'no-cache',
-            'priority': 'i',
-            'referer': 'https://gamesdb.launchbox-app.com/',
-            'sec-ch-ua': '"Not;A=Brand";v="99", "Google Chrome";v="139", "Chromium";v="139"',
-            'sec-ch-ua-mobile': '?0',
-            'sec-ch-ua-platform': '"Linux"',
-            'sec-fetch-dest': 'image',
-            'sec-fetch-mode': 'no-cors',
-            'sec-fetch-site': 'same-site',
-            'user-agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/139.0.0.0 Safari/537.36'
-        }
-        
-        # No authentication - use unauthenticated session
-        cookies = None
+        # Create each media directory once (several image types can share one), rather than
+        # once per task and again on every download attempt
+        for media_dir in {os.path.join(system_path, 'media', task['media_directory']) for task in download_tasks}:
+            os.makedirs(media_dir, exist_ok=True)
         
-        # Use global download manager instead of creating new consumer threads
-        from download_manager import get_download_manager
+        client = _get_launchbox_image_client()
         
-        download_manager = get_download_manager()
-        # Start the download manager with cookies if this is the first time
-        if cookies:
-            download_manager.start(cookies)
-
-        
-        # Add tasks to the global download manager
-        for task in download_tasks:
-            # Log download attempt asynchronously (non-blocking)
-            gamelist_field = task.get('gamelist_field', 'unknown')
-            region = task.get('region', 'unknown')
-            filename = task.get('filename', 'unknown')
-            # Use threading for non-blocking logging
-            import threading
-            log_message = f"{game_prefix} Downloading {gamelist_field} ('{region}')"
-            threading.Thread(target=update_task_progress, args=(log_message,), daemon=True).start()
-            download_manager.add_task(task)
+        async def download_single_image(task):
+            """Download one image task and return its result in download manager format"""
+            gamelist_field = task['gamelist_field']
+            if is_task_stopped():
+                return {
+                    'success': False,
+                    'gamelist_field': gamelist_field,
+                    'local_path': task['local_path'],
+                    'message': 'Task stopped by user'
+                }
+            
+            # Images shared between games (e.g. regional variants) are only downloaded once
+            cache_path = os.path.join(LAUNCHBOX_IMAGE_CACHE, os.path.basename(task['filename']))
+            if await asyncio.to_thread(_copy_cached_image, cache_path, task['local_path']):
+                queue_task_progress(f"{game_prefix} Reusing cached {gamelist_field} ('{task['region']}')")
+                log_prefix = f"[{task['game_name']} | {task['media_type']}]"
+                local_path = await asyncio.to_thread(_convert_downloaded_image, task['local_path'], task['target_field'], task['media_type'], log_prefix)
+                return {
+                    'success': True,
+                    'gamelist_field': gamelist_field,
+                    'local_path': f'./media/{task["media_directory"]}/{task["local_filename"]}',
+                    'message': f"Reused cached {os.path.basename(local_path)}"
+                }
+            
+            queue_task_progress(f"{game_prefix} Downloading {gamelist_field} ('{task['region']}')")
+            success, message = await download_launchbox_image_httpx(
+                task['download_url'], task['local_path'], media_type=task['media_type'],
+                target_field=task['target_field'], client=client, game_name=task['game_name'],
+                cache_path=cache_path
+            )
+            return {
+                'success': success,
+                'gamelist_field': gamelist_field,
+                'local_path': f'./media/{task["media_directory"]}/{task["local_filename"]}',
+                'message': message
+            }
         
+        # Run every download of this game concurrently on the shared HTTP/2 client (streams
+        # are multiplexed over one connection), checking for a stop request every second
+        futures = [asyncio.ensure_future(download_single_image(task)) for task in download_tasks]
+        pending = set(futures)
+        while pending:
+            _, pending = await asyncio.wait(pending, timeout=1)
+            if pending and is_task_stopped():
+                queue_task_progress("🛑 Task stopped by user - cancelling image downloads")
+                for future in pending:
+                    future.cancel()
+                await asyncio.gather(*pending, return_exceptions=True)
+                return []
         
-        # Collect results from the global download manager with stop checking
         results = []
-        try:
-            results = download_manager.wait_for_completion(len(download_tasks))
-        except Exception as e:
-            if is_task_stopped():
-                import threading
-                threading.Thread(target=update_task_progress, args=("🛑 Task stopped by user - stopping download manager",), daemon=True).start()
-                download_manager.stop()
-                return []
+        for future in futures:
+            if future.exception() is not None:
+                print(f"❌ Download error: {future.exception()}")
             else:
-                raise e
+                results.append(future.result())
         
         # Process results
         for result in results:
@@ -5442,10 +6037,8 @@ async def get_game_images_from_launchbox_async(game_launchbox_id, image_config,
                 # Log failure message asynchronously (non-blocking)
                 gamelist_field = result.get('gamelist_field', 'unknown')
                 error_message = result.get('message', 'Unknown error')
-                # Use threading for non-blocking logging
-                import threading
                 log_message = f"{game_prefix} ❌ Failed: {error_message}"
-                threading.Thread(target=update_task_progress, args=(log_message,), daemon=True).start()
+                queue_task_progress(log_message)
         
         return downloaded_images
         
@@ -5453,28 +6046,68 @@ async def get_game_images_from_launchbox_async(game_launchbox_id, image_config,
         print(f"Error processing LaunchBox images for game {game_launchbox_id}: {e}")
         if game_name or rom_filename:
             game_prefix = f"[{game_name or rom_filename}]"
-            import threading
-            threading.Thread(target=update_task_progress, args=(f"{game_prefix} ❌ Error: {e}",), daemon=True).start()
+            queue_task_progress(f"{game_prefix} ❌ Error: {e}")
         return downloaded_images
 
+# Background event loop shared by every LaunchBox image download (started lazily)
+_launchbox_image_loop = None
+_launchbox_image_loop_lock = threading.Lock()
+# HTTP/2 client bound to _launchbox_image_loop, reused across games so connections stay warm
+_launchbox_image_client = None
+
+def _get_launchbox_image_loop():
+    """Get the background event loop used for LaunchBox image downloads, starting it if needed"""
+    global _launchbox_image_loop, _launchbox_image_client
+    loop = _launchbox_image_loop
+    if loop is None or loop.is_closed():
+        with _launchbox_image_loop_lock:
+            loop = _launchbox_image_loop
+            if loop is None or loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name='launchbox-images', daemon=True).start()
+                _launchbox_image_client = None
+                _launchbox_image_loop = loop
+    return loop
+
+def _get_launchbox_image_client():
+    """Get the HTTP/2 client for LaunchBox images (must be called from the background loop)"""
+    global _launchbox_image_client
+    client = _launchbox_image_client
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=30.0),
+            timeout=httpx.Timeout(timeout=60.0, connect=10.0, read=30.0),
+            http2=True,
+            follow_redirects=True
+        )
+        _launchbox_image_client = client
+    return client
+
 def get_game_images_from_launchbox(game_launchbox_id, image_config, system_path, rom_filename, game_name=None, current_game_data=None, force_download=False, media_config=None, region_config=None, selected_fields=None):
     """Synchronous wrapper for get_game_images_from_launchbox_async"""
-    import asyncio
-    
-    # Create a new event loop for this thread if needed
-    try:
-        loop = asyncio.get_event_loop()
-    except RuntimeError:
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-    
-    # Run the async function in the event loop
-    return loop.run_until_complete(
+    # Run on the shared background loop; concurrent callers' downloads interleave on it
+    return asyncio.run_coroutine_threadsafe(
         get_game_images_from_launchbox_async(
             game_launchbox_id, image_config, system_path, rom_filename, 
             game_name, current_game_data, force_download, media_config, region_config, selected_fields
-        )
-    )
+        ),
+        _get_launchbox_image_loop()
+    ).result()
+
+# Prefix of the gamelist media paths managed by the media scan
+_MEDIA_PATH_PREFIX = './media/'
+
+def _list_media_dir_names(media_dir):
+    """Return {casefolded stem: {casefolded extension: file name}} for a media directory (empty if missing)"""
+    names = {}
+    try:
+        with os.scandir(media_dir) as entries:
+            for entry in entries:
+                stem, ext = os.path.splitext(entry.name.casefold())
+                names.setdefault(stem, {})[ext] = entry.name
+    except (FileNotFoundError, NotADirectoryError):
+        pass
+    return names
 
 def scan_media_files(system_name):
     """Scan media files for a specific system and update gamelist.xml"""
@@ -5520,18 +6153,82 @@ def scan_media_files(system_name):
         media_fields = media_config.get('media_fields', {})
         task.update_progress(f"Media fields: {media_fields}")
         
-        # Track changes
+        # Track changes (counted per game, reported every 100 games instead of one log line each)
         updated_games = 0
         removed_media = 0
+        added_fields = 0
+        converted_fields = 0
+        updated_media = 0
+        recent_changes = []  # first few changes, logged with the final summary
+        max_recent_changes = 20
         
         # Check media directory structure
         media_base_dir = os.path.join(system_path, 'media')
         task.update_progress(f"Media base directory: {media_base_dir}")
-        if os.path.exists(media_base_dir):
-            task.update_progress(f"Media base directory exists, contents: {os.listdir(media_base_dir)}")
-        else:
+        try:
+            with os.scandir(media_base_dir) as entries:
+                media_base_names = {entry.name for entry in entries}
+            task.update_progress(f"Media base directory exists, contents: {sorted(media_base_names)}")
+        except (FileNotFoundError, NotADirectoryError):
+            media_base_names = set()
             task.update_progress(f"Media base directory does not exist: {media_base_dir}")
         
+        # List each media directory once; the per-game checks below are then dict lookups
+        # instead of one stat call per game, field and extension. Names are indexed by
+        # casefolded stem and extension so 'Game.PNG' matches the '.png' extension (as it would
+        # on a case-insensitive filesystem); the actual file name is used for the gamelist path.
+        media_dir_entries = {}
+        media_types_to_scan = []
+        for field_data in media_fields.values():
+            media_type = field_data['directory']
+            if media_type not in media_dir_entries:
+                # Directories missing from the media base directory listing above are skipped
+                media_dir_entries[media_type] = {}
+                if media_type.split('/', 1)[0] in media_base_names:
+                    media_types_to_scan.append(media_type)
+        
+        # The directories are independent and listing them is I/O bound (slow on network
+        # shares), so list them concurrently
+        if media_types_to_scan:
+            with ThreadPoolExecutor(max_workers=min(8, len(media_types_to_scan))) as executor:
+                media_dir_entries.update(zip(media_types_to_scan, executor.map(
+                    _list_media_dir_names,
+                    [os.path.join(media_base_dir, media_type) for media_type in media_types_to_scan]
+                )))
+        
+        # Per-field lookup data, resolved once instead of for every game
+        media_field_info = [
+            (gamelist_field, field_data['directory'],
+             tuple(ext.casefold() for ext in field_data.get('extensions', [])),
+             media_dir_entries[field_data['directory']])
+            for gamelist_field, field_data in media_fields.items()
+        ]
+        
+        # Fields handled by the media field loop are either set to a found file or cleared there,
+        # so only the remaining scraper fields need the orphaned media check
+        orphan_check_fields = tuple(field for field in _SCRAPER_MEDIA_FIELDS if field not in media_fields)
+        
+        # Every file under media/, as 'media/<dir>/<file>' paths, for the orphaned media check
+        # (not needed at all when every scraper field is a configured media field)
+        existing_media = set()
+        if orphan_check_fields:
+            # Symlinked media directories are followed, but each directory is only listed once,
+            # so a link pointing back up the tree cannot make the walk loop
+            visited_dirs = set()
+            for dir_path, dir_names, file_names in os.walk(media_base_dir, followlinks=True):
+                try:
+                    dir_stat = os.stat(dir_path)
+                except OSError:
+                    dir_names[:] = []
+                    continue
+                dir_key = (dir_stat.st_dev, dir_stat.st_ino)
+                if dir_key in visited_dirs:
+                    dir_names[:] = []
+                    continue
+                visited_dirs.add(dir_key)
+                relative_dir = os.path.relpath(dir_path, system_path).replace(os.sep, '/')
+                existing_media.update(f'{relative_dir}/{file_name}' for file_name in file_names)
+        
         # Process each game
         for i, game in enumerate(games):
             game_updated = False
@@ -5542,41 +6239,31 @@ def scan_media_files(system_name):
             
             # Extract ROM filename without extension
             rom_filename = os.path.splitext(os.path.basename(rom_path))[0]
+            rom_filename_key = rom_filename.casefold()
             
             # Ensure all expected media fields exist in the game data
             # Use the same field names that the scraper expects (from consolidated config.json)
-            scraper_media_fields = ['image', 'video', 'marquee', 'wheel', 'boxart', 'thumbnail', 'screenshot', 'cartridge', 'fanart', 'titleshot', 'manual', 'boxback', 'extra1', 'mix']
-            missing_fields = []
-            none_fields = []
-            
-            for field in scraper_media_fields:
+            for field in _SCRAPER_MEDIA_FIELDS:
                 if field not in game:
                     game[field] = ''  # Initialize missing media fields as empty
                     game_updated = True
-                    missing_fields.append(field)
+                    added_fields += 1
                 elif game[field] is None:
                     game[field] = ''  # Convert None to empty string
                     game_updated = True
-                    none_fields.append(field)
-            
-            # Log grouped messages for missing fields
-            if missing_fields:
-                task.update_progress(f"Added missing media fields for '{game.get('name', 'Unknown')}': {', '.join(missing_fields)}")
-            if none_fields:
-                task.update_progress(f"Converted None to empty string for fields in '{game.get('name', 'Unknown')}': {', '.join(none_fields)}")
+                    converted_fields += 1
             
             # Check each media field
-            for gamelist_field, field_data in media_fields.items():
-                media_type = field_data['directory']
-                media_dir = os.path.join(system_path, 'media', media_type)
-                
-                # Look for media files with matching name
+            for gamelist_field, media_type, extensions, media_dir_names in media_field_info:
+                # Look for media files with matching name (first configured extension wins);
+                # files of other games (or a missing directory) give no candidates at all
                 found_media = None
-                if os.path.exists(media_dir):
-                    for ext in field_data.get('extensions', []):
-                        media_file = os.path.join(media_dir, rom_filename + ext)
-                        if os.path.exists(media_file):
-                            found_media = f'./media/{media_type}/{rom_filename}{ext}'
+                media_files_by_ext = media_dir_names.get(rom_filename_key)
+                if media_files_by_ext:
+                    for ext in extensions:
+                        media_file_name = media_files_by_ext.get(ext)
+                        if media_file_name:
+                            found_media = f'./media/{media_type}/{media_file_name}'
                             break
                 
                 # Update gamelist field - only update if the path actually changes
@@ -5586,55 +6273,68 @@ def scan_media_files(system_name):
                     if current_media != found_media:
                         game[gamelist_field] = found_media
                         game_updated = True
-                        # Always log media updates, regardless of game number
-                        task.update_progress(f"Updated {gamelist_field} for '{game.get('name', 'Unknown')}': {found_media}")
+                        updated_media += 1
+                        if len(recent_changes) < max_recent_changes:
+                            recent_changes.append(f"Updated {gamelist_field} for '{game.get('name', 'Unknown')}': {found_media}")
                 elif current_media:
                     # Remove media reference if file doesn't exist (regardless of whether directory exists)
                     game[gamelist_field] = ''  # Set to empty string to preserve the field
                     game_updated = True
                     removed_media += 1
-                    # Always log media removals, regardless of game number
-                    task.update_progress(f"Removed {gamelist_field} for '{game.get('name', 'Unknown')}': {current_media}")
+                    if len(recent_changes) < max_recent_changes:
+                        recent_changes.append(f"Removed {gamelist_field} for '{game.get('name', 'Unknown')}': {current_media}")
             
             # Also check for orphaned media entries that might not be in the media_fields
             # This handles cases where the gamelist has media fields that aren't in the current config
-            orphaned_media_fields = ['image', 'video', 'marquee', 'wheel', 'boxart', 'thumbnail', 'screenshot', 'cartridge', 'fanart', 'titleshot', 'manual', 'boxback', 'extra1', 'mix']
-            
-            for field in orphaned_media_fields:
-                if field in game and game[field]:
+            for field in orphan_check_fields:
+                if game[field]:  # every scraper media field was initialized above
                     # Check if this media file actually exists
                     media_path = game[field]
-                    if media_path.startswith('./media/'):
+                    if media_path.startswith(_MEDIA_PATH_PREFIX):
                         # Extract the relative path and check if file exists
                         relative_path = media_path[2:]  # Remove './'
-                        full_path = os.path.join(system_path, relative_path)
-                        if not os.path.exists(full_path):
+                        if '//' in relative_path or '/.' in relative_path or relative_path.endswith('/'):
+                            # Only unusual paths need normalizing to match existing_media
+                            relative_path = posixpath.normpath(relative_path)
+                        if relative_path not in existing_media:
                             # Media file doesn't exist, remove the reference
                             game[field] = ''
                             game_updated = True
                             removed_media += 1
-                            task.update_progress(f"Removed orphaned {field} for '{game.get('name', 'Unknown')}': {media_path}")
+                            if len(recent_changes) < max_recent_changes:
+                                recent_changes.append(f"Removed orphaned {field} for '{game.get('name', 'Unknown')}': {media_path}")
             
             if game_updated:
                 updated_games += 1
             
             # Add progress indicator every 100 games
             if (i + 1) % 100 == 0:
-                task.update_progress(f"Processed {i + 1} / {len(games)} games...")
-        
+                task.update_progress(f"Processed {i + 1} / {len(games)} games... "
+                                     f"(updated media: {updated_media}, removed media: {removed_media}, "
+                                     f"added fields: {added_fields}, None fields cleared: {converted_fields})")
+        
+        for change in recent_changes:
+            task.update_progress(change)
+        if updated_media + removed_media > len(recent_changes):
+            task.update_progress(f"... and {updated_media + removed_media - len(recent_changes)} more media changes")
+        task.update_progress(f"Added {added_fields} missing media fields, converted {converted_fields} None fields to empty strings")
         task.update_progress(f"Scan completed. Updated {updated_games} games, removed {removed_media} invalid media references.")
         
-        # Always save the gamelist (even if no updates, to ensure consistency)
-        try:
-            write_gamelist_xml(games, gamelist_path)
-            task.update_progress("Gamelist saved successfully")
-            
-            # Notify all connected clients about the gamelist update
-            notify_gamelist_updated(system_name, len(games))
-            
-        except Exception as e:
-            task.update_progress(f"ERROR saving gamelist: {e}")
-            return {'error': f'Failed to save gamelist: {str(e)}'}
+        # Save the gamelist only if the scan changed something (or it has duplicate entries
+        # that writing would drop); rewriting an unchanged gamelist is pure overhead
+        if updated_games or _dedupe_games_by_path(games) is not games:
+            try:
+                write_gamelist_xml(games, gamelist_path)
+                task.update_progress("Gamelist saved successfully")
+                
+                # Notify all connected clients about the gamelist update
+                notify_gamelist_updated(system_name, len(games))
+                
+            except Exception as e:
+                task.update_progress(f"ERROR saving gamelist: {e}")
+                return {'error': f'Failed to save gamelist: {str(e)}'}
+        else:
+            task.update_progress("No changes; skipping gamelist save")
         
         return {
             'success': True,
@@ -5651,6 +6351,16 @@ def scan_media_files(system_name):
         
         return {'error': f'Media scan failed: {str(e)}'}
 
+# Fields written by save_gamelist_xml even when empty (media fields plus a few id/url fields)
+_SAVE_GAMELIST_ALWAYS_FIELDS = frozenset((*_SCRAPER_MEDIA_FIELDS, 'youtubeurl', 'steamgridid'))
+
+def _escape_gamelist_text(value):
+    """html.escape a gamelist value for save_gamelist_xml, skipping the work when not needed"""
+    text = value if value.__class__ is str else str(value)
+    if '&' in text or '<' in text or '>' in text:
+        return html.escape(text, quote=False)
+    return text
+
 def save_gamelist_xml(file_path, games):
     """Save games list to gamelist.xml file"""
     try:
@@ -5659,47 +6369,40 @@ def save_gamelist_xml(file_path, games):
         # Deduplicate by path before saving to avoid duplicate entries
         games = _dedupe_games_by_path(games)
 
-        # Create root element
-        root = ET.Element('gameList')
-        
-        # Add each game
-        for i, game in enumerate(games):
-            game_elem = ET.SubElement(root, 'game')
-            
-            # Add all fields - include empty values for media fields to ensure they're saved
-            for field, value in game.items():
-                # Always include media-related fields, even if empty
-                if field in ['image', 'video', 'marquee', 'wheel', 'boxart', 'thumbnail', 'screenshot', 'cartridge', 'fanart', 'titleshot', 'manual', 'boxback', 'extra1', 'mix', 'youtubeurl', 'steamgridid']:
-                    elem = ET.SubElement(game_elem, field)
-                    elem.text = html.escape(str(value), quote=False) if value else ''
-                elif value:  # For non-media fields, only add if they have values
-                    elem = ET.SubElement(game_elem, field)
-                    # Properly escape XML characters
-                    elem.text = html.escape(str(value), quote=False)
-        
-        # Create XML tree and save
-        tree = ET.ElementTree(root)
-        
-        # Create backup before saving
-        backup_path = file_path + '.backup.' + str(int(time.time()))
-        if os.path.exists(file_path):
-            import shutil
-            shutil.copy2(file_path, backup_path)
+        # Create backup before saving (rolling, see backup_gamelist)
+        backup_path = backup_gamelist(file_path)
+        if backup_path:
             print(f"Created backup: {backup_path}")
         
-        # Save the file with proper formatting
-        # First write to a temporary string to get the raw XML
-        import io
-        xml_string = io.BytesIO()
-        tree.write(xml_string, encoding='utf-8', xml_declaration=True)
-        xml_content = xml_string.getvalue().decode('utf-8')
-        
-        # Format the XML content for better readability
-        formatted_xml = format_xml_for_readability(xml_content)
-        
-        # Write the formatted XML to file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(formatted_xml)
+        # Stream the file one <game> element at a time with lxml's incremental writer instead
+        # of building (and serializing) the whole tree in memory; the output is the same as
+        # pretty-printing the full tree. It is written next to the gamelist and swapped in
+        # with os.replace, so a failed save never leaves a truncated gamelist behind.
+        with replace_gamelist_file(file_path) as f:
+            with ET.xmlfile(f, encoding='UTF-8') as xf:
+                xf.write_declaration()
+                with xf.element('gameList'):
+                    xf.write('\n')
+                    for game in games:
+                        game_elem = ET.Element('game')
+                        
+                        # Add all fields - include empty values for media fields to ensure they're saved
+                        for field, value in game.items():
+                            # Always include media-related fields, even if empty
+                            if field in _SAVE_GAMELIST_ALWAYS_FIELDS:
+                                elem = ET.SubElement(game_elem, field)
+                                # Empty media fields serialize as <field/>
+                                elem.text = _escape_gamelist_text(value) if value else None
+                            elif value:  # For non-media fields, only add if they have values
+                                elem = ET.SubElement(game_elem, field)
+                                # Properly escape XML characters
+                                elem.text = _escape_gamelist_text(value)
+                        
+                        ET.indent(game_elem, space='  ', level=1)
+                        xf.write('  ')
+                        xf.write(game_elem)
+                        xf.write('\n')
+            f.write(b'\n')
         print(f"Successfully saved gamelist.xml with {len(games)} games")
         
         # Verify the file was written
@@ -5715,50 +6418,19 @@ def save_gamelist_xml(file_path, games):
         traceback.print_exc()
         raise
 
-def format_xml_for_readability(xml_content):
-    """Format XML content to be more human-readable with proper line breaks and indentation using lxml's pretty_print"""
-    try:
-        # Parse the XML content (remove encoding declaration for lxml compatibility)
-        xml_content_clean = xml_content
-        if xml_content.startswith('<?xml'):
-            # Find the end of the XML declaration
-            end_decl = xml_content.find('?>')
-            if end_decl != -1:
-                xml_content_clean = xml_content[end_decl + 2:].strip()
-        
-        # Parse XML and use lxml's pretty_print
-        from lxml import etree
-        root = etree.XML(xml_content_clean)
-        
-        # Use BytesIO to get proper XML declaration with pretty_print
-        import io
-        xml_bytes = io.BytesIO()
-        etree.ElementTree(root).write(xml_bytes, pretty_print=True, encoding='utf-8', xml_declaration=True)
-        formatted_xml = xml_bytes.getvalue().decode('utf-8')
-        
-        return formatted_xml
-        
-    except Exception as e:
-        print(f"Error formatting XML: {e}")
-        # Return original content if formatting fails
-        return xml_content
-
-
 def save_formatted_gamelist_xml(tree, gamelist_path):
-    """Save gamelist.xml with proper formatting using the common formatting function"""
+    """Save gamelist.xml with proper formatting using lxml's pretty_print"""
     try:
-        # Write to a temporary string to get the raw XML
-        import io
-        xml_bytes = io.BytesIO()
-        tree.write(xml_bytes, encoding='utf-8', xml_declaration=True)
-        xml_content = xml_bytes.getvalue().decode('utf-8')
+        # Empty texts serialize as <field/>, like the serialize/re-parse round trip used to do
+        for elem in tree.iter():
+            if elem.text == '':
+                elem.text = None
         
-        # Format the XML content for better readability
-        formatted_xml = format_xml_for_readability(xml_content)
-        
-        # Write the formatted XML to file
-        with open(gamelist_path, 'w', encoding='utf-8') as f:
-            f.write(formatted_xml)
+        # Serialize once with pretty_print instead of serializing, re-parsing and serializing again
+        xml_bytes = ET.tostring(tree, encoding='UTF-8', xml_declaration=True, pretty_print=True)
+        with open(gamelist_path, 'wb') as f:
+            f.write(xml_bytes)
+        invalidate_gamelist_cache(gamelist_path)
             
         print(f"Successfully saved formatted gamelist.xml to {gamelist_path}")
         
@@ -5830,12 +6502,9 @@ def cache_statistics_endpoint():
 @login_required
 def reload_cache_endpoint():
     """Reload the metadata cache"""
-    global global_metadata_cache_loaded, global_metadata_cache
-    
     try:
         # Clear the cache
-        global_metadata_cache_loaded = False
-        global_metadata_cache = {}
+        reset_metadata_cache()
         
         # Reload the cache
         result = load_metadata_cache()
@@ -5915,7 +6584,6 @@ def update_metadata_endpoint():
     """Update metadata.xml to the latest version from Launchbox"""
     try:
         import zipfile
-        import tempfile
         
         # Get absolute path and ensure directory exists
         metadata_path = get_launchbox_metadata_path()
@@ -5926,58 +6594,77 @@ def update_metadata_endpoint():
         # Download the latest metadata
         metadata_url = 'http://gamesdb.launchbox-app.com/Metadata.zip'
         
-        # Create temporary directory for download
-        with tempfile.TemporaryDirectory() as temp_dir:
-            zip_path = os.path.join(temp_dir, 'Metadata.zip')
-            
+        # Download next to Metadata.xml (no temporary directory); the current Metadata.xml is
+        # only replaced once the new one has been fully and successfully extracted
+        zip_path = metadata_path + '.new'
+        tmp_metadata_path = metadata_path + '.tmp'
+        try:
             # Download the zip file
             response = requests.get(metadata_url, stream=True)
             response.raise_for_status()
             
             with open(zip_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
+                for chunk in response.iter_content(chunk_size=1 << 20):
                     f.write(chunk)
             
-            # Extract the zip file
+            # Copy Metadata.xml straight out of the zip (opening the zip validates its directory,
+            # reading the member checks its CRC, so a truncated download fails here)
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                print(f"DEBUG: Zip contents: {zip_ref.namelist()}")
-                zip_ref.extractall(temp_dir)
-                print(f"DEBUG: Extracted files in temp_dir: {os.listdir(temp_dir)}")
-            
-            # Look specifically for Metadata.xml file
-            metadata_xml_path = os.path.join(temp_dir, 'Metadata.xml')
-            if not os.path.exists(metadata_xml_path):
-                # Fallback: look for any XML file if Metadata.xml not found
-                metadata_files = [f for f in os.listdir(temp_dir) if f.endswith('.xml')]
-                if not metadata_files:
-                    return jsonify({'error': 'No Metadata.xml or XML file found in downloaded zip'}), 400
-                extracted_metadata = os.path.join(temp_dir, metadata_files[0])
-                print(f"DEBUG: Using fallback XML file: {metadata_files[0]}")
-            else:
-                extracted_metadata = metadata_xml_path
-                print(f"DEBUG: Found Metadata.xml file")
-            
-            # Backup existing metadata if it exists
+                zip_names = zip_ref.namelist()
+                print(f"DEBUG: Zip contents: {zip_names}")
+                
+                # Look specifically for Metadata.xml file
+                if 'Metadata.xml' in zip_names:
+                    member_name = 'Metadata.xml'
+                    print(f"DEBUG: Found Metadata.xml file")
+                else:
+                    # Fallback: look for any top-level XML file if Metadata.xml not found
+                    metadata_files = [name for name in zip_names if name.endswith('.xml') and '/' not in name]
+                    if not metadata_files:
+                        return jsonify({'error': 'No Metadata.xml or XML file found in downloaded zip'}), 400
+                    member_name = metadata_files[0]
+                    print(f"DEBUG: Using fallback XML file: {member_name}")
+                
+                with zip_ref.open(member_name) as src, open(tmp_metadata_path, 'wb') as dst:
+                    shutil.copyfileobj(src, dst, 1 << 20)
+            
+            # Backup existing metadata if it exists (a hard link: the old file is replaced, not
+            # rewritten, so the backup doesn't need a copy of its data)
+            backup_created = False
             if os.path.exists(metadata_path):
                 backup_path = f"{metadata_path}.backup.{int(time.time())}"
-                shutil.copy2(metadata_path, backup_path)
-            
-            # Copy the new metadata file
-            shutil.copy2(extracted_metadata, metadata_path)
-            
-            # Clear the cache to force reload
-            global global_metadata_cache_loaded, global_metadata_cache
-            global_metadata_cache_loaded = False
-            global_metadata_cache = {}
-            
-            # Clear the LaunchBox platforms cache since metadata was updated
-            clear_launchbox_platforms_cache()
+                try:
+                    os.link(metadata_path, backup_path)
+                except OSError:
+                    shutil.copy2(metadata_path, backup_path)
+                backup_created = True
             
-            return jsonify({
-                'success': True,
-                'message': 'Metadata.xml updated successfully',
-                'backup_created': os.path.exists(backup_path) if 'backup_path' in locals() else False
-            })
+            # Swap the new metadata file in
+            os.replace(tmp_metadata_path, metadata_path)
+        finally:
+            _unlink_if_exists(zip_path)
+            _unlink_if_exists(tmp_metadata_path)
+        
+        # Clear the cache and the LaunchBox platforms cache since metadata was updated
+        reset_metadata_cache()
+        clear_launchbox_platforms_cache()
+        
+        # Rebuild the cache from the new file right away, in the background (as at startup);
+        # requests arriving meanwhile wait for this load instead of starting another one
+        def reload_cache_background():
+            try:
+                load_metadata_cache()
+                print("✅ Metadata cache reloaded after update")
+            except Exception as e:
+                print(f"❌ Metadata cache reload failed: {e}")
+        
+        threading.Thread(target=reload_cache_background, daemon=True).start()
+        
+        return jsonify({
+            'success': True,
+            'message': 'Metadata.xml updated successfully',
+            'backup_created': backup_created
+        })
             
     except Exception as e:
         app.logger.error(f'Error updating metadata: {str(e)}')
@@ -6049,16 +6736,13 @@ def upload_game_media(system_name):
         if not os.path.exists(gamelist_path):
             return jsonify({'error': 'Gamelist not found'}), 404
         
-        # Parse gamelist to find the game
-        games = parse_gamelist_xml(gamelist_path)
-        
         # Get ROM path from form data
         rom_path = request.form.get('rom_path')
         if not rom_path:
             return jsonify({'error': 'ROM path not provided'}), 400
         
-        # Find game by ROM path
-        game = next((g for g in games if g.get('path') == rom_path), None)
+        # Find game by ROM path (indexed cached parse, or a streaming scan of the file)
+        game, games_count = find_gamelist_game(gamelist_path, rom_path)
         if not game:
             return jsonify({'error': f'Game not found with ROM path: {rom_path}'}), 404
         
@@ -6107,8 +6791,9 @@ def upload_game_media(system_name):
             file_path = os.path.join(category_dir, new_filename)
             counter += 1
         
-        # Save the uploaded file
-        file.save(file_path)
+        # Save the uploaded file (large copy buffer: uploads are mostly images and videos)
+        with open(file_path, 'wb') as dst:
+            shutil.copyfileobj(file.stream, dst, 1 << 20)
         
         # Convert image if field has target_extension configured
         from game_utils import should_convert_field, convert_image_replace, needs_conversion
@@ -6138,11 +6823,21 @@ def upload_game_media(system_name):
         relative_path = os.path.relpath(file_path, system_path)
         game[media_field] = relative_path
         
-        # Update the gamelist.xml file
-        write_gamelist_xml(games, gamelist_path)
+        # Update the gamelist.xml file (only this game's field)
+        try:
+            updated = update_gamelist_game_field(gamelist_path, rom_path, media_field, relative_path)
+        except (ET.XMLSyntaxError, OSError) as e:
+            # Don't leave the upload behind when it cannot be referenced from gamelist.xml
+            _unlink_if_exists(file_path)
+            app.logger.error(f'Could not update {gamelist_path} for uploaded media: {e}')
+            return jsonify({'error': f'Failed to update gamelist.xml: {str(e)}'}), 500
+        if not updated:
+            # The game was found above, so gamelist.xml changed underneath this request
+            _unlink_if_exists(file_path)
+            return jsonify({'error': f'Game no longer in gamelist.xml: {rom_path}'}), 409
         
         # Notify all connected clients about the gamelist update
-        notify_gamelist_updated(system_name, len(games))
+        notify_gamelist_updated(system_name, games_count)
         notify_game_updated(system_name, game.get('name', 'Unknown'), [media_field])
         
         # Log the upload
@@ -6232,8 +6927,9 @@ def delete_frame_image():
         data = request.get_json()
         frame_path = data.get('frame_path')
         
-        print(f"Delete frame image request data: {data}")
-        print(f"Original frame_path: {frame_path}")
+        if app.logger.isEnabledFor(logging.DEBUG):
+            app.logger.debug("Delete frame image request data: %s", data)
+            app.logger.debug("Original frame_path: %s", frame_path)
         
         if not frame_path:
             return jsonify({'error': 'Missing frame_path parameter'}), 400
@@ -6247,23 +6943,46 @@ def delete_frame_image():
             # If it's already a relative path (from extract-first-frame), just join with ROMS_FOLDER
             frame_path = os.path.join(ROMS_FOLDER, frame_path)
         
-        print(f"Converted frame_path: {frame_path}")
-        print(f"ROMS_FOLDER: {ROMS_FOLDER}")
+        app.logger.debug("Converted frame_path: %s (ROMS_FOLDER: %s)", frame_path, ROMS_FOLDER)
         
-        # Check if file exists and delete it
-        if os.path.exists(frame_path):
+        # Delete the file; a missing file is reported by remove itself (no separate exists check)
+        try:
             os.remove(frame_path)
-            print(f"Deleted frame image: {frame_path}")
+            app.logger.info("Deleted frame image: %s", frame_path)
             return jsonify({'success': True, 'message': 'Frame image deleted successfully'})
-        else:
-            print(f"Frame image not found: {frame_path}")
-            print(f"File exists check failed for: {frame_path}")
+        except FileNotFoundError:
+            app.logger.debug("Frame image not found: %s", frame_path)
             return jsonify({'success': True, 'message': 'Frame image not found (already deleted)'})
             
     except Exception as e:
-        print(f"Error deleting frame image: {e}")
+        app.logger.error("Error deleting frame image: %s", e)
         return jsonify({'error': str(e)}), 500
 
+# Manual crop jobs (task_id, task_data), run one at a time by a long-lived worker thread
+# instead of one ffmpeg-running thread per request
+_manual_crop_queue = queue.Queue()
+_manual_crop_thread = None
+_manual_crop_lock = threading.Lock()
+
+def _manual_crop_consumer():
+    """Run queued manual crop jobs until a None sentinel is received"""
+    for job in iter(_manual_crop_queue.get, None):
+        try:
+            run_manual_crop_task(*job)
+        except Exception as e:
+            print(f"Error running queued manual crop: {e}")
+
+def queue_manual_crop_task(task_id, task_data):
+    """Queue a manual crop job for the crop worker thread"""
+    global _manual_crop_thread
+    # Started lazily (and restarted after a fork) so every process gets its own worker
+    if _manual_crop_thread is None or not _manual_crop_thread.is_alive():
+        with _manual_crop_lock:
+            if _manual_crop_thread is None or not _manual_crop_thread.is_alive():
+                _manual_crop_thread = threading.Thread(target=_manual_crop_consumer, name='manual-crop', daemon=True)
+                _manual_crop_thread.start()
+    _manual_crop_queue.put((task_id, task_data))
+
 @app.route('/api/apply-manual-crop', methods=['POST'])
 @login_required
 def apply_manual_crop():
@@ -6276,21 +6995,18 @@ def apply_manual_crop():
         system_name = data.get('system_name')
         rom_file = data.get('rom_file')
         
-        # Debug: Log received parameters
-        print(f"Manual crop API received data: {data}")
-        print(f"video_path: {video_path}")
-        print(f"crop_dimensions: {crop_dimensions}")
-        print(f"game_id: {game_id}")
-        print(f"system_name: {system_name}")
-        print(f"rom_file: {rom_file}")
-        
-        if not all([video_path, crop_dimensions, game_id, system_name, rom_file]):
-            missing_params = []
-            if not video_path: missing_params.append('video_path')
-            if not crop_dimensions: missing_params.append('crop_dimensions')
-            if not game_id: missing_params.append('game_id')
-            if not system_name: missing_params.append('system_name')
-            if not rom_file: missing_params.append('rom_file')
+        # Debug: Log received parameters (formatting the payload only when debug logging is on)
+        if app.logger.isEnabledFor(logging.DEBUG):
+            app.logger.debug("Manual crop API received data: %s", data)
+        
+        missing_params = [name for name, value in (
+            ('video_path', video_path),
+            ('crop_dimensions', crop_dimensions),
+            ('game_id', game_id),
+            ('system_name', system_name),
+            ('rom_file', rom_file)
+        ) if not value]
+        if missing_params:
             return jsonify({'error': f'Missing required parameters: {missing_params}'}), 400
         
         # Convert web path to file system path if needed
@@ -6298,7 +7014,7 @@ def apply_manual_crop():
             # Convert /roms/system/path to actual file system path
             video_path = os.path.join(ROMS_FOLDER, video_path[6:])  # Remove '/roms/' prefix
         
-        print(f"Applying manual crop to video path: {video_path}")
+        app.logger.debug("Applying manual crop to video path: %s", video_path)
         
         # Check if video file exists
         if not os.path.exists(video_path):
@@ -6317,10 +7033,8 @@ def apply_manual_crop():
         current_task_id = task.id
         task.start()
         
-        # Start manual crop in background thread
-        thread = threading.Thread(target=run_manual_crop_task, args=(task.id, task_data))
-        thread.daemon = True
-        thread.start()
+        # Hand the crop to the crop worker thread
+        queue_manual_crop_task(task.id, task_data)
         
         return jsonify({
             'success': True,
@@ -6330,9 +7044,7 @@ def apply_manual_crop():
         })
         
     except Exception as e:
-        print(f"Manual crop error: {e}")
-        import traceback
-        traceback.print_exc()
+        app.logger.exception("Manual crop error: %s", e)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/rom-system/<system_name>/game/delete-media', methods=['POST'])
@@ -6355,22 +7067,22 @@ def delete_game_media(system_name):
         if not data:
             return jsonify({'error': 'No JSON data provided'}), 400
         
-        # Parse gamelist to find the game
-        games = parse_gamelist_xml(gamelist_path)
-        
         # Use ROM path as primary identifier (more reliable than ID)
         rom_path = data.get('rom_path')
         if not rom_path:
             return jsonify({'error': 'ROM path not provided'}), 400
         
-        # Find game by ROM path
-        game = next((g for g in games if g.get('path') == rom_path), None)
+        # Stream the gamelist to find the game by ROM path, without building every game dict
+        game, games_count = find_gamelist_game(gamelist_path, rom_path)
         if not game:
             return jsonify({'error': f'Game not found with ROM path: {rom_path}'}), 404
         
         media_field = data.get('media_field')
         if not media_field:
             return jsonify({'error': 'Media field not specified'}), 400
+        # Only media fields point at files that may be deleted (never e.g. the ROM path)
+        if not is_media_field(media_field):
+            return jsonify({'error': f'Invalid media field: {media_field}'}), 400
         
         # Check if the media field exists for this game
         if media_field not in game or not game[media_field]:
@@ -6382,22 +7094,22 @@ def delete_game_media(system_name):
         # Construct full path to the media file
         full_media_path = os.path.join(system_path, media_path)
         
-        # Delete the physical file if it exists
-        if os.path.exists(full_media_path):
-            try:
-                os.remove(full_media_path)
-                app.logger.info(f'Deleted media file: {full_media_path}')
-            except Exception as e:
-                app.logger.warning(f'Could not delete physical file {full_media_path}: {str(e)}')
+        # Clear the media field in gamelist.xml first, touching only this game's element
+        if not update_gamelist_game_field(gamelist_path, rom_path, media_field, None):
+            # The game was found above, so gamelist.xml changed underneath this request
+            return jsonify({'error': f'Game no longer in gamelist.xml: {rom_path}'}), 409
         
-        # Clear the media field in the game object
-        game[media_field] = ''
-        
-        # Update the gamelist.xml file
-        write_gamelist_xml(games, gamelist_path)
+        # Delete the physical file if it exists
+        try:
+            os.remove(full_media_path)
+            app.logger.info(f'Deleted media file: {full_media_path}')
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            app.logger.warning(f'Could not delete physical file {full_media_path}: {str(e)}')
         
         # Notify all connected clients about the gamelist update
-        notify_gamelist_updated(system_name, len(games))
+        notify_gamelist_updated(system_name, games_count)
         notify_game_updated(system_name, game.get('name', 'Unknown'), [media_field])
         
         # Log the deletion
@@ -6455,6 +7167,10 @@ def delete_game_media_batch(system_name):
         failed_fields = []
         
         for media_field in media_fields:
+            if not is_media_field(media_field):
+                failed_fields.append(f'{media_field}: Invalid media field')
+                continue
+            
             # Check if the media field exists for this game
             if media_field not in game or not game[media_field]:
                 failed_fields.append(f'{media_field}: No media found')
@@ -6467,14 +7183,15 @@ def delete_game_media_batch(system_name):
             full_media_path = os.path.join(system_path, media_path)
             
             # Delete the physical file if it exists
-            if os.path.exists(full_media_path):
-                try:
-                    os.remove(full_media_path)
-                    app.logger.info(f'Deleted media file: {full_media_path}')
-                except Exception as e:
-                    app.logger.warning(f'Could not delete physical file {full_media_path}: {str(e)}')
-                    failed_fields.append(f'{media_field}: Could not delete file')
-                    continue
+            try:
+                os.remove(full_media_path)
+                app.logger.info(f'Deleted media file: {full_media_path}')
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                app.logger.warning(f'Could not delete physical file {full_media_path}: {str(e)}')
+                failed_fields.append(f'{media_field}: Could not delete file')
+                continue
             
             # Clear the media field in the game object
             game[media_field] = ''
@@ -6508,7 +7225,7 @@ def get_task_status():
     global current_task_id
     if current_task_id and current_task_id in tasks:
         task = tasks[current_task_id]
-        return jsonify(task.to_dict())
+        return fast_json_response(task.to_dict())
     else:
         return jsonify({
             'status': 'idle',
@@ -6530,7 +7247,7 @@ def get_task_queue():
 @login_required
 def get_tasks():
     """Get all tasks"""
-    return jsonify(get_all_tasks())
+    return fast_json_response(get_all_tasks())
 
 @app.route('/api/tasks/<task_id>')
 @login_required
@@ -6538,7 +7255,7 @@ def get_task_by_id(task_id):
     """Get a specific task by ID"""
     task = get_task(task_id)
     if task:
-        return jsonify(task.to_dict())
+        return fast_json_response(task.to_dict())
     return jsonify({'error': 'Task not found'}), 404
 
 @app.route('/api/tasks/<task_id>/log')
@@ -6547,7 +7264,7 @@ def get_task_log_by_id(task_id):
     """Get the log content for a specific task"""
     log_content = get_task_log(task_id)
     if log_content is not None:
-        return jsonify({'log': log_content})
+        return fast_json_response({'log': log_content})
     return jsonify({'error': 'Task or log not found'}), 404
 
 @app.route('/api/tasks/<task_id>/log/stream')
@@ -6557,48 +7274,77 @@ def stream_task_log(task_id):
     def generate():
         task = tasks.get(task_id)
         if not task:
-            yield f"data: {json.dumps({'error': 'Task not found'})}\n\n"
+            yield sse_frame({'error': 'Task not found'})
             return
         
         if task.status != TASK_STATUS_RUNNING:
-            yield f"data: {json.dumps({'error': 'Task is not running'})}\n\n"
+            yield sse_frame({'error': 'Task is not running'})
+            return
+        
+        # Take the log version before reading, so appends made while reading still wake us up
+        watcher = get_task_log_watcher(task_id)
+        log_cond = watcher[0]
+        with log_cond:
+            seen_version = watcher[1]
+        
+        # Keep the log open for the whole stream: after the initial read, each read() only
+        # returns what was appended since, instead of re-reading the whole file
+        try:
+            log_f = open(task.log_file, 'r', encoding='utf-8')
+        except Exception as e:
+            yield sse_frame({'error': f'Error reading log file: {e}'})
             return
         
         # Send initial log content
-        initial_log = get_task_log(task_id)
+        initial_log = log_f.read()
         if initial_log:
-            yield f"data: {json.dumps({'log': initial_log, 'type': 'initial'})}\n\n"
+            yield sse_frame({'log': initial_log, 'type': 'initial'})
         
         # Stream live updates with rate limiting and batching
-        last_log_length = len(initial_log) if initial_log else 0
         last_update_time = time.time()
         min_update_interval = 0.2  # Minimum 200ms between updates
         
         try:
             while task.status == TASK_STATUS_RUNNING:
-                current_time = time.time()
-                current_log = get_task_log(task_id)
-                
-                if current_log and len(current_log) > last_log_length:
-                    # Check if enough time has passed since last update
-                    if current_time - last_update_time >= min_update_interval:
-                        # New log content available - send update
-                        new_content = current_log[last_log_length:]
-                        yield f"data: {json.dumps({'log': new_content, 'type': 'update'})}\n\n"
-                        last_log_length = len(current_log)
-                        last_update_time = current_time
-                
-                time.sleep(0.1)  # Check every 100ms for responsiveness
+                # Block until the log is appended to or the task ends (the timeout is only a
+                # safety net for writers that don't notify)
+                with log_cond:
+                    log_cond.wait_for(
+                        lambda: watcher[1] != seen_version or task.status != TASK_STATUS_RUNNING,
+                        timeout=1.0
+                    )
+                    seen_version = watcher[1]
+                
+                # Batch bursts of log lines into one update per min_update_interval; appends
+                # made meanwhile just accumulate in the file and go out in the same read, and
+                # the end of the task cuts the wait short
+                delay = last_update_time + min_update_interval - time.time()
+                if delay > 0:
+                    with log_cond:
+                        log_cond.wait_for(lambda: task.status != TASK_STATUS_RUNNING, timeout=delay)
+                
+                new_content = log_f.read()
+                if new_content:
+                    # New log content available - send update
+                    yield sse_frame({'log': new_content, 'type': 'update'})
+                    last_update_time = time.time()
+                elif time.time() - last_update_time >= SSE_HEARTBEAT_INTERVAL:
+                    # Quiet task: probe the connection so a closed client ends this stream
+                    yield SSE_HEARTBEAT
+                    last_update_time = time.time()
         except GeneratorExit:
             # Client disconnected
             return
+        finally:
+            log_f.close()
         
         # Send final log content
         final_log = get_task_log(task_id)
         if final_log:
-            yield f"data: {json.dumps({'log': final_log, 'type': 'final'})}\n\n"
+            yield sse_frame({'log': final_log, 'type': 'final'})
     
-    return Response(generate(), mimetype='text/event-stream')
+    # Frames are passed straight through to the server, unbuffered
+    return Response(generate(), mimetype='text/event-stream', direct_passthrough=True)
 
 @app.route('/api/tasks/<task_id>/log/download')
 @login_required
@@ -6613,23 +7359,35 @@ def download_task_log(task_id):
     if not log_file_path or not os.path.exists(log_file_path):
         return jsonify({'error': 'Log file not found'}), 404
     
-    # Get task details for filename
-    task_type = getattr(task, 'type', 'unknown')
-    task_start_time = getattr(task, 'start_time', None)
-    
-    # Create a descriptive filename
-    if task_start_time:
-        timestamp = datetime.fromtimestamp(task_start_time).strftime('%Y%m%d_%H%M%S')
-        filename = f"task-{task_type}-{task_id}-{timestamp}.log"
-    else:
-        filename = f"task-{task_type}-{task_id}.log"
-    
-    # Send the file directly
+    # Create a descriptive filename (built once the task has started: type and start time
+    # don't change after that)
+    filename = getattr(task, '_download_name', None)
+    if filename is None:
+        task_type = getattr(task, 'type', 'unknown')
+        task_start_time = getattr(task, 'start_time', None)
+        if task_start_time:
+            timestamp = time.strftime('%Y%m%d_%H%M%S', time.localtime(task_start_time))
+            filename = f"task-{task_type}-{task_id}-{timestamp}.log"
+            task._download_name = filename
+        else:
+            filename = f"task-{task_type}-{task_id}.log"
+    
+    # Behind nginx, let it serve the file from an internal location (sendfile, no copy
+    # through this process) when server.task_logs_accel_redirect is configured
+    accel_redirect = config.get('server', {}).get('task_logs_accel_redirect')
+    if accel_redirect:
+        response = app.response_class(mimetype='text/plain')
+        response.headers['X-Accel-Redirect'] = f"{accel_redirect.rstrip('/')}/{os.path.basename(log_file_path)}"
+        response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+    
+    # Send the file directly (conditional: ETag/Last-Modified and Range requests are honored)
     return send_file(
         log_file_path,
         as_attachment=True,
         download_name=filename,
-        mimetype='text/plain'
+        mimetype='text/plain',
+        conditional=True
     )
 
 @app.route('/api/tasks/cleanup', methods=['POST'])
@@ -6652,55 +7410,172 @@ def ack_task_refresh(task_id):
     """Acknowledge that a client has processed the grid refresh for a completed task.
     This clears grid_refresh_needed to avoid repeated auto-refreshes in new sessions."""
     try:
-        task = tasks.get(task_id)
-        if not task:
-            return jsonify({'error': 'Task not found'}), 404
-        # Only clear for completed/error/idle tasks
-        if task.status in [TASK_STATUS_COMPLETED, TASK_STATUS_ERROR, TASK_STATUS_STOPPED, TASK_STATUS_IDLE]:
-            task.grid_refresh_needed = False
+        with _tasks_lock:
+            task = tasks.get(task_id)
+            if not task:
+                return jsonify({'error': 'Task not found'}), 404
+            # Only clear for completed/error/idle tasks
+            if task.status in [TASK_STATUS_COMPLETED, TASK_STATUS_ERROR, TASK_STATUS_STOPPED, TASK_STATUS_IDLE]:
+                task.grid_refresh_needed = False
         return jsonify({'success': True, 'task_id': task_id, 'grid_refresh_needed': task.grid_refresh_needed})
     except Exception as e:
         return jsonify({'error': f'Failed to acknowledge task refresh: {str(e)}'}), 500
 
+# Task log summaries: log path -> (st_mtime_ns, st_size, summary)
+_task_log_summary_cache = {}
+
+def get_task_summary_path(log_path):
+    """Get the path of the summary sidecar stored next to a task log"""
+    return log_path[:-len('.log')] + '.summary.json'
+
+def _load_task_summary_sidecar(log_path, st):
+    """Load the summary sidecar of a task log, if it was written for the log as it is now"""
+    try:
+        with open(get_task_summary_path(log_path), 'rb') as f:
+            sidecar = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if sidecar.get('log_mtime_ns') != st.st_mtime_ns or sidecar.get('log_size') != st.st_size:
+        return None
+    return sidecar.get('summary')
+
+def _write_task_summary_sidecar(log_path, st, summary):
+    """Store a task log summary next to the log so it survives restarts"""
+    summary_path = get_task_summary_path(log_path)
+    tmp_path = f"{summary_path}.tmp.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps({'log_mtime_ns': st.st_mtime_ns, 'log_size': st.st_size, 'summary': summary}))
+        os.replace(tmp_path, summary_path)
+    except Exception as e:
+        print(f"Error writing task summary {summary_path}: {e}")
+        _unlink_if_exists(tmp_path)
+
+def _iter_log_line_values(mm, prefix):
+    """Yield the rest of every line of a mapped log that starts with prefix (bytes)"""
+    needle = b'\n' + prefix
+    if mm[:len(prefix)] == prefix:
+        pos = 0
+    else:
+        pos = mm.find(needle)
+        if pos == -1:
+            return
+        pos += 1
+    while True:
+        start = pos + len(prefix)
+        end = mm.find(b'\n', start)
+        if end == -1:
+            end = len(mm)
+        yield mm[start:end]
+        # The newline ending this line is where a following matching line's needle starts
+        pos = mm.find(needle, end)
+        if pos == -1:
+            return
+        pos += 1
+
+def summarize_task_log(log_path, st=None):
+    """Reconstruct a task summary from the JSON lines of its log (cached until the log changes)"""
+    if st is None:
+        st = os.stat(log_path)
+    cached = _task_log_summary_cache.get(log_path)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+    
+    # After a restart, the sidecar spares re-reading logs that did not change since
+    summary = _load_task_summary_sidecar(log_path, st)
+    if summary is not None:
+        _task_log_summary_cache[log_path] = (st.st_mtime_ns, st.st_size, summary)
+        return summary
+    
+    summary = {
+        'type': None,
+        'system_name': None,
+        'progress_percentage': 0,
+        'current_step': 0,
+        'total_steps': 0,
+        'stats': {},
+        'status': None,
+        'start_time': None,
+        'end_time': None,
+    }
+    stats = summary['stats']
+    if st.st_size == 0:
+        json_lines = ()
+    else:
+        # Jump from one 'Type: '/'JSON: ' line to the next in the mapped file instead of
+        # decoding and splitting every line of the log
+        with open(log_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for value in _iter_log_line_values(mm, b'Type: '):
+                    summary['type'] = value.strip().decode('utf-8', errors='replace')
+                json_lines = list(_iter_log_line_values(mm, b'JSON: '))
+    for line in json_lines:
+        try:
+            obj = orjson.loads(line)
+        except Exception:
+            continue
+        # times
+        ts = obj.get('ts')
+        if ts:
+            if summary['start_time'] is None:
+                summary['start_time'] = ts
+            summary['end_time'] = ts
+        # core fields
+        summary['system_name'] = obj.get('system_name') or summary['system_name']
+        summary['progress_percentage'] = obj.get('progress_percentage', summary['progress_percentage'])
+        summary['current_step'] = obj.get('current_step', summary['current_step'])
+        summary['total_steps'] = obj.get('total_steps', summary['total_steps'])
+        if obj.get('stats'):
+            try:
+                stats.update(obj['stats'])
+            except Exception:
+                pass
+        summary['status'] = obj.get('status', summary['status'])
+    
+    _task_log_summary_cache[log_path] = (st.st_mtime_ns, st.st_size, summary)
+    _write_task_summary_sidecar(log_path, st, summary)
+    return summary
+
+def record_task_summary(task):
+    """Write the summary sidecar of a finished task from its in-memory state, so its log never has to be parsed"""
+    try:
+        st = os.stat(task.log_file)
+    except OSError:
+        return
+    summary = {
+        'type': task.type,
+        'system_name': task.data.get('system_name') if task.data else None,
+        'progress_percentage': task.progress_percentage,
+        'current_step': task.current_step,
+        'total_steps': task.total_steps,
+        'stats': dict(task.stats),
+        'status': task.status,
+        'start_time': task.start_time,
+        'end_time': task.end_time,
+    }
+    _task_log_summary_cache[task.log_file] = (st.st_mtime_ns, st.st_size, summary)
+    _write_task_summary_sidecar(task.log_file, st, summary)
+
 @app.route('/api/tasks/<task_id>/reconstruct', methods=['GET'])
 @login_required
 def reconstruct_task_from_log(task_id):
     """Reconstruct key task fields (system, steps, progress) from its log file."""
     try:
         log_path = os.path.join(LOGS_DIR, f"{task_id}.log")
-        if not os.path.exists(log_path):
+        try:
+            st = os.stat(log_path)
+        except OSError:
             return jsonify({'error': 'Log file not found'}), 404
-        system_name = None
-        progress_percentage = 0
-        current_step = 0
-        total_steps = 0
-        stats = {}
-        status = None
-        with open(log_path, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if not line.startswith('JSON: '):
-                    continue
-                try:
-                    obj = json.loads(line[6:])
-                except Exception:
-                    continue
-                system_name = obj.get('system_name') or system_name
-                progress_percentage = obj.get('progress_percentage', progress_percentage)
-                current_step = obj.get('current_step', current_step)
-                total_steps = obj.get('total_steps', total_steps)
-                if obj.get('stats'):
-                    stats.update(obj['stats'])
-                status = obj.get('status', status)
+        summary = summarize_task_log(log_path, st)
         return jsonify({
             'success': True,
             'task_id': task_id,
-            'system_name': system_name,
-            'progress_percentage': progress_percentage,
-            'current_step': current_step,
-            'total_steps': total_steps,
-            'stats': stats,
-            'status': status,
+            'system_name': summary['system_name'],
+            'progress_percentage': summary['progress_percentage'],
+            'current_step': summary['current_step'],
+            'total_steps': summary['total_steps'],
+            'stats': summary['stats'],
+            'status': summary['status'],
         })
     except Exception as e:
         return jsonify({'error': f'Failed to reconstruct task: {str(e)}'}), 500
@@ -6712,64 +7587,52 @@ def get_task_history():
     try:
         results = {}
         if not os.path.exists(LOGS_DIR):
-            return jsonify(results)
-        for fname in os.listdir(LOGS_DIR):
-            if not fname.endswith('.log'):
-                continue
-            task_id = fname[:-4]
-            log_path = os.path.join(LOGS_DIR, fname)
-            type_hint = None
-            system_name = None
-            progress_percentage = 0
-            current_step = 0
-            total_steps = 0
-            stats = {}
-            status = None
-            start_ts = None
-            end_ts = None
+            return fast_json_response(results)
+        log_entries = []
+        summary_paths = []
+        with os.scandir(LOGS_DIR) as it:
+            for entry in it:
+                if entry.name.endswith('.summary.json'):
+                    summary_paths.append(entry.path)
+                elif entry.name.endswith('.log'):
+                    log_entries.append(entry)
+        log_paths = {entry.path for entry in log_entries}
+        
+        def summarize(entry):
+            # Only logs that changed since the last call are read again
             try:
-                with open(log_path, 'r', encoding='utf-8') as f:
-                    for line in f:
-                        if line.startswith('Type: '):
-                            type_hint = line.split('Type: ', 1)[1].strip()
-                        if not line.startswith('JSON: '):
-                            continue
-                        try:
-                            obj = json.loads(line[6:])
-                        except Exception:
-                            continue
-                        # times
-                        ts = obj.get('ts')
-                        if ts:
-                            if start_ts is None:
-                                start_ts = ts
-                            end_ts = ts
-                        # core fields
-                        system_name = obj.get('system_name') or system_name
-                        progress_percentage = obj.get('progress_percentage', progress_percentage)
-                        current_step = obj.get('current_step', current_step)
-                        total_steps = obj.get('total_steps', total_steps)
-                        if obj.get('stats'):
-                            try:
-                                stats.update(obj['stats'])
-                            except Exception:
-                                pass
-                        status = obj.get('status', status)
-                results[task_id] = {
-                    'id': task_id,
-                    'type': type_hint,
-                    'status': status or 'completed',
-                    'data': {'system_name': system_name} if system_name else {},
-                    'progress_percentage': progress_percentage,
-                    'current_step': current_step,
-                    'total_steps': total_steps,
-                    'stats': stats,
-                    'start_time': start_ts,
-                    'end_time': end_ts,
-                }
+                return summarize_task_log(entry.path, entry.stat())
             except Exception:
+                return None
+        
+        # Logs that have to be (re)read are scanned concurrently
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(log_entries)))) as executor:
+            summaries = list(executor.map(summarize, log_entries))
+        
+        for entry, summary in zip(log_entries, summaries):
+            if summary is None:
                 continue
-        return jsonify(results)
+            task_id = entry.name[:-4]
+            system_name = summary['system_name']
+            results[task_id] = {
+                'id': task_id,
+                'type': summary['type'],
+                'status': summary['status'] or 'completed',
+                'data': {'system_name': system_name} if system_name else {},
+                'progress_percentage': summary['progress_percentage'],
+                'current_step': summary['current_step'],
+                'total_steps': summary['total_steps'],
+                'stats': summary['stats'],
+                'start_time': summary['start_time'],
+                'end_time': summary['end_time'],
+            }
+        # Forget summaries of deleted logs
+        for log_path in [p for p in _task_log_summary_cache if p not in log_paths]:
+            _task_log_summary_cache.pop(log_path, None)
+        for summary_path in summary_paths:
+            if summary_path[:-len('.summary.json')] + '.log' not in log_paths:
+                _unlink_if_exists(summary_path)
+        return fast_json_response(results)
     except Exception as e:
         return jsonify({'error': f'Failed to read task history: {str(e)}'}), 500
 
@@ -6779,13 +7642,22 @@ def stop_task_endpoint(task_id):
     """Stop a running task"""
     global tasks, current_task_id
     
-    if task_id not in tasks:
-        return jsonify({'error': 'Task not found'}), 404
-    
-    task = tasks[task_id]
-    
-    if task.status != TASK_STATUS_RUNNING:
-        return jsonify({'error': 'Task is not running'}), 400
+    # Claim the stop under the lock, so concurrent stop requests don't both go through
+    with _tasks_lock:
+        task = tasks.get(task_id)
+        if task is None:
+            return jsonify({'error': 'Task not found'}), 404
+        if task.status != TASK_STATUS_RUNNING:
+            return jsonify({'error': 'Task is not running'}), 400
+        if getattr(task, 'stop_requested', False):
+            # Repeated clicks while the task winds down are not an error
+            return jsonify({
+                'success': True,
+                'message': 'Stop already requested',
+                'grid_reload_needed': False,
+                'system_name': task.data.get('system_name') if task.data else None
+            })
+        task.stop_requested = True
     
     try:
         # Do not write from the main process; the worker will flush partial changes
@@ -6810,16 +7682,7 @@ def stop_task_endpoint(task_id):
             except Exception as e:
                 print(f"Warning: could not set Steam cancellation event: {e}")
         
-        # For image download tasks, immediately stop the download manager
-        if task.type == 'image_download':
-            try:
-                from download_manager import get_download_manager
-                download_manager = get_download_manager()
-                if download_manager:
-                    task.update_progress("🛑 Stopping download manager immediately")
-                    download_manager.stop()
-            except Exception as e:
-                task.update_progress(f"⚠️  Warning: Could not stop download manager: {e}")
+        # Image download tasks cancel their active downloads as soon as they see the stop request
         
         # For IGDB scraping tasks, we need to handle cancellation differently
         # since they use their own separate process and cancel map
@@ -6898,11 +7761,9 @@ def stop_task_endpoint(task_id):
             task.update_progress("🛑 Stop requested - task will complete gracefully")
         
         # If this was the current running task, clear it
-        if current_task_id == task_id:
-            current_task_id = None
-        
-        # Clean up any stuck tasks
-        cleanup_stuck_tasks()
+        with _tasks_lock:
+            if current_task_id == task_id:
+                current_task_id = None
         
         # Process next queued task if any
         process_next_queued_task()
@@ -6923,8 +7784,41 @@ def stop_task_endpoint(task_id):
             'system_name': task.data.get('system_name') if task.data else None
         })
     except Exception as e:
+        # Let the user retry the stop
+        with _tasks_lock:
+            task.stop_requested = False
         return jsonify({'error': f'Failed to stop task: {str(e)}'}), 500
 
+# YouTube search results: query -> (expiry time, sorted videos), least recently used first
+_youtube_search_cache = OrderedDict()
+_youtube_search_cache_lock = threading.Lock()
+_YOUTUBE_SEARCH_CACHE_TTL = 600
+_YOUTUBE_SEARCH_CACHE_SIZE = 256
+
+# ytInitialData markers, as searched for by extract_from_yt_initial_data
+_YT_INITIAL_DATA_START = b'var ytInitialData = '
+_YT_INITIAL_DATA_END = b';</script>'
+
+def read_youtube_results_page(response, chunk_size=65536):
+    """Read a streamed YouTube results page only until its ytInitialData script is complete
+
+    Returns (bytes read so far, iterator over the rest of the page).
+    """
+    chunks = response.iter_content(chunk_size=chunk_size)
+    page = bytearray()
+    data_start = -1
+    for chunk in chunks:
+        scan_from = len(page)
+        page += chunk
+        if data_start == -1:
+            data_start = page.find(_YT_INITIAL_DATA_START, max(0, scan_from - len(_YT_INITIAL_DATA_START)))
+            if data_start == -1:
+                continue
+            scan_from = data_start + len(_YT_INITIAL_DATA_START)
+        if page.find(_YT_INITIAL_DATA_END, max(data_start + len(_YT_INITIAL_DATA_START), scan_from - len(_YT_INITIAL_DATA_END))) != -1:
+            break
+    return page, chunks
+
 @app.route('/api/youtube/search', methods=['POST'])
 @login_required
 def youtube_search():
@@ -6936,7 +7830,39 @@ def youtube_search():
         if not search_query:
             return jsonify({'error': 'Search query is required'}), 400
         
-        print(f"Searching YouTube for: {search_query}")
+        app.logger.debug("Searching YouTube for: %s", search_query)
+        
+        # Identical searches within the TTL reuse the previous results
+        now = time.time()
+        with _youtube_search_cache_lock:
+            cached = _youtube_search_cache.get(search_query)
+            if cached is not None:
+                if cached[0] > now:
+                    _youtube_search_cache.move_to_end(search_query)
+                else:
+                    del _youtube_search_cache[search_query]
+                    cached = None
+        if cached is not None:
+            app.logger.debug("Using cached YouTube results for: %s", search_query)
+            return jsonify({
+                'success': True,
+                'results': cached[1],
+                'query': search_query
+            })
+        
+        def found(videos):
+            # Sort videos by recency, limit to 10 results and remember them
+            sorted_videos = sort_videos_by_recency(videos[:_YOUTUBE_SEARCH_MAX_RESULTS])
+            with _youtube_search_cache_lock:
+                _youtube_search_cache[search_query] = (now + _YOUTUBE_SEARCH_CACHE_TTL, sorted_videos)
+                _youtube_search_cache.move_to_end(search_query)
+                while len(_youtube_search_cache) > _YOUTUBE_SEARCH_CACHE_SIZE:
+                    _youtube_search_cache.popitem(last=False)
+            return jsonify({
+                'success': True,
+                'results': sorted_videos,
+                'query': search_query
+            })
         
         # Search directly on YouTube
         search_url = f"https://www.youtube.com/results?search_query={search_query}+gameplay"
@@ -6958,141 +7884,151 @@ def youtube_search():
         }
         
         try:
-            print(f"Making request to: {search_url}")
-            response = requests.get(search_url, headers=headers, timeout=15)
-            response.raise_for_status()
-            
-            print(f"Response status: {response.status_code}")
-            print(f"Response length: {len(response.text)} characters")
-            
-            # Parse the HTML response
-            soup = BeautifulSoup(response.text, 'html.parser')
-            print(f"BeautifulSoup created successfully")
-            
-            # Method 1: Try to extract from ytInitialData (most reliable)
-            print("Attempting to extract video data from ytInitialData...")
-            videos = extract_from_yt_initial_data(response.text)
-            
-            if videos:
-                print(f"Successfully extracted {len(videos)} videos from ytInitialData")
-                # Sort videos by recency and limit to 10 results
-                sorted_videos = sort_videos_by_recency(videos[:10])
-                return jsonify({
-                    'success': True,
-                    'results': sorted_videos,
-                    'query': search_query
-                })
+            app.logger.debug("Making request to: %s", search_url)
+            response = requests.get(search_url, headers=headers, timeout=15, stream=True)
+            try:
+                response.raise_for_status()
+                app.logger.debug("Response status: %s", response.status_code)
+                
+                # Stop downloading once ytInitialData is complete; the rest of the page is only
+                # read if the ytInitialData extraction fails
+                page, rest = read_youtube_results_page(response)
+                encoding = response.encoding or 'utf-8'
+                html_text = page.decode(encoding, errors='replace')
+                app.logger.debug("Response length: %d characters", len(html_text))
+                
+                # Method 1: Try to extract from ytInitialData (most reliable)
+                app.logger.debug("Attempting to extract video data from ytInitialData...")
+                videos = extract_from_yt_initial_data(html_text)
+                
+                if videos:
+                    app.logger.debug("Successfully extracted %d videos from ytInitialData", len(videos))
+                    return found(videos)
+                
+                for chunk in rest:
+                    page += chunk
+                html_text = page.decode(encoding, errors='replace')
+                app.logger.debug("Full response length: %d characters", len(html_text))
+            finally:
+                response.close()
             
             # Method 2: Try to extract from ytInitialData alternative format
-            print("Attempting to extract from alternative ytInitialData format...")
-            videos = extract_from_yt_initial_data_alt(response.text)
+            app.logger.debug("Attempting to extract from alternative ytInitialData format...")
+            videos = extract_from_yt_initial_data_alt(html_text)
             
             if videos:
-                print(f"Successfully extracted {len(videos)} videos from alternative format")
-                # Sort videos by recency and limit to 10 results
-                sorted_videos = sort_videos_by_recency(videos[:10])
-                return jsonify({
-                    'success': True,
-                    'results': sorted_videos,
-                    'query': search_query
-                })
+                app.logger.debug("Successfully extracted %d videos from alternative format", len(videos))
+                return found(videos)
             
             # Method 3: Try to extract from embedded JSON data
-            print("Attempting to extract from embedded JSON data...")
-            videos = extract_from_embedded_json(response.text)
+            app.logger.debug("Attempting to extract from embedded JSON data...")
+            videos = extract_from_embedded_json(html_text)
             
             if videos:
-                print(f"Successfully extracted {len(videos)} videos from embedded JSON")
-                # Sort videos by recency and limit to 10 results
-                sorted_videos = sort_videos_by_recency(videos[:10])
-                return jsonify({
-                    'success': True,
-                    'results': sorted_videos,
-                    'query': search_query
-                })
+                app.logger.debug("Successfully extracted %d videos from embedded JSON", len(videos))
+                return found(videos)
             
-            # Method 4: Fallback to HTML parsing with better selectors
-            print("Falling back to HTML parsing with enhanced selectors...")
-            videos = extract_from_html_enhanced(soup)
+            # Method 4: Fallback to HTML parsing with better selectors (the only method
+            # that needs a parsed tree, so the document is only built here)
+            app.logger.debug("Falling back to HTML parsing with enhanced selectors...")
+            document = lxml_html.fromstring(html_text)
+            videos = extract_from_html_enhanced(document)
             
             if videos:
-                print(f"Successfully extracted {len(videos)} videos from HTML parsing")
-                # Sort videos by recency and limit to 10 results
-                sorted_videos = sort_videos_by_recency(videos[:10])
-                return jsonify({
-                    'success': True,
-                    'results': sorted_videos,
-                    'query': search_query
-                })
+                app.logger.debug("Successfully extracted %d videos from HTML parsing", len(videos))
+                return found(videos)
             
             # If all methods fail, use mock data
-            print("All extraction methods failed, using mock data")
+            app.logger.warning("All YouTube extraction methods failed, using mock data")
             return generate_mock_videos(search_query)
                 
         except requests.RequestException as e:
-            print(f"Request error: {e}")
+            app.logger.warning("YouTube request error: %s", e)
             return generate_mock_videos(search_query)
         except Exception as e:
-            print(f"Unexpected error during scraping: {e}")
-            import traceback
-            traceback.print_exc()
+            app.logger.exception("Unexpected error during YouTube scraping: %s", e)
             return generate_mock_videos(search_query)
             
     except Exception as e:
-        print(f"YouTube search error: {e}")
+        app.logger.error("YouTube search error: %s", e)
         return jsonify({'error': str(e)}), 500
 
+_json_decoder = json.JSONDecoder()
+
+# Number of videos returned by a YouTube search
+_YOUTUBE_SEARCH_MAX_RESULTS = 10
+
+def iter_renderer_videos(items):
+    """Yield video data for the (compact) video renderers in a list of ytInitialData items"""
+    for item in items:
+        if 'videoRenderer' in item:
+            video_data = extract_video_from_renderer(item['videoRenderer'])
+        elif 'compactVideoRenderer' in item:
+            video_data = extract_video_from_compact_renderer(item['compactVideoRenderer'])
+        else:
+            continue
+        if video_data:
+            yield video_data
+
+def iter_search_result_videos(yt_data):
+    """Yield video data from the search result sections of ytInitialData"""
+    # Navigate through the ytInitialData structure
+    if 'contents' in yt_data:
+        contents = yt_data['contents']
+        if 'twoColumnSearchResultsRenderer' in contents:
+            search_results = contents['twoColumnSearchResultsRenderer']
+            if 'primaryContents' in search_results:
+                primary = search_results['primaryContents']
+                if 'sectionListRenderer' in primary:
+                    sections = primary['sectionListRenderer']['contents']
+                    for section in sections:
+                        if 'itemSectionRenderer' in section:
+                            yield from iter_renderer_videos(section['itemSectionRenderer']['contents'])
+
+def iter_continuation_videos(yt_data):
+    """Yield video data from the continuation items of ytInitialData"""
+    for command in yt_data['onResponseReceivedCommands']:
+        if 'appendContinuationItemsAction' in command:
+            yield from iter_renderer_videos(command['appendContinuationItemsAction']['continuationItems'])
+
+def extract_balanced_json(text, start_token):
+    """Decode the JSON object that directly follows start_token in text (None if there is none)
+
+    The object ends where its braces balance (strings and escapes included), as found by the
+    C JSON scanner in one linear pass, so neither a ';' inside a string nor a non-greedy
+    regex can cut it short.
+    """
+    start_idx = text.find(start_token)
+    if start_idx == -1:
+        return None
+    return decode_json_object_at(text, start_idx + len(start_token))
+
+def decode_json_object_at(text, start_idx):
+    """Decode the JSON object starting at text[start_idx] (None if there is none)"""
+    if not text.startswith('{', start_idx):
+        return None
+    try:
+        return _json_decoder.raw_decode(text, start_idx)[0]
+    except ValueError:
+        return None
+
+# Assignments of ytInitialData as written by the different YouTube page formats
+_YT_INITIAL_DATA_PATTERNS = [re.compile(rx) for rx in (
+    r'var ytInitialData\s*=\s*',
+    r'ytInitialData\s*=\s*',
+    r'window\["ytInitialData"\]\s*=\s*',
+)]
+
 def extract_from_yt_initial_data(html_text):
     """Extract video data from ytInitialData (most reliable method)"""
     try:
         # Look for ytInitialData in the HTML
-        start_marker = 'var ytInitialData = '
-        end_marker = ';</script>'
-        
-        start_idx = html_text.find(start_marker)
-        if start_idx == -1:
-            return []
-        
-        start_idx += len(start_marker)
-        end_idx = html_text.find(end_marker, start_idx)
-        if end_idx == -1:
-            end_idx = html_text.find(';', start_idx)
-        
-        if end_idx == -1:
+        yt_data = extract_balanced_json(html_text, 'var ytInitialData = ')
+        if yt_data is None:
             return []
         
-        json_str = html_text[start_idx:end_idx]
-        yt_data = json.loads(json_str)
-        
-        videos = []
-        
-        # Navigate through the ytInitialData structure
-        if 'contents' in yt_data:
-            contents = yt_data['contents']
-            if 'twoColumnSearchResultsRenderer' in contents:
-                search_results = contents['twoColumnSearchResultsRenderer']
-                if 'primaryContents' in search_results:
-                    primary = search_results['primaryContents']
-                    if 'sectionListRenderer' in primary:
-                        sections = primary['sectionListRenderer']['contents']
-                        for section in sections:
-                            if 'itemSectionRenderer' in section:
-                                items = section['itemSectionRenderer']['contents']
-                                for item in items:
-                                    if 'videoRenderer' in item:
-                                        video_data = extract_video_from_renderer(item['videoRenderer'])
-                                        if video_data:
-                                            videos.append(video_data)
-                                            if len(videos) >= 10:
-                                                break
-                                    elif 'compactVideoRenderer' in item:
-                                        video_data = extract_video_from_compact_renderer(item['compactVideoRenderer'])
-                                        if video_data:
-                                            videos.append(video_data)
-                                            if len(videos) >= 10:
-                                                break
-        
-        return videos
+        # Only the first results are used, so stop converting renderers once we have them
+        return list(islice(iter_search_result_videos(yt_data), _YOUTUBE_SEARCH_MAX_RESULTS))
         
     except Exception as e:
         print(f"Error extracting from ytInitialData: {e}")
@@ -7102,20 +8038,13 @@ def extract_from_yt_initial_data_alt(html_text):
     """Extract video data from alternative ytInitialData format"""
     try:
         # Look for ytInitialData in different script tags
-        import re
-        
-        # Pattern to find ytInitialData in various formats
-        patterns = [
-            r'var ytInitialData = ({.*?});',
-            r'ytInitialData = ({.*?});',
-            r'window\["ytInitialData"\] = ({.*?});'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, html_text, re.DOTALL)
-            if matches:
+        for pattern in _YT_INITIAL_DATA_PATTERNS:
+            match = pattern.search(html_text)
+            if match is None:
+                continue
+            yt_data = decode_json_object_at(html_text, match.end())
+            if yt_data is not None:
                 try:
-                    yt_data = json.loads(matches[0])
                     videos = extract_videos_from_yt_data(yt_data)
                     if videos:
                         return videos
@@ -7128,39 +8057,44 @@ def extract_from_yt_initial_data_alt(html_text):
         print(f"Error extracting from ytInitialData alt: {e}")
         return []
 
+# Fields of the embedded JSON fallback, matched in a single pass in document order
+_RE_FIELDS = re.compile(r'"(videoId|title|channelName|thumbnail)":"([^"]+?)"')
+
 def extract_from_embedded_json(html_text):
     """Extract video data from embedded JSON in script tags"""
     try:
-        import re
-        
-        # Look for various JSON patterns that might contain video data
-        patterns = [
-            r'"videoId":"([^"]{11})"',
-            r'"title":"([^"]+?)"',
-            r'"channelName":"([^"]+?)"',
-            r'"thumbnail":"([^"]+?)"'
-        ]
+        videos = []
         
-        video_ids = re.findall(r'"videoId":"([^"]{11})"', html_text)
-        titles = re.findall(r'"title":"([^"]+?)"', html_text)
-        channels = re.findall(r'"channelName":"([^"]+?)"', html_text)
-        thumbnails = re.findall(r'"thumbnail":"([^"]+?)"', html_text)
+        def add_video(fields):
+            video_id = fields['videoId']
+            title = fields.get('title') or f"Video {len(videos) + 1}"
+            channel = fields.get('channelName') or "Unknown Channel"
+            videos.append({
+                'id': video_id,
+                'title': title[:100] + '...' if len(title) > 100 else title,
+                'thumbnail': fields.get('thumbnail') or f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg",
+                'duration': 'Unknown',
+                'channel': channel[:50] + '...' if len(channel) > 50 else channel,
+                'url': f"https://www.youtube.com/watch?v={video_id}"
+            })
         
-        videos = []
-        for i, video_id in enumerate(video_ids[:10]):
-            if len(video_id) == 11:  # Valid YouTube ID
-                title = titles[i] if i < len(titles) else f"Video {i+1}"
-                channel = channels[i] if i < len(channels) else "Unknown Channel"
-                thumbnail = thumbnails[i] if i < len(thumbnails) else f"https://img.youtube.com/vi/{video_id}/hqdefault.jpg"
-                
-                videos.append({
-                    'id': video_id,
-                    'title': title[:100] + '...' if len(title) > 100 else title,
-                    'thumbnail': thumbnail,
-                    'duration': 'Unknown',
-                    'channel': channel[:50] + '...' if len(channel) > 50 else channel,
-                    'url': f"https://www.youtube.com/watch?v={video_id}"
-                })
+        # Every valid videoId starts a new video; the fields that follow it belong to that video
+        current = None
+        for m in _RE_FIELDS.finditer(html_text):
+            kind, value = m.group(1), m.group(2)
+            if kind == 'videoId':
+                if len(value) != 11:  # Not a valid YouTube ID
+                    continue
+                if current is not None:
+                    add_video(current)
+                    if len(videos) >= _YOUTUBE_SEARCH_MAX_RESULTS:
+                        current = None
+                        break
+                current = {'videoId': value}
+            elif current is not None:
+                current.setdefault(kind, value)
+        if current is not None:
+            add_video(current)
         
         return videos
         
@@ -7168,32 +8102,47 @@ def extract_from_embedded_json(html_text):
         print(f"Error extracting from embedded JSON: {e}")
         return []
 
-def extract_from_html_enhanced(soup):
-    """Extract video data from HTML using enhanced selectors"""
+def _xpath_has_class(class_name):
+    """XPath predicate equivalent to the CSS class selector .class_name"""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+
+# Video element selectors for the HTML fallback, tried in order (CSS equivalent in comments)
+_HTML_VIDEO_SELECTORS = [
+    ('ytd-video-renderer', ET.XPath('//ytd-video-renderer')),
+    ('div[data-context-item-id]', ET.XPath('//div[@data-context-item-id]')),
+    ('.yt-lockup-content', ET.XPath(f"//*[{_xpath_has_class('yt-lockup-content')}]")),
+    ('[data-video-id]', ET.XPath('//*[@data-video-id]')),
+    ('div[class*="video"]', ET.XPath("//div[contains(@class, 'video')]")),
+]
+_HTML_CHANNEL_SELECTORS = [
+    ET.XPath(".//a[contains(@class, 'channel')]"),  # a[class*="channel"]
+    ET.XPath(f".//*[{_xpath_has_class('yt-lockup-byline')}]//a"),  # .yt-lockup-byline a
+    ET.XPath(f".//*[{_xpath_has_class('yt-lockup-meta-info')}]//a"),  # .yt-lockup-meta-info a
+    ET.XPath(".//*[contains(@class, 'byline')]"),  # [class*="byline"]
+]
+
+def _html_element_text(element):
+    """Concatenated stripped text of an element (like BeautifulSoup's get_text(strip=True))"""
+    return ''.join(text.strip() for text in element.itertext())
+
+def extract_from_html_enhanced(document):
+    """Extract video data from a parsed HTML document (lxml.html) using enhanced selectors"""
     try:
         videos = []
         
         # Try multiple selector strategies
-        selectors = [
-            'ytd-video-renderer',
-            'div[data-context-item-id]',
-            '.yt-lockup-content',
-            '[data-video-id]',
-            'div[class*="video"]'
-        ]
-        
         video_elements = []
-        for selector in selectors:
-            video_elements = soup.select(selector)
+        for selector, xpath in _HTML_VIDEO_SELECTORS:
+            video_elements = xpath(document)
             if video_elements:
                 print(f"Found {len(video_elements)} videos using selector: {selector}")
                 break
         
         if not video_elements:
             # Fallback: look for any element with video-related attributes
-            video_elements = soup.find_all(attrs={'data-context-item-id': True})
+            video_elements = document.xpath('//*[@data-context-item-id]')
             if not video_elements:
-                video_elements = soup.find_all(attrs={'data-video-id': True})
+                video_elements = document.xpath('//*[@data-video-id]')
         
         count = 0
         for element in video_elements:
@@ -7202,18 +8151,13 @@ def extract_from_html_enhanced(soup):
                 
             try:
                 # Extract video ID
-                video_id = None
-                if element.get('data-context-item-id'):
-                    video_id = element['data-context-item-id']
-                elif element.get('data-video-id'):
-                    video_id = element['data-video-id']
+                video_id = element.get('data-context-item-id') or element.get('data-video-id')
                 
                 # Try to find video ID in links
                 if not video_id:
-                    links = element.find_all('a', href=True)
-                    for link in links:
-                        if 'watch?v=' in link['href']:
-                            video_id = link['href'].split('watch?v=')[1].split('&')[0]
+                    for href in element.xpath('.//a/@href'):
+                        if 'watch?v=' in href:
+                            video_id = href.split('watch?v=')[1].split('&')[0]
                             break
                 
                 if not video_id or len(video_id) != 11:
@@ -7221,18 +8165,22 @@ def extract_from_html_enhanced(soup):
                 
                 # Extract title
                 title = "Unknown Title"
-                title_elem = element.find('a', {'title': True})
-                if title_elem:
-                    title = title_elem['title']
+                link_titles = element.xpath('.//a/@title')
+                if link_titles:
+                    title = link_titles[0]
                 else:
-                    title_elem = element.find('h3') or element.find('h2') or element.find('h1')
-                    if title_elem:
-                        title = title_elem.get_text(strip=True)
+                    title_elem = element.find('.//h3')
+                    if title_elem is None:
+                        title_elem = element.find('.//h2')
+                    if title_elem is None:
+                        title_elem = element.find('.//h1')
+                    if title_elem is not None:
+                        title = _html_element_text(title_elem)
                 
                 # Extract thumbnail
                 thumbnail = None
-                img_elem = element.find('img')
-                if img_elem:
+                img_elem = element.find('.//img')
+                if img_elem is not None:
                     thumbnail = img_elem.get('src') or img_elem.get('data-src') or img_elem.get('data-thumb')
                 
                 if not thumbnail:
@@ -7240,17 +8188,10 @@ def extract_from_html_enhanced(soup):
                 
                 # Extract channel
                 channel = "Unknown Channel"
-                channel_selectors = [
-                    'a[class*="channel"]',
-                    '.yt-lockup-byline a',
-                    '.yt-lockup-meta-info a',
-                    '[class*="byline"]'
-                ]
-                
-                for selector in channel_selectors:
-                    channel_elem = element.select_one(selector)
-                    if channel_elem:
-                        channel = channel_elem.get_text(strip=True)
+                for xpath in _HTML_CHANNEL_SELECTORS:
+                    channel_elems = xpath(element)
+                    if channel_elems:
+                        channel = _html_element_text(channel_elems[0])
                         break
                 
                 videos.append({
@@ -7276,57 +8217,16 @@ def extract_from_html_enhanced(soup):
 
 def extract_videos_from_yt_data(yt_data):
     """Extract video information from YouTube's embedded JavaScript data"""
-    videos = []
-    
     try:
         # Navigate through the ytInitialData structure to find video results
         # This structure can change, so we'll try multiple paths
         
         # Path 1: Try to find contents in search results
-        if 'contents' in yt_data:
-            contents = yt_data['contents']
-            if 'twoColumnSearchResultsRenderer' in contents:
-                search_results = contents['twoColumnSearchResultsRenderer']
-                if 'primaryContents' in search_results:
-                    primary = search_results['primaryContents']
-                    if 'sectionListRenderer' in primary:
-                        sections = primary['sectionListRenderer']['contents']
-                        for section in sections:
-                            if 'itemSectionRenderer' in section:
-                                items = section['itemSectionRenderer']['contents']
-                                for item in items:
-                                    if 'videoRenderer' in item:
-                                        video_data = extract_video_from_renderer(item['videoRenderer'])
-                                        if video_data:
-                                            videos.append(video_data)
-                                            if len(videos) >= 10:
-                                                break
-                                    elif 'compactVideoRenderer' in item:
-                                        video_data = extract_video_from_compact_renderer(item['compactVideoRenderer'])
-                                        if video_data:
-                                            videos.append(video_data)
-                                            if len(videos) >= 10:
-                                                break
+        videos = list(islice(iter_search_result_videos(yt_data), _YOUTUBE_SEARCH_MAX_RESULTS))
         
         # Path 2: Try alternative structure
         if not videos and 'onResponseReceivedCommands' in yt_data:
-            commands = yt_data['onResponseReceivedCommands']
-            for command in commands:
-                if 'appendContinuationItemsAction' in command:
-                    items = command['appendContinuationItemsAction']['continuationItems']
-                    for item in items:
-                        if 'videoRenderer' in item:
-                            video_data = extract_video_from_renderer(item['videoRenderer'])
-                            if video_data:
-                                videos.append(video_data)
-                                if len(videos) >= 10:
-                                    break
-                        elif 'compactVideoRenderer' in item:
-                            video_data = extract_video_from_compact_renderer(item['compactVideoRenderer'])
-                            if video_data:
-                                videos.append(video_data)
-                                if len(videos) >= 10:
-                                    break
+            videos = list(islice(iter_continuation_videos(yt_data), _YOUTUBE_SEARCH_MAX_RESULTS))
         
         print(f"Extracted {len(videos)} videos from ytInitialData")
         return videos
@@ -9807,30 +10707,19 @@ def get_launchbox_media(launchbox_id, media_type):
         available_media = []
         
         
-        # The metadata structure has 'images' array containing XML elements
+        # The metadata structure has 'images' array of (type, filename, region) tuples
         if game_metadata and 'images' in game_metadata:
-            for image_element in game_metadata['images']:
-                # Parse the XML element to get image details
-                type_elem = image_element.find('Type')
-                if type_elem is not None and type_elem.text:
-                    image_type = type_elem.text.strip()
-                    
-                    # Check if this image type matches what we're looking for
-                    if _matches_media_type(image_type, media_type, media_directory):
-                        filename_elem = image_element.find('FileName')
-                        region_elem = image_element.find('Region')
-                        
-                        if filename_elem is not None and filename_elem.text:
-                            base_url = image_config.get('launchbox_image_base_url', 'https://images.launchbox-app.com/')
-                            media_url = base_url + filename_elem.text
-                            
-                            available_media.append({
-                                'url': media_url,
-                                'filename': filename_elem.text,
-                                'region': region_elem.text if region_elem is not None and region_elem.text else 'Unknown',
-                                'primary': False,  # We don't have primary info in this structure
-                                'type': image_type
-                            })
+            base_url = image_config.get('launchbox_image_base_url', 'https://images.launchbox-app.com/')
+            for image_type, filename, region in game_metadata['images']:
+                # Check if this image type matches what we're looking for
+                if image_type and filename and _matches_media_type(image_type, media_type, media_directory):
+                    available_media.append({
+                        'url': base_url + filename,
+                        'filename': filename,
+                        'region': region or 'Unknown',
+                        'primary': False,  # We don't have primary info in this structure
+                        'type': image_type
+                    })
         
         # Sort by primary first, then by region
         available_media.sort(key=lambda x: (not x.get('primary', False), x.get('region', '')))
@@ -10222,7 +11111,7 @@ async def search_igdb_game_by_name_async(game_name, platform_id, access_token, c
         import re
         
         # Clean game name - remove parentheses and extra text
-        clean_name = re.sub(r'\s*\([^)]*\)', '', game_name).strip()
+        clean_name = _SIMPLE_PARENS_RE.sub('', game_name).strip()
         clean_name = re.sub(r'\s*\[[^\]]*\]', '', clean_name).strip()
         
         # Search for games with more detailed fields
@@ -13307,7 +14196,6 @@ def run_steamgriddb_task(system_name, task_id, selected_games=None, overwrite_me
     """Run SteamGridDB task for a specific system (SteamGridDB API only)"""
     import asyncio
     import threading
-    import re
     from steamgrid_service import SteamGridService
     
     # Add task to cancel map
@@ -13475,7 +14363,7 @@ def run_steamgriddb_task(system_name, task_id, selected_games=None, overwrite_me
                     steam_id = game.get('steamid', '')
                     
                     # Clean game name by removing text in parentheses for better search results
-                    clean_game_name = re.sub(r'\s*\([^)]*\)', '', game_name).strip()
+                    clean_game_name = _SIMPLE_PARENS_RE.sub('', game_name).strip()
                     
                     # Create async task for SteamGridDB ID lookup
                     async def lookup_steamgrid_id(game, game_name, clean_game_name, steam_id, existing_steamgridid):
@@ -13824,7 +14712,7 @@ def search_igdb_games_api():
                 
                 # Clean game name - remove parentheses and extra text
                 import re
-                clean_name = re.sub(r'\s*\([^)]*\)', '', game_name).strip()
+                clean_name = _SIMPLE_PARENS_RE.sub('', game_name).strip()
                 clean_name = re.sub(r'\s*\[[^\]]*\]', '', clean_name).strip()
                 
                 # Search for games with platform filter
@@ -8,8 +8,13 @@ import subprocess
 import json
 import re
 import unicodedata
+from functools import lru_cache
 
-def normalize_game_name(name):
+# Everything except ASCII letters, digits and parentheses
+_NON_NAME_CHARS_RE = re.compile(r'[^a-zA-Z0-9()]')
+
+@lru_cache(maxsize=65536)
+def normalize_game_name(name: str) -> str:
     """Normalize game name for consistent matching across the application"""
     if not name:
         return ""
@@ -22,7 +27,7 @@ def normalize_game_name(name):
     normalized = normalized.replace(' III','3').replace(' II', ' 2').replace(" IV", '4').lower()
 
     # Then keep only ASCII letters, numbers, and parentheses (removes accented chars and special chars)
-    normalized = re.sub(r'[^a-zA-Z0-9()]', '', normalized)
+    normalized = _NON_NAME_CHARS_RE.sub('', normalized)
 
 #    # Remove specific characters: dash, colon, underscore, apostrophe
 #    for char in ['-', ':', '_', '/', '\\', '|', '!', '*', "'", '"', ',', '.',' ']:
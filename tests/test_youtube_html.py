@@ -0,0 +1,46 @@
+"""Tests for the YouTube search HTML fallback (extract_from_html_enhanced)"""
+import os
+import sys
+
+from lxml import html as lxml_html
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+os.chdir(REPO_DIR)  # app.py resolves its config and var/ paths from the working directory
+
+import app  # noqa: E402
+
+
+def test_html_fallback_reads_data_context_item_id():
+    document = lxml_html.fromstring(
+        '<html><body>'
+        '<div data-context-item-id="abcdefghijk">'
+        '<a href="/watch?v=abcdefghijk" title="First video">First video</a>'
+        '<img src="https://example.com/thumb.jpg">'
+        '<div class="yt-lockup-byline"><a href="/channel/x">Some Channel</a></div>'
+        '</div>'
+        '</body></html>'
+    )
+    videos = app.extract_from_html_enhanced(document)
+    assert videos == [{
+        'id': 'abcdefghijk',
+        'title': 'First video',
+        'thumbnail': 'https://example.com/thumb.jpg',
+        'duration': 'Unknown',
+        'channel': 'Some Channel',
+        'url': 'https://www.youtube.com/watch?v=abcdefghijk',
+    }]
+
+
+def test_html_fallback_reads_data_video_id():
+    document = lxml_html.fromstring(
+        '<html><body>'
+        '<span data-video-id="ABCDEFGHIJK"><h3> Second <b>video</b> </h3></span>'
+        '<span data-video-id="tooshort"></span>'
+        '</body></html>'
+    )
+    videos = app.extract_from_html_enhanced(document)
+    assert [(v['id'], v['title'], v['channel']) for v in videos] == [
+        ('ABCDEFGHIJK', 'Secondvideo', 'Unknown Channel'),
+    ]
+    assert videos[0]['thumbnail'] == 'https://img.youtube.com/vi/ABCDEFGHIJK/hqdefault.jpg'